@@ -88,12 +88,12 @@ class BilibiliMonitor:
         Returns:
             List of new (unprocessed) videos
         """
-        new_videos = []
-        for video in videos:
-            if video.bvid and self.state_manager.is_video_new(mid, video.bvid):
-                new_videos.append(video)
-        
-        return new_videos
+        # Resolve the UP master's state once rather than per video
+        up_state = self.state_manager.get_up_state(mid)
+        return [
+            video for video in videos
+            if video.bvid and not up_state.is_video_processed(video.bvid)
+        ]
 
     async def check_up_master(
         self,
@@ -154,7 +154,8 @@ class BilibiliMonitor:
         up_configs: list[UPMasterConfig],
         max_videos: int = 5,
         fetch_descriptions: bool = False,
-        delay_between_checks: float = 1.0
+        delay_between_checks: float = 1.0,
+        new_videos_only: bool = False
     ) -> list[MonitorReport]:
         """Check multiple UP masters for new videos.
         
@@ -163,6 +164,7 @@ class BilibiliMonitor:
             max_videos: Maximum number of videos to check per UP master
             fetch_descriptions: Whether to fetch detailed descriptions
             delay_between_checks: Delay in seconds between checking each UP master
+            new_videos_only: Only return reports that have new videos
             
         Returns:
             List of MonitorReports
@@ -176,7 +178,8 @@ class BilibiliMonitor:
                     max_videos=max_videos,
                     fetch_descriptions=fetch_descriptions
                 )
-                reports.append(report)
+                if not new_videos_only or report.has_new_videos():
+                    reports.append(report)
 
                 # Delay between checks to avoid rate limiting
                 if delay_between_checks > 0:
@@ -185,6 +188,8 @@ class BilibiliMonitor:
             except Exception:
                 # Continue checking other UP masters even if one fails
                 # Create an empty report for failed checks
+                if new_videos_only:
+                    continue
                 reports.append(MonitorReport(
                     up_master_name=up_config.name,
                     up_master_mid=up_config.mid,
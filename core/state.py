@@ -84,6 +84,7 @@ class StateManager:
             for bvid in processed_videos:
                 up_state.mark_video_processed(bvid)
         
+        state.mark_dirty()
         self.save_state()
 
     def is_video_new(self, mid: str, bvid: str) -> bool:
@@ -137,5 +138,6 @@ class StateManager:
             # In a real implementation, you might want to track timestamps
             processed_list = list(up_state.processed_videos)
             up_state.processed_videos = set(processed_list[-keep_count:])
+            state.mark_dirty()
             self.save_state()
 
@@ -17,7 +17,7 @@ except ImportError:
     FEEDPARSER_AVAILABLE = False
 
 from models.zhihu import ZhihuFeedItem, ZhihuFeedConfig, ZhihuMonitorReport, ZhihuMonitorState
-from utils.link_extractor import extract_bilibili_links, deduplicate_links
+from utils.link_extractor import extract_bilibili_links
 
 
 class ZhihuRSSClient:
@@ -112,8 +112,7 @@ class ZhihuRSSClient:
         # Extract Bilibili links if requested
         bilibili_links = []
         if extract_bilibili and full_content:
-            bilibili_links = extract_bilibili_links(full_content)
-            bilibili_links = deduplicate_links(bilibili_links)
+            bilibili_links = extract_bilibili_links(full_content, dedup_ids=True)
         
         return ZhihuFeedItem(
             title=title,
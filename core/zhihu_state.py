@@ -5,11 +5,11 @@ Handles persistence and retrieval of Zhihu monitoring state.
 """
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from datetime import datetime
 
 from models.zhihu import ZhihuMonitorState, ZhihuFeedState
+from utils.json_utils import json_dumps, json_loads
 
 
 class ZhihuStateManager:
@@ -42,10 +42,9 @@ class ZhihuStateManager:
             return ZhihuMonitorState()
         
         try:
-            with open(self.state_file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return ZhihuMonitorState.from_dict(data)
-        except (json.JSONDecodeError, KeyError, ValueError) as e:
+            data = json_loads(self.state_file_path.read_bytes())
+            return ZhihuMonitorState.from_dict(data)
+        except (KeyError, ValueError) as e:
             # If state file is corrupted, start fresh
             print(f"Warning: Failed to load Zhihu state file: {e}. Starting with empty state.")
             return ZhihuMonitorState()
@@ -63,8 +62,7 @@ class ZhihuStateManager:
         # Write to temporary file first, then rename for atomicity
         temp_path = self.state_file_path.with_suffix('.tmp')
         try:
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                json.dump(state.to_dict(), f, ensure_ascii=False, indent=2)
+            temp_path.write_bytes(json_dumps(state.to_dict()))
             
             # Atomic rename
             temp_path.replace(self.state_file_path)
@@ -183,6 +181,6 @@ class ZhihuStateManager:
         
         if len(feed_state.processed_items) > keep_count:
             # Keep only the most recent ones
-            feed_state.processed_items = feed_state.processed_items[-keep_count:]
+            feed_state.trim_processed_items(keep_count)
             self.save_state()
 
@@ -33,10 +33,10 @@ from core.scheduler import SchedulerManager, TaskConfig
 # Models
 from models.bilibili import UPMasterConfig
 from models.zhihu import ZhihuFeedConfig
-from models.report import DailyReportConfig
+from models.report import DailyReportConfig, ContentItem, ContentSource, ContentCategory
 
 # Services
-from services.ai_summarizer import AISummarizer
+from services.ai_summarizer import AISummarizer, SummaryCache
 from services.formatter import MarkdownFormatter
 from services.zhihu_formatter import ZhihuFormatter
 from services.report_aggregator import ReportAggregator
@@ -48,9 +48,66 @@ from services.archive_service import ArchiveManager
 # Utilities
 from utils.command_utils import (
     parse_command_flags,
+    split_keywords_and_flags,
     extract_and_summarize_urls,
 )
-from utils.chart_generator import ChartConfig, is_available as chart_available
+from utils.chart_generator import ChartConfig, ChartGenerator, is_available as chart_available
+from utils.http_session import close_session
+
+# Number of search/filter results sent per message
+RESULTS_PER_MESSAGE = 5
+
+ONE_DAY = timedelta(days=1)
+
+# One entry of the /archive list output
+ARCHIVE_ROW_TEMPLATE = (
+    "{idx}. **{archive_id}**\n"
+    "   📅 报告日期: {report_date}\n"
+    "   🕐 归档时间: {archived_at}\n"
+    "   📊 内容数: {total_items} (B站: {bilibili_items}, 知乎: {zhihu_items})\n"
+    "   💾 文件大小: {file_size:,} 字节 ({file_size_kb:.2f} KB)\n"
+)
+
+ARCHIVE_SAVED_TEMPLATE = (
+    "✅ 报告归档成功！\n"
+    "\n"
+    "📦 归档ID: {archive_id}\n"
+    "📅 报告日期: {report_date}\n"
+    "📊 内容数: {total_items}\n"
+    "💾 文件大小: {file_size:,} 字节 ({file_size_kb:.2f} KB)\n"
+    "📁 文件路径: {file_path}"
+)
+
+ARCHIVE_LIST_HEADER = "📦 归档报告列表 (共 {count} 个)\n\n"
+
+# /archive view output; optional blocks are pre-rendered or empty
+ARCHIVE_VIEW_TEMPLATE = (
+    "📦 归档报告: {archive_id}\n"
+    "\n"
+    "📋 {title}\n"
+    "📅 报告日期: {report_date:%Y年%m月%d日}\n"
+    "\n"
+    "## 📊 统计信息\n"
+    "- 总内容数: {total_items}\n"
+    "- B站视频: {bilibili_items}\n"
+    "- 知乎内容: {zhihu_items}\n"
+    "- 分类数: {section_count}\n"
+    "\n"
+    "{summary_block}"
+    "{topics_block}"
+    "## 📂 内容分类\n"
+    "{sections_block}"
+)
+
+ARCHIVE_STATS_TEMPLATE = (
+    "📊 归档统计信息\n"
+    "\n"
+    "📦 总归档数: {total_archives}\n"
+    "💾 总大小: {total_size_mb} MB ({total_size_bytes:,} 字节)\n"
+    "📝 总内容数: {total_items}\n"
+    "\n"
+    "{date_block}"
+)
 
 
 @register("astrbot-sast", "AstroAir", "内容监控与分析工具集 (Bilibili/Zhihu/AI报告)", "2.0.0")
@@ -100,9 +157,28 @@ class SASTPlugin(Star):
         self.report_aggregator: ReportAggregator | None = None
         self.daily_report_generator: DailyReportGenerator | None = None
         self.search_engine: ContentSearchEngine = ContentSearchEngine()
+        # Set when content history changes; the index is rebuilt on next search
+        self._search_index_stale = True
         self.report_exporter: ReportExporter = ReportExporter()
         self.archive_manager: ArchiveManager = ArchiveManager()
 
+        # Daily report config, built once from plugin config
+        self._daily_report_config = self._build_daily_report_config()
+
+        # Chart support (matplotlib is optional), generator created on first use
+        self._chart_available = chart_available()
+        self._chart_generator: ChartGenerator | None = None
+
+        # /archive action handlers
+        self._archive_actions = {
+            "list": self._handle_archive_list,
+            "save": self._handle_archive_save,
+            "view": self._handle_archive_view,
+            "delete": self._handle_archive_delete,
+            "cleanup": self._handle_archive_cleanup,
+            "stats": self._handle_archive_stats,
+        }
+
         # Scheduler
         self.scheduler: SchedulerManager | None = None
 
@@ -126,10 +202,19 @@ class SASTPlugin(Star):
         if self.config.get("ai_summary_enabled", True):
             api_key = self.config.get("openrouter_api_key") or os.environ.get("OPENROUTER_API_KEY")
             if api_key:
+                cache_days = self.config.get("ai_summary_cache_days", 7)
+                summary_cache = None
+                if cache_days > 0:
+                    summary_cache = SummaryCache(
+                        Path("data") / "ai_summary_cache.json",
+                        ttl=int(cache_days * 24 * 3600)
+                    )
                 self.ai_summarizer = AISummarizer(
                     api_key=api_key,
                     model=self.config.get("openrouter_model", "minimax/minimax-m2:free"),
-                    prompt_template=self.config.get("ai_prompt_template")
+                    prompt_template=self.config.get("ai_prompt_template"),
+                    max_concurrency=self.config.get("ai_max_concurrency", 8),
+                    cache=summary_cache
                 )
                 logger.info("AI 总结功能已启用")
 
@@ -147,7 +232,7 @@ class SASTPlugin(Star):
 
         # Initialize chart configuration
         chart_config = None
-        if self.config.get("chart_enabled", True) and chart_available():
+        if self.config.get("chart_enabled", True) and self._chart_available:
             chart_config = ChartConfig(
                 enabled=True,
                 output_format=self.config.get("chart_output_format", "png"),
@@ -156,19 +241,49 @@ class SASTPlugin(Star):
                 style=self.config.get("chart_style", "seaborn-v0_8-darkgrid"),
                 color_scheme=self.config.get("chart_color_scheme", "default"),
                 save_to_file=self.config.get("chart_save_to_file", False),
-                output_dir=self.config.get("chart_output_dir", "data/charts")
+                output_dir=self.config.get("chart_output_dir", "data/charts"),
+                use_processes=self.config.get("chart_use_processes", True),
+                png_compress_level=self.config.get("chart_png_compress_level", 1)
             )
             logger.info("图表生成功能已启用")
-        elif self.config.get("chart_enabled", True) and not chart_available():
+        elif self.config.get("chart_enabled", True) and not self._chart_available:
             logger.warning("图表生成已启用但 matplotlib 未安装")
 
         if self.ai_summarizer:
             self.daily_report_generator = DailyReportGenerator(
                 openrouter_api_key=self.ai_summarizer.api_key,
                 enable_ai=True,
-                chart_config=chart_config
+                chart_config=chart_config,
+                max_concurrency=self.config.get("ai_max_concurrency", 8)
             )
 
+    def _build_daily_report_config(self) -> DailyReportConfig:
+        """Build the daily report config from plugin config."""
+        return DailyReportConfig(
+            enabled=True,
+            generation_time=self.config.get("daily_report_time", "09:00"),
+            include_bilibili=self.config.get("daily_report_include_bilibili", True),
+            include_zhihu=self.config.get("daily_report_include_zhihu", True),
+            categorize_content=self.config.get("daily_report_categorize", True),
+            generate_ai_summary=self.config.get("daily_report_ai_summary", True),
+            highlight_important=True,
+            max_items_per_category=self.config.get("daily_report_max_items", 10),
+            min_importance_score=self.config.get("daily_report_min_importance", 0.3),
+            output_format="markdown",
+            include_statistics=True,
+            include_trending=True
+        )
+
+    def _get_chart_generator(self) -> ChartGenerator:
+        """Get the shared chart generator, creating it on first use.
+
+        Raises:
+            ImportError: If matplotlib is not installed
+        """
+        if self._chart_generator is None:
+            self._chart_generator = ChartGenerator()
+        return self._chart_generator
+
     async def _start_scheduler(self):
         """Start the advanced scheduler for all monitoring tasks."""
         await asyncio.sleep(5)  # Wait for plugin to fully initialize
@@ -293,16 +408,14 @@ class SASTPlugin(Star):
 
         # Check for new videos
         max_videos = self.config.get("max_videos_per_check", 5)
-        reports = await self.bili_monitor.check_multiple_up_masters(
+        reports_with_videos = await self.bili_monitor.check_multiple_up_masters(
             up_masters,
             max_videos=max_videos,
             fetch_descriptions=False,  # Don't fetch detailed descriptions to save API calls
-            delay_between_checks=1.0
+            delay_between_checks=1.0,
+            new_videos_only=True
         )
 
-        # Filter reports with new videos
-        reports_with_videos = self.bili_monitor.get_reports_with_new_videos(reports)
-
         if not reports_with_videos:
             logger.info("没有发现新视频")
             return
@@ -380,7 +493,7 @@ class SASTPlugin(Star):
 
         try:
             # Collect content from last N days
-            since = datetime.now() - timedelta(days=days)
+            since = datetime.now() - ONE_DAY * days
 
             # Get Bilibili reports (from state)
             # Note: Current implementation doesn't store historical reports in state
@@ -390,21 +503,7 @@ class SASTPlugin(Star):
             # Note: Current implementation doesn't store historical reports in state
             zhihu_reports: list[Any] = []  # Would need to store recent reports in state
 
-            # Create report config
-            report_config = DailyReportConfig(
-                enabled=True,
-                generation_time=self.config.get("daily_report_time", "09:00"),
-                include_bilibili=True,
-                include_zhihu=True,
-                categorize_content=self.config.get("daily_report_categorize", True),
-                generate_ai_summary=self.config.get("daily_report_ai_summary", True),
-                highlight_important=True,
-                max_items_per_category=self.config.get("daily_report_max_items", 10),
-                min_importance_score=self.config.get("daily_report_min_importance", 0.3),
-                output_format="markdown",
-                include_statistics=True,
-                include_trending=True
-            )
+            report_config = self._daily_report_config
 
             # Aggregate content
             report = self.report_aggregator.aggregate_all(
@@ -505,11 +604,30 @@ class SASTPlugin(Star):
             except Exception as e:
                 logger.error(f"发送 Zhihu 报告到 {target} 失败: {e}")
 
+    def _refresh_search_index(self):
+        """Rebuild the search index from content history if it has changed."""
+        if not self._search_index_stale:
+            return
+
+        self.search_engine.clear_index()
+
+        # Load from Bilibili state
+        bili_state = self.bili_state_manager.load_state()
+        if bili_state.content_history:
+            bili_items = [ContentItem.from_dict(item) for item in bili_state.content_history]
+            self.search_engine.index_content(bili_items)
+
+        # Load from Zhihu state
+        zhihu_state = self.zhihu_state_manager.load_state()
+        if zhihu_state.content_history:
+            zhihu_items = [ContentItem.from_dict(item) for item in zhihu_state.content_history]
+            self.search_engine.index_content(zhihu_items)
+
+        self._search_index_stale = False
+
     async def _save_bilibili_to_history(self, reports: list):
         """Save Bilibili reports to content history for search."""
         try:
-            from models.report import ContentItem, ContentSource, ContentCategory
-
             state = self.bili_state_manager.load_state()
 
             for report in reports:
@@ -541,6 +659,7 @@ class SASTPlugin(Star):
 
             # Save state
             self.bili_state_manager.save_state()
+            self._search_index_stale = True
 
             logger.debug(f"已保存 {sum(len(r.new_videos) for r in reports)} 条 Bilibili 内容到历史记录")
 
@@ -550,8 +669,6 @@ class SASTPlugin(Star):
     async def _save_zhihu_to_history(self, reports: list):
         """Save Zhihu reports to content history for search."""
         try:
-            from models.report import ContentItem, ContentSource, ContentCategory
-
             state = self.zhihu_state_manager.load_state()
 
             for report in reports:
@@ -582,6 +699,7 @@ class SASTPlugin(Star):
 
             # Save state
             self.zhihu_state_manager.save_state()
+            self._search_index_stale = True
 
             logger.debug(f"已保存 {sum(len(r.new_items) for r in reports)} 条 Zhihu 内容到历史记录")
 
@@ -774,16 +892,14 @@ class SASTPlugin(Star):
 
             # Check for new videos
             max_videos = self.config.get("max_videos_per_check", 5)
-            reports = await self.bili_monitor.check_multiple_up_masters(
+            reports_with_videos = await self.bili_monitor.check_multiple_up_masters(
                 up_masters,
                 max_videos=max_videos,
                 fetch_descriptions=False,
-                delay_between_checks=1.0
+                delay_between_checks=1.0,
+                new_videos_only=True
             )
 
-            # Filter reports with new videos
-            reports_with_videos = self.bili_monitor.get_reports_with_new_videos(reports)
-
             if not reports_with_videos:
                 yield event.plain_result("没有发现新视频。")
                 return
@@ -895,7 +1011,7 @@ class SASTPlugin(Star):
                     days = 1
 
             # Collect content from last N days
-            since = datetime.now() - timedelta(days=days)
+            since = datetime.now() - ONE_DAY * days
 
             # Load Bilibili state and get recent reports
             # Note: Current implementation doesn't store historical reports in state
@@ -907,21 +1023,7 @@ class SASTPlugin(Star):
             # For now, we'll create an empty list - this is a known limitation
             zhihu_reports: list[Any] = []
 
-            # Create report config from plugin config
-            report_config = DailyReportConfig(
-                enabled=True,
-                generation_time=self.config.get("daily_report_time", "09:00"),
-                include_bilibili=self.config.get("daily_report_include_bilibili", True),
-                include_zhihu=self.config.get("daily_report_include_zhihu", True),
-                categorize_content=self.config.get("daily_report_categorize", True),
-                generate_ai_summary=self.config.get("daily_report_ai_summary", True),
-                highlight_important=True,
-                max_items_per_category=self.config.get("daily_report_max_items", 10),
-                min_importance_score=self.config.get("daily_report_min_importance", 0.3),
-                output_format="markdown",
-                include_statistics=True,
-                include_trending=True
-            )
+            report_config = self._daily_report_config
 
             # Aggregate content
             report = self.report_aggregator.aggregate_all(
@@ -1007,6 +1109,15 @@ class SASTPlugin(Star):
             except Exception as e:
                 logger.error(f"停止调度器失败: {e}")
 
+        # Shut down chart worker processes
+        if self.daily_report_generator:
+            await self.daily_report_generator.close()
+        if self._chart_generator is not None:
+            self._chart_generator.close()
+
+        # Close pooled connections to the OpenRouter and Tavily APIs
+        await close_session()
+
         # Stop legacy monitor task if running
         if self.monitor_task and not self.monitor_task.done():
             self.monitor_task.cancel()
@@ -1031,6 +1142,8 @@ class SASTPlugin(Star):
             /search --source bilibili --days 7
             /search AI --limit 10
         """
+        now = datetime.now()
+
         # Parse command
         message_str = event.message_str
         parts = message_str.split(maxsplit=1)
@@ -1053,28 +1166,22 @@ class SASTPlugin(Star):
             )
             return
 
-        # Parse arguments
-        args_str = parts[1]
-        flags = parse_command_flags(args_str)
-
-        # Extract keywords (everything that's not a flag)
-        keywords = []
-        words = args_str.split()
-        i = 0
-        while i < len(words):
-            if words[i].startswith("--"):
-                # Skip flag and its value
-                i += 2
-            else:
-                keywords.append(words[i])
-                i += 1
+        # Parse arguments into keywords and flags in one pass
+        keywords, flags = split_keywords_and_flags(parts[1])
 
-        # Build search query
-        from models.report import ContentCategory, ContentSource
+        # Parse result limit
+        try:
+            limit = int(flags.get("limit", 20))
+            if limit <= 0:
+                raise ValueError
+        except ValueError:
+            yield event.plain_result(f"❌ 无效的数量: {flags['limit']}")
+            return
 
+        # Build search query
         query = SearchQuery(
             keywords=keywords,
-            limit=int(flags.get("limit", 20)),
+            limit=limit,
             sort_by=flags.get("sort", "relevance")
         )
 
@@ -1106,27 +1213,15 @@ class SASTPlugin(Star):
         if "days" in flags:
             try:
                 days = int(flags["days"])
-                query.end_date = datetime.now()
-                query.start_date = query.end_date - timedelta(days=days)
+                # Whole minutes, so repeated queries share a search cache key
+                query.start_date = now.replace(second=0, microsecond=0) - ONE_DAY * days
             except ValueError:
                 yield event.plain_result(f"❌ 无效的天数: {flags['days']}")
                 return
 
         # Load content history into search engine
         try:
-            # Load from Bilibili state
-            bili_state = self.bili_state_manager.load_state()
-            if bili_state.content_history:
-                from models.report import ContentItem
-                bili_items = [ContentItem.from_dict(item) for item in bili_state.content_history]
-                self.search_engine.index_content(bili_items)
-
-            # Load from Zhihu state
-            zhihu_state = self.zhihu_state_manager.load_state()
-            if zhihu_state.content_history:
-                from models.report import ContentItem
-                zhihu_items = [ContentItem.from_dict(item) for item in zhihu_state.content_history]
-                self.search_engine.index_content(zhihu_items)
+            self._refresh_search_index()
 
             # Perform search
             results = self.search_engine.search(query)
@@ -1154,14 +1249,17 @@ class SASTPlugin(Star):
                 lines.append(f"**类别筛选**: {', '.join(c.value for c in query.categories)}")
             if query.sources:
                 lines.append(f"**来源筛选**: {', '.join(s.value for s in query.sources)}")
-            if query.start_date and query.end_date:
-                lines.append(f"**时间范围**: {query.start_date.strftime('%Y-%m-%d')} 至 {query.end_date.strftime('%Y-%m-%d')}")
+            if query.start_date:
+                lines.append(f"**时间范围**: {query.start_date.strftime('%Y-%m-%d')} 至 {(query.end_date or now).strftime('%Y-%m-%d')}")
 
             lines.append("")
             lines.append("---")
-            lines.append("")
 
-            # Add results
+            # Send header first so the transport can start delivering
+            yield event.plain_result("\n".join(lines))
+
+            # Add results, RESULTS_PER_MESSAGE per message
+            lines = []
             for idx, result in enumerate(results, 1):
                 item = result.item
                 lines.append(f"## {idx}. {item.title}")
@@ -1192,12 +1290,21 @@ class SASTPlugin(Star):
 
                 lines.append("")
 
+                if idx % RESULTS_PER_MESSAGE == 0:
+                    yield event.plain_result("\n".join(lines))
+                    lines = []
+
+            if lines:
+                yield event.plain_result("\n".join(lines))
+
             # Add statistics
             stats = self.search_engine.get_statistics()
-            lines.append("---")
-            lines.append("")
-            lines.append("## 📊 索引统计")
-            lines.append(f"- 总内容数: {stats['total_items']}")
+            lines = [
+                "---",
+                "",
+                "## 📊 索引统计",
+                f"- 总内容数: {stats['total_items']}",
+            ]
             if stats['by_source']:
                 lines.append(f"- 按来源: {', '.join(f'{k}({v})' for k, v in stats['by_source'].items())}")
             if stats['by_category']:
@@ -1222,6 +1329,8 @@ class SASTPlugin(Star):
             /filter --source bilibili --min-importance 0.7
             /filter --days 7 --limit 15
         """
+        now = datetime.now()
+
         # Parse command
         message_str = event.message_str
         parts = message_str.split(maxsplit=1)
@@ -1229,14 +1338,21 @@ class SASTPlugin(Star):
         # Parse flags
         flags = {}
         if len(parts) > 1:
-            flags = parse_command_flags(parts[1])
+            _, flags = split_keywords_and_flags(parts[1])
 
-        # Build search query
-        from models.report import ContentCategory, ContentSource
+        # Parse result limit
+        try:
+            limit = int(flags.get("limit", 20))
+            if limit <= 0:
+                raise ValueError
+        except ValueError:
+            yield event.plain_result(f"❌ 无效的数量: {flags['limit']}")
+            return
 
+        # Build search query
         query = SearchQuery(
             keywords=[],  # No keyword search, just filtering
-            limit=int(flags.get("limit", 20)),
+            limit=limit,
             sort_by=flags.get("sort", "date"),
             sort_order="desc"
         )
@@ -1286,30 +1402,15 @@ class SASTPlugin(Star):
         if "days" in flags:
             try:
                 days = int(flags["days"])
-                query.end_date = datetime.now()
-                query.start_date = query.end_date - timedelta(days=days)
+                # Whole minutes, so repeated queries share a search cache key
+                query.start_date = now.replace(second=0, microsecond=0) - ONE_DAY * days
             except ValueError:
                 yield event.plain_result(f"❌ 无效的天数: {flags['days']}")
                 return
 
         # Load content history into search engine
         try:
-            # Clear previous index
-            self.search_engine.clear_index()
-
-            # Load from Bilibili state
-            bili_state = self.bili_state_manager.load_state()
-            if bili_state.content_history:
-                from models.report import ContentItem
-                bili_items = [ContentItem.from_dict(item) for item in bili_state.content_history]
-                self.search_engine.index_content(bili_items)
-
-            # Load from Zhihu state
-            zhihu_state = self.zhihu_state_manager.load_state()
-            if zhihu_state.content_history:
-                from models.report import ContentItem
-                zhihu_items = [ContentItem.from_dict(item) for item in zhihu_state.content_history]
-                self.search_engine.index_content(zhihu_items)
+            self._refresh_search_index()
 
             # Perform search (filtering only)
             results = self.search_engine.search(query)
@@ -1323,8 +1424,8 @@ class SASTPlugin(Star):
                     filter_desc.append(f"来源={', '.join(s.value for s in query.sources)}")
                 if query.min_importance:
                     filter_desc.append(f"最低重要度={query.min_importance}")
-                if query.start_date and query.end_date:
-                    filter_desc.append(f"时间范围={query.start_date.strftime('%Y-%m-%d')} 至 {query.end_date.strftime('%Y-%m-%d')}")
+                if query.start_date:
+                    filter_desc.append(f"时间范围={query.start_date.strftime('%Y-%m-%d')} 至 {(query.end_date or now).strftime('%Y-%m-%d')}")
 
                 yield event.plain_result(
                     f"🔍 未找到匹配的内容\n\n"
@@ -1350,14 +1451,17 @@ class SASTPlugin(Star):
                 lines.append(f"**最低重要度**: {query.min_importance}")
             if query.max_importance and query.max_importance < 1.0:
                 lines.append(f"**最高重要度**: {query.max_importance}")
-            if query.start_date and query.end_date:
-                lines.append(f"**时间范围**: {query.start_date.strftime('%Y-%m-%d')} 至 {query.end_date.strftime('%Y-%m-%d')}")
+            if query.start_date:
+                lines.append(f"**时间范围**: {query.start_date.strftime('%Y-%m-%d')} 至 {(query.end_date or now).strftime('%Y-%m-%d')}")
 
             lines.append("")
             lines.append("---")
-            lines.append("")
 
-            # Add results
+            # Send header first so the transport can start delivering
+            yield event.plain_result("\n".join(lines))
+
+            # Add results, RESULTS_PER_MESSAGE per message
+            lines = []
             for idx, result in enumerate(results, 1):
                 item = result.item
                 lines.append(f"## {idx}. {item.title}")
@@ -1381,12 +1485,21 @@ class SASTPlugin(Star):
 
                 lines.append("")
 
+                if idx % RESULTS_PER_MESSAGE == 0:
+                    yield event.plain_result("\n".join(lines))
+                    lines = []
+
+            if lines:
+                yield event.plain_result("\n".join(lines))
+
             # Add statistics
             stats = self.search_engine.get_statistics()
-            lines.append("---")
-            lines.append("")
-            lines.append("## 📊 索引统计")
-            lines.append(f"- 总内容数: {stats['total_items']}")
+            lines = [
+                "---",
+                "",
+                "## 📊 索引统计",
+                f"- 总内容数: {stats['total_items']}",
+            ]
             if stats['by_source']:
                 lines.append(f"- 按来源: {', '.join(f'{k}({v})' for k, v in stats['by_source'].items())}")
             if stats['by_category']:
@@ -1420,7 +1533,7 @@ class SASTPlugin(Star):
         """
         try:
             # Parse command flags
-            flags = parse_command_flags(event.message_str)
+            _, flags = split_keywords_and_flags(event.message_str)
 
             # Get parameters
             days = int(flags.get("days", 1))
@@ -1447,13 +1560,16 @@ class SASTPlugin(Star):
                 yield event.plain_result("❌ 生成报告失败，请检查是否有监控数据")
                 return
 
+            # Nothing to export or chart
+            if report.total_items == 0:
+                yield event.plain_result("❌ 无数据可导出")
+                return
+
             # Generate charts if requested
             charts: dict[str, str | bytes] | None = None
-            if include_charts and chart_available():
+            if include_charts and self._chart_available:
                 try:
-                    from utils.chart_generator import ChartGenerator
-
-                    chart_gen = ChartGenerator()
+                    chart_gen = self._get_chart_generator()
                     charts = {}
 
                     # Generate category distribution chart (bar chart)
@@ -1547,28 +1663,20 @@ class SASTPlugin(Star):
             if len(parts) > 1:
                 rest = parts[1].strip()
                 if rest:
-                    action_parts = rest.split(maxsplit=1)
-                    action = action_parts[0].lower()
-                    args = action_parts[1] if len(action_parts) > 1 else ""
-
-            # Handle different actions
-            if action == "list":
-                await self._handle_archive_list(event, args)
-            elif action == "save":
-                await self._handle_archive_save(event, args)
-            elif action == "view":
-                await self._handle_archive_view(event, args)
-            elif action == "delete":
-                await self._handle_archive_delete(event, args)
-            elif action == "cleanup":
-                await self._handle_archive_cleanup(event, args)
-            elif action == "stats":
-                await self._handle_archive_stats(event, args)
-            else:
+                    head, _, args = rest.partition(" ")
+                    action = head.lower()
+
+            # Dispatch to the action handler
+            handler = self._archive_actions.get(action)
+            if handler is None:
                 yield event.plain_result(
                     f"❌ 未知操作: {action}\n"
-                    "支持的操作: list, save, view, delete, cleanup, stats"
+                    f"支持的操作: {', '.join(self._archive_actions)}"
                 )
+                return
+
+            async for result in handler(event, args):
+                yield result
 
         except Exception as e:
             logger.error(f"归档操作失败: {e}", exc_info=True)
@@ -1576,7 +1684,7 @@ class SASTPlugin(Star):
 
     async def _handle_archive_list(self, event: AstrMessageEvent, args: str):
         """Handle archive list command."""
-        flags = parse_command_flags(args.split())
+        _, flags = split_keywords_and_flags(args)
 
         days = int(flags.get("days", 0)) if "days" in flags else None
         limit = int(flags.get("limit", 20))
@@ -1584,7 +1692,7 @@ class SASTPlugin(Star):
         # Get date range
         start_date = None
         if days:
-            start_date = datetime.now() - timedelta(days=days)
+            start_date = datetime.now() - ONE_DAY * days
 
         # List archives
         archives = self.archive_manager.list_archives(
@@ -1596,26 +1704,26 @@ class SASTPlugin(Star):
             yield event.plain_result("📦 暂无归档报告")
             return
 
-        lines = [
-            f"📦 归档报告列表 (共 {len(archives)} 个)",
-            ""
+        rows = [
+            ARCHIVE_ROW_TEMPLATE.format(
+                idx=idx,
+                archive_id=archive.archive_id,
+                report_date=archive.report_date_str,
+                archived_at=archive.archived_at_str,
+                total_items=archive.total_items,
+                bilibili_items=archive.bilibili_items,
+                zhihu_items=archive.zhihu_items,
+                file_size=archive.file_size,
+                file_size_kb=archive.file_size / 1024
+            )
+            for idx, archive in enumerate(archives, 1)
         ]
 
-        for idx, archive in enumerate(archives, 1):
-            lines.extend([
-                f"{idx}. **{archive.archive_id}**",
-                f"   📅 报告日期: {archive.report_date.strftime('%Y-%m-%d')}",
-                f"   🕐 归档时间: {archive.archived_at.strftime('%Y-%m-%d %H:%M:%S')}",
-                f"   📊 内容数: {archive.total_items} (B站: {archive.bilibili_items}, 知乎: {archive.zhihu_items})",
-                f"   💾 文件大小: {archive.file_size:,} 字节 ({archive.file_size / 1024:.2f} KB)",
-                ""
-            ])
-
-        yield event.plain_result("\n".join(lines))
+        yield event.plain_result(ARCHIVE_LIST_HEADER.format(count=len(archives)) + "\n".join(rows))
 
     async def _handle_archive_save(self, event: AstrMessageEvent, args: str):
         """Handle archive save command."""
-        flags = parse_command_flags(args.split())
+        _, flags = split_keywords_and_flags(args)
         days = int(flags.get("days", 1))
 
         yield event.plain_result(f"📦 正在生成并归档 {days} 天的报告...")
@@ -1628,19 +1736,17 @@ class SASTPlugin(Star):
             return
 
         # Archive report
-        metadata = self.archive_manager.archive_report(report)
+        metadata = await self.archive_manager.archive_report_async(report)
 
         if metadata:
-            lines = [
-                "✅ 报告归档成功！",
-                "",
-                f"📦 归档ID: {metadata.archive_id}",
-                f"📅 报告日期: {metadata.report_date.strftime('%Y-%m-%d')}",
-                f"📊 内容数: {metadata.total_items}",
-                f"💾 文件大小: {metadata.file_size:,} 字节 ({metadata.file_size / 1024:.2f} KB)",
-                f"📁 文件路径: {metadata.file_path}"
-            ]
-            yield event.plain_result("\n".join(lines))
+            yield event.plain_result(ARCHIVE_SAVED_TEMPLATE.format(
+                archive_id=metadata.archive_id,
+                report_date=metadata.report_date_str,
+                total_items=metadata.total_items,
+                file_size=metadata.file_size,
+                file_size_kb=metadata.file_size / 1024,
+                file_path=metadata.file_path
+            ))
         else:
             yield event.plain_result("❌ 归档失败")
 
@@ -1653,48 +1759,38 @@ class SASTPlugin(Star):
             return
 
         # Load report
-        report = self.archive_manager.load_report(archive_id)
+        report = await self.archive_manager.load_report_async(archive_id)
 
         if not report:
             yield event.plain_result(f"❌ 未找到归档: {archive_id}")
             return
 
         # Display report summary
-        lines = [
-            f"📦 归档报告: {archive_id}",
-            "",
-            f"📋 {report.title}",
-            f"📅 报告日期: {report.report_date.strftime('%Y年%m月%d日')}",
-            "",
-            "## 📊 统计信息",
-            f"- 总内容数: {report.total_items}",
-            f"- B站视频: {report.bilibili_items}",
-            f"- 知乎内容: {report.zhihu_items}",
-            f"- 分类数: {len(report.sections)}",
-            ""
-        ]
-
-        if report.executive_summary:
-            lines.extend([
-                "## 📋 执行摘要",
-                report.executive_summary,
-                ""
-            ])
-
-        if report.trending_topics:
-            topics_str = " · ".join(report.trending_topics)
-            lines.extend([
-                "## 🔥 热门话题",
-                topics_str,
-                ""
-            ])
-
-        # Show sections summary
-        lines.append("## 📂 内容分类")
-        for section in report.sections:
-            lines.append(f"- {section.category.value}: {len(section.items)} 项")
+        summary_block = (
+            f"## 📋 执行摘要\n{report.executive_summary}\n\n"
+            if report.executive_summary else ""
+        )
+        topics_block = (
+            f"## 🔥 热门话题\n{' · '.join(report.trending_topics)}\n\n"
+            if report.trending_topics else ""
+        )
+        sections_block = "\n".join(
+            f"- {section.category.value}: {len(section.items)} 项"
+            for section in report.sections
+        )
 
-        yield event.plain_result("\n".join(lines))
+        yield event.plain_result(ARCHIVE_VIEW_TEMPLATE.format(
+            archive_id=archive_id,
+            title=report.title,
+            report_date=report.report_date,
+            total_items=report.total_items,
+            bilibili_items=report.bilibili_items,
+            zhihu_items=report.zhihu_items,
+            section_count=len(report.sections),
+            summary_block=summary_block,
+            topics_block=topics_block,
+            sections_block=sections_block
+        ))
 
     async def _handle_archive_delete(self, event: AstrMessageEvent, args: str):
         """Handle archive delete command."""
@@ -1714,12 +1810,12 @@ class SASTPlugin(Star):
 
     async def _handle_archive_cleanup(self, event: AstrMessageEvent, args: str):
         """Handle archive cleanup command."""
-        flags = parse_command_flags(args.split())
+        _, flags = split_keywords_and_flags(args)
         days = int(flags.get("days", 90))
 
         yield event.plain_result(f"🧹 正在清理 {days} 天前的归档...")
 
-        deleted_count = self.archive_manager.cleanup_old_archives(days)
+        deleted_count = await self.archive_manager.cleanup_old_archives_async(days)
 
         if deleted_count > 0:
             yield event.plain_result(f"✅ 已清理 {deleted_count} 个旧归档")
@@ -1734,20 +1830,18 @@ class SASTPlugin(Star):
             yield event.plain_result("📦 暂无归档报告")
             return
 
-        lines = [
-            "📊 归档统计信息",
-            "",
-            f"📦 总归档数: {stats['total_archives']}",
-            f"💾 总大小: {stats['total_size_mb']} MB ({stats['total_size_bytes']:,} 字节)",
-            f"📝 总内容数: {stats['total_items']}",
-            ""
-        ]
-
-        if stats["date_range"]:
-            lines.extend([
-                "📅 日期范围:",
-                f"- 最早: {stats['date_range']['earliest']}",
-                f"- 最新: {stats['date_range']['latest']}"
-            ])
+        date_range = stats["date_range"]
+        date_block = (
+            f"📅 日期范围:\n"
+            f"- 最早: {date_range['earliest']}\n"
+            f"- 最新: {date_range['latest']}"
+            if date_range else ""
+        )
 
-        yield event.plain_result("\n".join(lines))
+        yield event.plain_result(ARCHIVE_STATS_TEMPLATE.format(
+            total_archives=stats["total_archives"],
+            total_size_mb=stats["total_size_mb"],
+            total_size_bytes=stats["total_size_bytes"],
+            total_items=stats["total_items"],
+            date_block=date_block
+        ))
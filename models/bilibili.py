@@ -5,12 +5,16 @@ Defines configuration and state management structures.
 """
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
-import json
 from pathlib import Path
 
+from utils.json_utils import json_dumps, json_loads
+
+from .report import MAX_CONTENT_HISTORY
+
 
 @dataclass(slots=True)
 class UPMasterConfig:
@@ -91,7 +95,7 @@ class VideoInfo:
         return None
 
 
-@dataclass
+@dataclass(slots=True)
 class UPMasterState:
     """State tracking for a single UP master."""
     mid: str
@@ -116,7 +120,7 @@ class UPMasterState:
             "last_check_time": self.last_check_time,
             "last_video_bvid": self.last_video_bvid,
             "last_video_aid": self.last_video_aid,
-            "processed_videos": list(self.processed_videos)
+            "processed_videos": sorted(self.processed_videos)
         }
 
     def mark_video_processed(self, bvid: str) -> None:
@@ -128,12 +132,16 @@ class UPMasterState:
         return bvid in self.processed_videos
 
 
-@dataclass
+@dataclass(slots=True)
 class MonitorState:
     """Overall monitoring state for all UP masters."""
     up_masters: dict[str, UPMasterState] = field(default_factory=dict)
     last_save_time: int = 0
-    content_history: list[dict[str, Any]] = field(default_factory=list)  # Searchable content history
+    content_history: deque[dict[str, Any]] = field(
+        default_factory=lambda: deque(maxlen=MAX_CONTENT_HISTORY)
+    )  # Searchable content history, oldest entries evicted first
+    # Set when state may have changed since the last load/save
+    _dirty: bool = field(default=False, init=False, repr=False, compare=False)
 
     @classmethod
     def load_from_file(cls, file_path: Path) -> MonitorState:
@@ -142,11 +150,11 @@ class MonitorState:
             return cls()
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                data = json_loads(f.read())
                 state = cls()
                 state.last_save_time = data.get("last_save_time", 0)
-                state.content_history = data.get("content_history", [])
+                state.content_history = deque(data.get("content_history", []), maxlen=MAX_CONTENT_HISTORY)
                 for mid, up_data in data.get("up_masters", {}).items():
                     state.up_masters[mid] = UPMasterState.from_dict(up_data)
                 return state
@@ -154,40 +162,75 @@ class MonitorState:
             # If file is corrupted, return empty state
             return cls()
 
-    def save_to_file(self, file_path: Path) -> None:
-        """Save state to JSON file."""
+    def mark_dirty(self) -> None:
+        """Flag the state as changed so the next save writes it."""
+        self._dirty = True
+
+    def save_to_file(self, file_path: Path, indent: bool = False) -> None:
+        """Save state to JSON file.
+
+        The file is written as compact JSON in a single write; pass
+        indent=True to get a human-readable file when debugging. Nothing
+        is written when the state has not changed since it was loaded or
+        last saved.
+        """
+        if not self._dirty:
+            return
+
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
+        up_state_to_dict = UPMasterState.to_dict
         data = {
             "last_save_time": int(datetime.now().timestamp()),
             "up_masters": {
-                mid: state.to_dict()
+                mid: up_state_to_dict(state)
                 for mid, state in self.up_masters.items()
             },
-            "content_history": self.content_history
+            "content_history": list(self.content_history)
         }
 
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        # Write to temporary file first, then rename for atomicity
+        temp_path = file_path.with_suffix('.tmp')
+        try:
+            temp_path.write_bytes(json_dumps(data, indent=indent))
+            temp_path.replace(file_path)
+        except Exception:
+            if temp_path.exists():
+                temp_path.unlink()
+            raise
+
+        self.last_save_time = data["last_save_time"]
+        self._dirty = False
 
     def get_or_create_up_state(self, mid: str) -> UPMasterState:
-        """Get or create state for an UP master."""
-        if mid not in self.up_masters:
-            self.up_masters[mid] = UPMasterState(
+        """Get or create state for an UP master.
+
+        Only creating a state marks the monitor state dirty; callers that
+        modify the returned state call mark_dirty themselves.
+        """
+        up_state = self.up_masters.get(mid)
+        if up_state is None:
+            up_state = self.up_masters[mid] = UPMasterState(
                 mid=mid,
                 last_check_time=0
             )
-        return self.up_masters[mid]
+            self.mark_dirty()
+        return up_state
 
     def add_content_to_history(self, content_item: dict[str, Any]) -> None:
         """Add a content item to searchable history."""
         self.content_history.append(content_item)
+        self.mark_dirty()
+
+    def cleanup_old_history(self, max_items: int = MAX_CONTENT_HISTORY) -> None:
+        """Trim Bilibili video history to the newest max_items entries.
 
-    def cleanup_old_history(self, max_items: int = 1000) -> None:
-        """Remove old content history to prevent state file from growing too large."""
-        if len(self.content_history) > max_items:
-            # Keep only the most recent items
-            self.content_history = self.content_history[-max_items:]
+        The deque already drops videos beyond MAX_CONTENT_HISTORY as they
+        are added, so this only removes entries for a smaller max_items.
+        """
+        while len(self.content_history) > max_items:
+            self.content_history.popleft()
+            self.mark_dirty()
 
 
 @dataclass(slots=True)
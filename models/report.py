@@ -6,11 +6,17 @@ intelligent daily summaries.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
+from collections.abc import Iterator
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Literal
 from enum import Enum
 
+from utils.json_utils import parse_iso_datetime
+
+# Maximum number of searchable ContentItem dicts kept in each monitor's state
+MAX_CONTENT_HISTORY = 1000
+
 
 class ContentSource(str, Enum):
     """Source of content for daily reports."""
@@ -29,7 +35,12 @@ class ContentCategory(str, Enum):
     OTHER = "other"
 
 
-@dataclass
+# Enum member -> serialized value, avoiding Enum.value descriptor lookups
+_SOURCE_VALUES: dict[ContentSource, str] = {m: m.value for m in ContentSource}
+_CATEGORY_VALUES: dict[ContentCategory, str] = {m: m.value for m in ContentCategory}
+
+
+@dataclass(slots=True)
 class ContentItem:
     """A single piece of content for the daily report."""
     
@@ -48,19 +59,34 @@ class ContentItem:
     
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
-        data = asdict(self)
-        if self.published:
-            data['published'] = self.published.isoformat()
-        data['source'] = self.source.value
-        data['category'] = self.category.value
-        return data
+        return {
+            'title': self.title,
+            'url': self.url,
+            'source': _SOURCE_VALUES[self.source],
+            'published': self.published.isoformat() if self.published else None,
+            'author': self.author,
+            'summary': self.summary,
+            'category': _CATEGORY_VALUES[self.category],
+            'importance_score': self.importance_score,
+            'tags': self.tags,
+            'source_data': self.source_data
+        }
+    
+    def published_minute(self) -> str | None:
+        """Publish time formatted as YYYY-MM-DD HH:MM, without going through strftime."""
+        p = self.published
+        if p is None:
+            return None
+        return f"{p.year:04d}-{p.month:02d}-{p.day:02d} {p.hour:02d}:{p.minute:02d}"
     
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> ContentItem:
         """Create from dictionary."""
+        # Work on a copy so stored history entries are left untouched
+        data = dict(data)
         if 'published' in data and data['published']:
             if isinstance(data['published'], str):
-                data['published'] = datetime.fromisoformat(data['published'])
+                data['published'] = parse_iso_datetime(data['published'])
         
         if 'source' in data and isinstance(data['source'], str):
             data['source'] = ContentSource(data['source'])
@@ -71,7 +97,7 @@ class ContentItem:
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class CategorySection:
     """A section of the daily report grouped by category."""
     
@@ -90,7 +116,7 @@ class CategorySection:
         return sum(item.importance_score for item in self.items) / len(self.items)
 
 
-@dataclass
+@dataclass(slots=True)
 class DailyReportConfig:
     """Configuration for daily report generation."""
     
@@ -118,7 +144,21 @@ class DailyReportConfig:
     
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
-        return asdict(self)
+        return {
+            'enabled': self.enabled,
+            'generation_time': self.generation_time,
+            'include_bilibili': self.include_bilibili,
+            'include_zhihu': self.include_zhihu,
+            'categorize_content': self.categorize_content,
+            'generate_ai_summary': self.generate_ai_summary,
+            'highlight_important': self.highlight_important,
+            'max_items_per_category': self.max_items_per_category,
+            'min_importance_score': self.min_importance_score,
+            'output_format': self.output_format,
+            'include_statistics': self.include_statistics,
+            'include_trending': self.include_trending,
+            'delivery_targets': self.delivery_targets
+        }
     
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> DailyReportConfig:
@@ -126,7 +166,7 @@ class DailyReportConfig:
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class DailyReport:
     """A complete daily report with aggregated content."""
     
@@ -144,15 +184,25 @@ class DailyReport:
     # Metadata
     generation_time: datetime | None = None
     
+    # Category -> section lookup kept in sync with sections
+    _section_index: dict[ContentCategory, CategorySection] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self):
+        """Build the section index from any initial sections."""
+        self._section_index = {section.category: section for section in self.sections}
+    
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
+        item_to_dict = ContentItem.to_dict
         return {
             'report_date': self.report_date.isoformat(),
             'title': self.title,
             'sections': [
                 {
-                    'category': section.category.value,
-                    'items': [item.to_dict() for item in section.items],
+                    'category': _CATEGORY_VALUES[section.category],
+                    'items': list(map(item_to_dict, section.items)),
                     'ai_summary': section.ai_summary
                 }
                 for section in self.sections
@@ -170,11 +220,11 @@ class DailyReport:
         """Create from dictionary."""
         report_date = data['report_date']
         if isinstance(report_date, str):
-            report_date = datetime.fromisoformat(report_date)
+            report_date = parse_iso_datetime(report_date)
         
         generation_time = data.get('generation_time')
         if generation_time and isinstance(generation_time, str):
-            generation_time = datetime.fromisoformat(generation_time)
+            generation_time = parse_iso_datetime(generation_time)
         
         sections = []
         for section_data in data.get('sections', []):
@@ -200,17 +250,15 @@ class DailyReport:
     
     def get_section(self, category: ContentCategory) -> CategorySection | None:
         """Get section by category."""
-        for section in self.sections:
-            if section.category == category:
-                return section
-        return None
+        return self._section_index.get(category)
     
     def add_item(self, item: ContentItem):
         """Add an item to the appropriate section."""
-        section = self.get_section(item.category)
-        if not section:
+        section = self._section_index.get(item.category)
+        if section is None:
             section = CategorySection(category=item.category)
             self.sections.append(section)
+            self._section_index[item.category] = section
         
         section.items.append(item)
         self.total_items += 1
@@ -220,17 +268,19 @@ class DailyReport:
         elif item.source == ContentSource.ZHIHU:
             self.zhihu_items += 1
     
+    def iter_items(self) -> Iterator[ContentItem]:
+        """Iterate over all items from all sections without building a list."""
+        for section in self.sections:
+            yield from section.items
+    
     def get_all_items(self) -> list[ContentItem]:
         """Get all items from all sections."""
-        items = []
-        for section in self.sections:
-            items.extend(section.items)
-        return items
+        return list(self.iter_items())
     
     def get_high_importance_items(self, threshold: float = 0.7) -> list[ContentItem]:
         """Get items with importance score above threshold."""
         return [
-            item for item in self.get_all_items()
+            item for item in self.iter_items()
             if item.importance_score >= threshold
         ]
 
@@ -5,12 +5,20 @@ Defines structures for Zhihu feed items, configurations, and state management.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
+from utils.json_utils import parse_iso_datetime
 
-@dataclass
+from .report import MAX_CONTENT_HISTORY
+
+# Maximum number of processed item IDs remembered per feed
+MAX_PROCESSED_ITEMS = 1000
+
+
+@dataclass(slots=True)
 class ZhihuFeedItem:
     """Represents a single item from a Zhihu RSS feed."""
     
@@ -25,17 +33,24 @@ class ZhihuFeedItem:
     
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
-        data = asdict(self)
-        if self.published:
-            data['published'] = self.published.isoformat()
-        return data
+        return {
+            'title': self.title,
+            'link': self.link,
+            'published': self.published.isoformat() if self.published else None,
+            'author': self.author,
+            'summary': self.summary,
+            'content': self.content,
+            'guid': self.guid,
+            'bilibili_links': self.bilibili_links
+        }
     
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> ZhihuFeedItem:
         """Create from dictionary."""
+        data = dict(data)
         if 'published' in data and data['published']:
             if isinstance(data['published'], str):
-                data['published'] = datetime.fromisoformat(data['published'])
+                data['published'] = parse_iso_datetime(data['published'])
         return cls(**data)
     
     def get_id(self) -> str:
@@ -43,7 +58,7 @@ class ZhihuFeedItem:
         return self.guid or self.link
 
 
-@dataclass
+@dataclass(slots=True)
 class ZhihuFeedConfig:
     """Configuration for a Zhihu RSS feed to monitor."""
     
@@ -55,7 +70,13 @@ class ZhihuFeedConfig:
     
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
-        return asdict(self)
+        return {
+            'feed_url': self.feed_url,
+            'name': self.name,
+            'enabled': self.enabled,
+            'check_bilibili_links': self.check_bilibili_links,
+            'max_items': self.max_items
+        }
     
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> ZhihuFeedConfig:
@@ -63,57 +84,80 @@ class ZhihuFeedConfig:
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class ZhihuFeedState:
     """State tracking for a single Zhihu RSS feed."""
     
     feed_url: str
     name: str | None = None
-    processed_items: list[str] = field(default_factory=list)
+    processed_items: deque[str] = field(default_factory=lambda: deque(maxlen=MAX_PROCESSED_ITEMS))
     last_check_time: datetime | None = None
     last_error: str | None = None
     error_count: int = 0
     
+    # Mirror of processed_items for O(1) membership checks
+    _processed_set: set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Normalize processed items and build the lookup set."""
+        if not isinstance(self.processed_items, deque) or self.processed_items.maxlen != MAX_PROCESSED_ITEMS:
+            self.processed_items = deque(self.processed_items, maxlen=MAX_PROCESSED_ITEMS)
+        self._processed_set = set(self.processed_items)
+    
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
-        data = asdict(self)
-        if self.last_check_time:
-            data['last_check_time'] = self.last_check_time.isoformat()
-        return data
+        return {
+            'feed_url': self.feed_url,
+            'name': self.name,
+            'processed_items': list(self.processed_items),
+            'last_check_time': self.last_check_time.isoformat() if self.last_check_time else None,
+            'last_error': self.last_error,
+            'error_count': self.error_count
+        }
     
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> ZhihuFeedState:
         """Create from dictionary."""
+        data = dict(data)
         if 'last_check_time' in data and data['last_check_time']:
             if isinstance(data['last_check_time'], str):
-                data['last_check_time'] = datetime.fromisoformat(data['last_check_time'])
+                data['last_check_time'] = parse_iso_datetime(data['last_check_time'])
         return cls(**data)
     
     def is_item_new(self, item_id: str) -> bool:
         """Check if an item has been processed."""
-        return item_id not in self.processed_items
+        return item_id not in self._processed_set
     
     def mark_item_processed(self, item_id: str):
         """Mark an item as processed."""
-        if item_id not in self.processed_items:
-            self.processed_items.append(item_id)
-            # Keep only last 1000 items to prevent unbounded growth
-            if len(self.processed_items) > 1000:
-                self.processed_items = self.processed_items[-1000:]
+        if item_id in self._processed_set:
+            return
+        # Only the last MAX_PROCESSED_ITEMS are kept; forget the evicted one
+        if len(self.processed_items) == self.processed_items.maxlen:
+            self._processed_set.discard(self.processed_items[0])
+        self.processed_items.append(item_id)
+        self._processed_set.add(item_id)
+    
+    def trim_processed_items(self, keep_count: int):
+        """Keep only the most recent processed items."""
+        while len(self.processed_items) > keep_count:
+            self._processed_set.discard(self.processed_items.popleft())
 
 
-@dataclass
+@dataclass(slots=True)
 class ZhihuMonitorState:
     """Global state for Zhihu RSS monitoring."""
 
     feeds: dict[str, ZhihuFeedState] = field(default_factory=dict)
-    content_history: list[dict[str, Any]] = field(default_factory=list)  # Searchable content history
+    content_history: deque[dict[str, Any]] = field(
+        default_factory=lambda: deque(maxlen=MAX_CONTENT_HISTORY)
+    )  # Searchable content history, oldest entries evicted first
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
             'feeds': {url: state.to_dict() for url, state in self.feeds.items()},
-            'content_history': self.content_history
+            'content_history': list(self.content_history)
         }
 
     @classmethod
@@ -123,7 +167,7 @@ class ZhihuMonitorState:
         if 'feeds' in data:
             for url, state_data in data['feeds'].items():
                 feeds[url] = ZhihuFeedState.from_dict(state_data)
-        content_history = data.get('content_history', [])
+        content_history = deque(data.get('content_history', []), maxlen=MAX_CONTENT_HISTORY)
         return cls(feeds=feeds, content_history=content_history)
 
     def get_or_create_feed_state(self, feed_url: str, name: str | None = None) -> ZhihuFeedState:
@@ -136,14 +180,13 @@ class ZhihuMonitorState:
         """Add a content item to searchable history."""
         self.content_history.append(content_item)
 
-    def cleanup_old_history(self, max_items: int = 1000) -> None:
-        """Remove old content history to prevent state file from growing too large."""
-        if len(self.content_history) > max_items:
-            # Keep only the most recent items
-            self.content_history = self.content_history[-max_items:]
+    def cleanup_old_history(self, max_items: int = MAX_CONTENT_HISTORY) -> None:
+        """Drop the oldest Zhihu items until at most max_items remain."""
+        while len(self.content_history) > max_items:
+            self.content_history.popleft()
 
 
-@dataclass
+@dataclass(slots=True)
 class ZhihuMonitorReport:
     """Report from a Zhihu RSS feed check."""
     
@@ -188,7 +231,7 @@ class ZhihuMonitorReport:
         """Create from dictionary."""
         check_time = data['check_time']
         if isinstance(check_time, str):
-            check_time = datetime.fromisoformat(check_time)
+            check_time = parse_iso_datetime(check_time)
         
         new_items = []
         if 'new_items' in data:
@@ -5,7 +5,7 @@ This package contains high-level services including AI summarization
 and report formatting for both Bilibili and Zhihu content.
 """
 
-from .ai_summarizer import AISummarizer
+from .ai_summarizer import AISummarizer, SummaryCache
 from .formatter import MarkdownFormatter
 from .zhihu_formatter import ZhihuFormatter
 from .report_aggregator import ReportAggregator
@@ -13,6 +13,7 @@ from .daily_report import DailyReportGenerator
 
 __all__ = [
     "AISummarizer",
+    "SummaryCache",
     "MarkdownFormatter",
     "ZhihuFormatter",
     "ReportAggregator",
@@ -5,11 +5,103 @@ Handles AI-powered analysis and summarization of UP master videos.
 """
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import os
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
 
-from utils.openrouter_client import ORSummaryOptions, summarize_batch
+from utils.json_utils import json_dumps, json_loads
+from utils.openrouter_client import (
+    ORSummaryOptions,
+    build_summary_prompt,
+    openrouter_chat_stream,
+    summarize_batch,
+    with_retries,
+)
 from models.bilibili import MonitorReport, VideoInfo
 
+# Default lifetime of cached summaries (7 days)
+DEFAULT_CACHE_TTL = 7 * 24 * 3600
+
+# Retries after rate limiting, server errors or timeouts
+MAX_RETRIES = 4
+
+
+class SummaryCache:
+    """Disk-backed cache of AI summaries keyed by prompt hash."""
+
+    def __init__(self, file_path: Path, ttl: int = DEFAULT_CACHE_TTL):
+        """Initialize summary cache.
+        
+        Args:
+            file_path: JSON file the cache is persisted to
+            ttl: Seconds a cached summary stays valid
+        """
+        self.file_path = file_path
+        self.ttl = ttl
+        self._entries: dict[str, dict[str, Any]] | None = None
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        """Load cache entries from disk on first use."""
+        if self._entries is None:
+            try:
+                self._entries = json_loads(self.file_path.read_bytes())
+            except (OSError, ValueError):
+                # Missing or corrupted cache file, start empty
+                self._entries = {}
+        return self._entries
+
+    def get(self, key: str) -> str | None:
+        """Get a cached summary.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Cached summary, or None if missing or expired
+        """
+        entry = self._load().get(key)
+        if entry is None or entry.get("expires_at", 0) < time.time():
+            return None
+        return entry.get("summary")
+
+    def set_many(self, summaries: dict[str, str]) -> None:
+        """Store summaries and persist the cache.
+        
+        Args:
+            summaries: Mapping of cache key to summary
+        """
+        if not summaries:
+            return
+
+        entries = self._load()
+        now = time.time()
+
+        # Drop expired entries so the file does not grow without bound
+        for key in [k for k, e in entries.items() if e.get("expires_at", 0) < now]:
+            del entries[key]
+
+        expires_at = now + self.ttl
+        for key, summary in summaries.items():
+            entries[key] = {"summary": summary, "expires_at": expires_at}
+
+        self._save(entries)
+
+    def _save(self, entries: dict[str, dict[str, Any]]) -> None:
+        """Write cache entries to disk atomically."""
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.file_path.with_suffix('.tmp')
+        try:
+            temp_path.write_bytes(json_dumps(entries))
+            temp_path.replace(self.file_path)
+        except OSError:
+            # Caching is best effort
+            if temp_path.exists():
+                temp_path.unlink()
+
 
 class AISummarizer:
     """AI-powered summarization for UP master videos."""
@@ -18,7 +110,9 @@ class AISummarizer:
         self,
         api_key: str | None = None,
         model: str = "minimax/minimax-m2:free",
-        prompt_template: str | None = None
+        prompt_template: str | None = None,
+        max_concurrency: int = 8,
+        cache: SummaryCache | None = None
     ):
         """Initialize AI summarizer.
         
@@ -26,10 +120,16 @@ class AISummarizer:
             api_key: OpenRouter API key (if None, will try to get from env)
             model: Model to use for summarization
             prompt_template: Custom prompt template
+            max_concurrency: Maximum number of summaries requested at once
+            cache: Optional persistent cache of previous summaries
         """
         self.api_key = api_key or os.environ.get("OPENROUTER_API_KEY", "")
         self.model = model
         self.prompt_template = prompt_template or self._get_default_prompt()
+        self.max_concurrency = max(1, max_concurrency)
+        self.cache = cache
+        # Prompt hash -> pending summary, so identical concurrent requests share one call
+        self._inflight: dict[str, asyncio.Future[str | None]] = {}
 
     def _get_default_prompt(self) -> str:
         """Get default prompt template."""
@@ -121,11 +221,77 @@ class AISummarizer:
 
         return "\n".join(parts)
 
-    async def summarize_report(self, report: MonitorReport) -> str | None:
+    def _build_prompt(self, report: MonitorReport) -> str:
+        """Combine the prompt template with a report's content."""
+        return f"{self.prompt_template}\n\n{self._build_summary_content(report)}"
+
+    def _cache_key(self, prompt: str) -> str:
+        """Hash a prompt together with the model that answers it."""
+        return hashlib.sha256(f"{self.model}\x00{prompt}".encode("utf-8")).hexdigest()
+
+    def _build_options(self) -> ORSummaryOptions:
+        """Build OpenRouter options for summarization requests."""
+        return ORSummaryOptions(
+            api_key=self.api_key,
+            model=self.model,
+            language="zh",
+            # SummaryCache handles caching here, including force_refresh
+            cache_ttl=0
+        )
+
+    async def _stream_prompt(self, prompt: str) -> AsyncIterator[str]:
+        """Stream the model's answer to a prompt."""
+        opts = self._build_options()
+        messages = build_summary_prompt(
+            prompt, None, language=opts.language, max_input_chars=opts.max_input_chars
+        )
+        async for chunk in openrouter_chat_stream(messages, opts):
+            yield chunk
+
+    async def summarize_report_stream(
+        self,
+        report: MonitorReport,
+        force_refresh: bool = False
+    ) -> AsyncIterator[str]:
+        """Generate AI summary for a monitor report, yielding text as it arrives.
+        
+        A cached summary is yielded in one piece. Request errors propagate
+        to the caller.
+        
+        Args:
+            report: Monitor report to summarize
+            force_refresh: Bypass the summary cache
+            
+        Yields:
+            Pieces of the summary text
+        """
+        if not self.api_key or not report.has_new_videos():
+            return
+
+        prompt = self._build_prompt(report)
+        key = self._cache_key(prompt)
+
+        if self.cache and not force_refresh:
+            cached = self.cache.get(key)
+            if cached:
+                yield cached
+                return
+
+        chunks = []
+        async for chunk in self._stream_prompt(prompt):
+            chunks.append(chunk)
+            yield chunk
+
+        summary = "".join(chunks)
+        if summary and self.cache:
+            self.cache.set_many({key: summary})
+
+    async def summarize_report(self, report: MonitorReport, force_refresh: bool = False) -> str | None:
         """Generate AI summary for a monitor report.
         
         Args:
             report: Monitor report to summarize
+            force_refresh: Bypass the summary cache
             
         Returns:
             AI-generated summary, or None if failed
@@ -136,57 +302,107 @@ class AISummarizer:
         if not report.has_new_videos():
             return None
 
-        try:
-            content = self._build_summary_content(report)
+        prompt = self._build_prompt(report)
+        key = self._cache_key(prompt)
+
+        if self.cache and not force_refresh:
+            cached = self.cache.get(key)
+            if cached:
+                return cached
 
-            # Prepare for summarization
-            opts = ORSummaryOptions(
-                api_key=self.api_key,
-                model=self.model,
-                language="zh"
-            )
+        # Join an identical request that is already in flight
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
 
-            # Build custom prompt
-            full_content = f"{self.prompt_template}\n\n{content}"
+        future: asyncio.Future[str | None] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        summary = None
+
+        try:
+            # Call AI summarization, collecting the streamed answer
+            async def collect() -> str:
+                return "".join([chunk async for chunk in self._stream_prompt(prompt)])
 
-            # Call AI summarization
-            results = await summarize_batch(
-                [(None, full_content)],
-                opts
-            )
+            summary = await with_retries(collect, MAX_RETRIES) or None
 
-            if results and len(results) > 0:
-                summary = results[0].get("summary")
-                if summary:
-                    return summary
+            if summary and self.cache:
+                self.cache.set_many({key: summary})
 
         except Exception:
             # If AI summarization fails, return None
             # The caller should handle this gracefully
             pass
 
-        return None
+        finally:
+            del self._inflight[key]
+            future.set_result(summary)
+
+        return summary
 
     async def summarize_multiple_reports(
         self,
-        reports: list[MonitorReport]
+        reports: list[MonitorReport],
+        force_refresh: bool = False
     ) -> dict[str, str]:
         """Generate AI summaries for multiple reports.
         
         Args:
             reports: List of monitor reports
+            force_refresh: Bypass the summary cache
             
         Returns:
             Dictionary mapping UP master mid to summary
         """
-        summaries = {}
+        if not self.api_key:
+            return {}
 
-        for report in reports:
-            if report.has_new_videos():
-                summary = await self.summarize_report(report)
-                if summary:
-                    summaries[report.up_master_mid] = summary
-                    report.ai_summary = summary
+        pending = [report for report in reports if report.has_new_videos()]
+        if not pending:
+            return {}
+
+        prompts = [self._build_prompt(report) for report in pending]
+        keys = [self._cache_key(prompt) for prompt in prompts]
+        prompt_by_key = dict(zip(keys, prompts))
+
+        summary_by_key: dict[str, str | None] = {}
+        if self.cache and not force_refresh:
+            for key in prompt_by_key:
+                cached = self.cache.get(key)
+                if cached:
+                    summary_by_key[key] = cached
+
+        # Identical prompts are only sent once, cached ones not at all
+        missing = [key for key in prompt_by_key if key not in summary_by_key]
+
+        if missing:
+            # One batch over a shared session; requests run concurrently within the limit
+            try:
+                results = await summarize_batch(
+                    [(None, prompt_by_key[key]) for key in missing],
+                    self._build_options(),
+                    max_concurrency=self.max_concurrency,
+                    return_exceptions=True,
+                    retries=MAX_RETRIES
+                )
+            except Exception:
+                results = []
+
+            fresh = {
+                key: result["summary"]
+                for key, result in zip(missing, results)
+                if result.get("summary")
+            }
+            summary_by_key.update(fresh)
+            if self.cache:
+                self.cache.set_many(fresh)
+
+        summaries = {}
+        for report, key in zip(pending, keys):
+            summary = summary_by_key.get(key)
+            if summary:
+                summaries[report.up_master_mid] = summary
+                report.ai_summary = summary
 
         return summaries
 
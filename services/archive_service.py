@@ -6,18 +6,29 @@ for long-term storage and analysis.
 """
 from __future__ import annotations
 
-import json
+import asyncio
+import bisect
 import logging
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 from dataclasses import dataclass, field
+from functools import cached_property
+from operator import attrgetter
 
 from models.report import DailyReport
+from utils.json_utils import json_dumps, json_loads
 
 
 logger = logging.getLogger(__name__)
 
+# Number of logged index changes before index.json is rewritten
+WAL_COMPACT_THRESHOLD = 50
+
+# Sort key of archives within the index
+_report_date = attrgetter("report_date")
+
 
 @dataclass
 class ArchiveMetadata:
@@ -32,6 +43,18 @@ class ArchiveMetadata:
     bilibili_items: int
     zhihu_items: int
     
+    @cached_property
+    def report_date_str(self) -> str:
+        """Report date formatted as YYYY-MM-DD, computed once."""
+        d = self.report_date
+        return f"{d.year:04d}-{d.month:02d}-{d.day:02d}"
+    
+    @cached_property
+    def archived_at_str(self) -> str:
+        """Archive time formatted as YYYY-MM-DD HH:MM:SS, computed once."""
+        t = self.archived_at
+        return f"{t.year:04d}-{t.month:02d}-{t.day:02d} {t.hour:02d}:{t.minute:02d}:{t.second:02d}"
+    
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -62,11 +85,19 @@ class ArchiveMetadata:
 
 @dataclass
 class ArchiveIndex:
-    """Index of all archived reports."""
+    """Index of all archived reports, kept sorted by report date (oldest first)."""
     
     archives: list[ArchiveMetadata] = field(default_factory=list)
     last_updated: datetime = field(default_factory=datetime.now)
     
+    def __post_init__(self):
+        """Sort archives loaded in arbitrary order."""
+        self.archives.sort(key=_report_date)
+    
+    def add(self, metadata: ArchiveMetadata):
+        """Insert an archive, keeping the list sorted by report date."""
+        bisect.insort(self.archives, metadata, key=_report_date)
+    
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -97,27 +128,102 @@ class ArchiveManager:
         self.archive_dir.mkdir(parents=True, exist_ok=True)
         
         self.index_file = self.archive_dir / "index.json"
+        # Append-only log of index changes since index.json was last written
+        self.wal_file = self.archive_dir / "index.wal"
+        self._wal_entries = 0
         self.index = self._load_index()
+        if self.wal_file.exists():
+            # Fold replayed changes into index.json and start a fresh log
+            self._save_index()
+        
+        # Guards the index, _by_id, the running totals and the WAL; archiving
+        # and cleanup run in pool threads while other calls run on the loop
+        self._lock = threading.Lock()
+        
+        # archive_id -> metadata, kept in sync with self.index.archives
+        self._by_id: dict[str, ArchiveMetadata] = {a.archive_id: a for a in self.index.archives}
+        
+        # Running totals for get_statistics, updated as archives come and go
+        self._total_size = sum(a.file_size for a in self.index.archives)
+        self._total_items = sum(a.total_items for a in self.index.archives)
     
     def _load_index(self) -> ArchiveIndex:
-        """Load archive index from file."""
-        if not self.index_file.exists():
-            return ArchiveIndex()
+        """Load archive index from file and replay logged changes."""
+        index = ArchiveIndex()
+        
+        if self.index_file.exists():
+            try:
+                index = ArchiveIndex.from_dict(json_loads(self.index_file.read_bytes()))
+            except Exception as e:
+                logger.error(f"Failed to load archive index: {e}")
+        
+        self._replay_wal(index)
+        return index
+    
+    def _replay_wal(self, index: ArchiveIndex):
+        """Apply changes logged in the index WAL on top of a loaded index."""
+        if not self.wal_file.exists():
+            return
+        
+        try:
+            lines = self.wal_file.read_bytes().splitlines()
+        except Exception as e:
+            logger.error(f"Failed to read archive index log: {e}")
+            return
+        
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                entry = json_loads(line)
+            except ValueError:
+                # A torn final line from an interrupted append
+                logger.warning("Skipping malformed archive index log entry")
+                continue
+            
+            if entry.get("op") == "add":
+                metadata = ArchiveMetadata.from_dict(entry["meta"])
+                index.archives = [a for a in index.archives if a.archive_id != metadata.archive_id]
+                index.add(metadata)
+            elif entry.get("op") == "del":
+                ids = set(entry.get("ids", []))
+                index.archives = [a for a in index.archives if a.archive_id not in ids]
+            self._wal_entries += 1
+    
+    def _log_change(self, entry: dict[str, Any]):
+        """
+        Record an index change by appending it to the WAL.
+        
+        The full index is rewritten only every WAL_COMPACT_THRESHOLD changes.
+        The caller holds self._lock.
         
+        Args:
+            entry: {"op": "add", "meta": {...}} or {"op": "del", "ids": [...]}
+        """
+        self.index.last_updated = datetime.now()
         try:
-            with open(self.index_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                return ArchiveIndex.from_dict(data)
+            with open(self.wal_file, "ab") as f:
+                f.write(json_dumps(entry) + b"\n")
+            self._wal_entries += 1
         except Exception as e:
-            logger.error(f"Failed to load archive index: {e}")
-            return ArchiveIndex()
+            logger.error(f"Failed to append archive index log: {e}")
+            self._save_index()
+            return
+        
+        if self._wal_entries >= WAL_COMPACT_THRESHOLD:
+            self._save_index()
     
     def _save_index(self):
-        """Save archive index to file."""
+        """Save the full archive index to file and reset the WAL."""
+        temp_path = self.index_file.with_suffix('.tmp')
         try:
             self.index.last_updated = datetime.now()
-            with open(self.index_file, "w", encoding="utf-8") as f:
-                json.dump(self.index.to_dict(), f, ensure_ascii=False, indent=2)
+            temp_path.write_bytes(json_dumps(self.index.to_dict(), indent=True))
+            temp_path.replace(self.index_file)
+            
+            # Logged changes are now part of index.json
+            self.wal_file.unlink(missing_ok=True)
+            self._wal_entries = 0
         except Exception as e:
             logger.error(f"Failed to save archive index: {e}")
     
@@ -145,9 +251,9 @@ class ArchiveManager:
             filename = f"report_{archive_id}.json"
             file_path = self.archive_dir / filename
             
-            # Save report
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(report.to_dict(), f, ensure_ascii=False, indent=2)
+            # Save report; the size written is the file size, no stat needed
+            data = json_dumps(report.to_dict(), indent=True)
+            file_path.write_bytes(data)
             
             # Create metadata
             metadata = ArchiveMetadata(
@@ -155,15 +261,23 @@ class ArchiveManager:
                 report_date=report.report_date,
                 archived_at=datetime.now(),
                 file_path=file_path,
-                file_size=file_path.stat().st_size,
+                file_size=len(data),
                 total_items=report.total_items,
                 bilibili_items=report.bilibili_items,
                 zhihu_items=report.zhihu_items
             )
             
             # Add to index
-            self.index.archives.append(metadata)
-            self._save_index()
+            with self._lock:
+                existing = self._by_id.get(archive_id)
+                if existing:
+                    # Archived concurrently while this copy was being written
+                    return existing
+                self.index.add(metadata)
+                self._by_id[archive_id] = metadata
+                self._total_size += metadata.file_size
+                self._total_items += metadata.total_items
+                self._log_change({"op": "add", "meta": metadata.to_dict()})
             
             logger.info(f"Archived report {archive_id} ({metadata.file_size} bytes)")
             
@@ -173,6 +287,20 @@ class ArchiveManager:
             logger.error(f"Failed to archive report: {e}", exc_info=True)
             return None
     
+    async def archive_report_async(self, report: DailyReport) -> ArchiveMetadata | None:
+        """
+        Archive a daily report without blocking the event loop.
+        
+        Args:
+            report: Daily report to archive
+            
+        Returns:
+            ArchiveMetadata if successful, None otherwise
+        """
+        # Serialization and file I/O run in thread pool
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self.archive_report, report)
+    
     def get_archive(self, archive_id: str) -> ArchiveMetadata | None:
         """
         Get archive metadata by ID.
@@ -183,10 +311,7 @@ class ArchiveManager:
         Returns:
             ArchiveMetadata if found, None otherwise
         """
-        for archive in self.index.archives:
-            if archive.archive_id == archive_id:
-                return archive
-        return None
+        return self._by_id.get(archive_id)
     
     def load_report(self, archive_id: str) -> DailyReport | None:
         """
@@ -204,13 +329,24 @@ class ArchiveManager:
             return None
         
         try:
-            with open(metadata.file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                return DailyReport.from_dict(data)
+            return DailyReport.from_dict(json_loads(metadata.file_path.read_bytes()))
         except Exception as e:
             logger.error(f"Failed to load report from archive: {e}")
             return None
     
+    async def load_report_async(self, archive_id: str) -> DailyReport | None:
+        """
+        Load a report from archive without blocking the event loop.
+        
+        Args:
+            archive_id: Archive ID
+            
+        Returns:
+            DailyReport if found, None otherwise
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self.load_report, archive_id)
+    
     def list_archives(
         self,
         start_date: datetime | None = None,
@@ -228,22 +364,19 @@ class ArchiveManager:
         Returns:
             List of archive metadata
         """
-        archives = self.index.archives
-        
-        # Filter by date range
-        if start_date:
-            archives = [a for a in archives if a.report_date >= start_date]
-        if end_date:
-            archives = [a for a in archives if a.report_date <= end_date]
-        
-        # Sort by date (newest first)
-        archives = sorted(archives, key=lambda a: a.report_date, reverse=True)
-        
-        # Apply limit
-        if limit:
-            archives = archives[:limit]
-        
-        return archives
+        with self._lock:
+            archives = self.index.archives
+            
+            # Filter by date range; the index is sorted, so bisect for the bounds
+            lo = bisect.bisect_left(archives, start_date, key=_report_date) if start_date else 0
+            hi = bisect.bisect_right(archives, end_date, key=_report_date) if end_date else len(archives)
+            
+            # Apply limit to the newest end of the range
+            if limit:
+                lo = max(lo, hi - limit)
+            
+            # Newest first
+            return archives[lo:hi][::-1]
     
     def delete_archive(self, archive_id: str) -> bool:
         """
@@ -260,22 +393,43 @@ class ArchiveManager:
             logger.warning(f"Archive {archive_id} not found")
             return False
         
+        if not self._delete_archive_file(metadata):
+            return False
+        
+        with self._lock:
+            self._remove_from_index({archive_id})
+            self._log_change({"op": "del", "ids": [archive_id]})
+        
+        logger.info(f"Deleted archive {archive_id}")
+        return True
+    
+    def _delete_archive_file(self, metadata: ArchiveMetadata) -> bool:
+        """
+        Delete an archive's report file without touching the index.
+        
+        Args:
+            metadata: Archive metadata
+            
+        Returns:
+            True if the file is gone, False if deletion failed
+        """
         try:
-            # Delete file
             if metadata.file_path.exists():
                 metadata.file_path.unlink()
-            
-            # Remove from index
-            self.index.archives = [a for a in self.index.archives if a.archive_id != archive_id]
-            self._save_index()
-            
-            logger.info(f"Deleted archive {archive_id}")
             return True
-            
         except Exception as e:
             logger.error(f"Failed to delete archive: {e}")
             return False
     
+    def _remove_from_index(self, archive_ids: set[str]):
+        """Remove archives from the in-memory index (the caller holds self._lock and saves it)."""
+        self.index.archives = [a for a in self.index.archives if a.archive_id not in archive_ids]
+        for archive_id in archive_ids:
+            metadata = self._by_id.pop(archive_id, None)
+            if metadata is not None:
+                self._total_size -= metadata.file_size
+                self._total_items -= metadata.total_items
+    
     def cleanup_old_archives(self, days: int = 90) -> int:
         """
         Delete archives older than specified days.
@@ -287,44 +441,69 @@ class ArchiveManager:
             Number of archives deleted
         """
         cutoff = datetime.now() - timedelta(days=days)
-        deleted_count = 0
         
-        for archive in list(self.index.archives):
-            if archive.report_date < cutoff:
-                if self.delete_archive(archive.archive_id):
-                    deleted_count += 1
+        with self._lock:
+            archives = list(self.index.archives)
+        
+        deleted_ids = {
+            archive.archive_id
+            for archive in archives
+            if archive.report_date < cutoff and self._delete_archive_file(archive)
+        }
+        deleted_count = len(deleted_ids)
         
         if deleted_count > 0:
+            # Update and log the index once for the whole batch
+            with self._lock:
+                self._remove_from_index(deleted_ids)
+                self._log_change({"op": "del", "ids": sorted(deleted_ids)})
             logger.info(f"Cleaned up {deleted_count} old archives (older than {days} days)")
         
         return deleted_count
     
+    async def cleanup_old_archives_async(self, days: int = 90) -> int:
+        """
+        Delete old archives without blocking the event loop.
+        
+        Args:
+            days: Number of days to keep
+            
+        Returns:
+            Number of archives deleted
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self.cleanup_old_archives, days)
+    
     def get_statistics(self) -> dict[str, Any]:
         """
         Get archive statistics.
         
+        Totals are maintained as archives are added and removed, and the
+        index is sorted by date, so this does not scan the index.
+        
         Returns:
             Dictionary with statistics
         """
-        if not self.index.archives:
-            return {
-                "total_archives": 0,
-                "total_size_bytes": 0,
-                "total_items": 0,
-                "date_range": None
+        with self._lock:
+            archives = self.index.archives
+            if not archives:
+                return {
+                    "total_archives": 0,
+                    "total_size_bytes": 0,
+                    "total_items": 0,
+                    "date_range": None
+                }
+            
+            total_archives = len(archives)
+            total_size = self._total_size
+            total_items = self._total_items
+            date_range = {
+                "earliest": archives[0].report_date_str,
+                "latest": archives[-1].report_date_str
             }
         
-        total_size = sum(a.file_size for a in self.index.archives)
-        total_items = sum(a.total_items for a in self.index.archives)
-        
-        dates = [a.report_date for a in self.index.archives]
-        date_range = {
-            "earliest": min(dates).strftime("%Y-%m-%d"),
-            "latest": max(dates).strftime("%Y-%m-%d")
-        }
-        
         return {
-            "total_archives": len(self.index.archives),
+            "total_archives": total_archives,
             "total_size_bytes": total_size,
             "total_size_mb": round(total_size / 1024 / 1024, 2),
             "total_items": total_items,
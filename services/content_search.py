@@ -7,15 +7,123 @@ including keyword search, category filtering, source filtering, and date range q
 from __future__ import annotations
 
 import logging
+import re
+from collections import Counter, OrderedDict, defaultdict
 from datetime import datetime, timedelta
 from typing import Any, Literal, Sequence
 from dataclasses import dataclass, field
+from functools import lru_cache
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None  # type: ignore
 
 from models.report import ContentItem, ContentSource, ContentCategory
 
 
 logger = logging.getLogger(__name__)
 
+# Item fields that keyword search can look in
+SEARCH_FIELDS = ("title", "summary", "author")
+
+# Relevance weight of a keyword match in each field
+FIELD_WEIGHTS = {"title": 3.0, "summary": 1.5, "author": 1.0}
+
+# Number of distinct queries whose results are kept between searches
+SEARCH_CACHE_SIZE = 64
+
+# Small integer codes for enum members in the filter columns
+_CATEGORY_IDS = {category: i for i, category in enumerate(ContentCategory)}
+_SOURCE_IDS = {source: i for i, source in enumerate(ContentSource)}
+
+
+def _index_terms(text: str) -> set[str]:
+    """
+    Get the inverted-index terms of a text: its characters and character bigrams.
+    
+    Indexing characters rather than words keeps substring matching exact for
+    Chinese text, which has no spaces to split on.
+    
+    Args:
+        text: Lowercased text
+        
+    Returns:
+        Set of index terms
+    """
+    terms = set(text)
+    terms.update(text[i:i + 2] for i in range(len(text) - 1))
+    return terms
+
+
+def _keyword_terms(keyword: str) -> set[str]:
+    """
+    Get the index terms every text containing keyword must also contain.
+    
+    Args:
+        keyword: Lowercased, non-empty keyword
+        
+    Returns:
+        Set of index terms
+    """
+    if len(keyword) == 1:
+        return {keyword}
+    return {keyword[i:i + 2] for i in range(len(keyword) - 1)}
+
+
+@lru_cache(maxsize=128)
+def _keyword_pattern(keywords: tuple[str, ...]) -> re.Pattern[str] | None:
+    """
+    Compile keywords into one alternation that counts them all in a single scan.
+    
+    The scan only gives the same per-keyword counts as str.count when no two
+    occurrences of different keywords can overlap, i.e. no keyword contains
+    another and no keyword ends with the start of another.
+    
+    Args:
+        keywords: Search keywords
+        
+    Returns:
+        Compiled pattern, or None if keywords should be counted one by one
+    """
+    distinct = set(keywords)
+    if len(distinct) < 2 or "" in distinct:
+        return None
+    
+    for a in distinct:
+        for b in distinct:
+            if a == b:
+                continue
+            if b in a or any(b.startswith(a[i:]) for i in range(1, len(a))):
+                return None
+    
+    return re.compile("|".join(map(re.escape, distinct)))
+
+
+@dataclass(slots=True)
+class _PreparedKeywords:
+    """Query keywords normalized once per search rather than once per item."""
+    
+    keywords: list[str]
+    pattern: re.Pattern[str] | None
+    
+    @classmethod
+    def from_query(cls, keywords: list[str], case_sensitive: bool) -> _PreparedKeywords:
+        """
+        Normalize keywords for scoring.
+        
+        Args:
+            keywords: Search keywords
+            case_sensitive: Whether search is case-sensitive
+            
+        Returns:
+            Prepared keywords
+        """
+        search_keywords = keywords if case_sensitive else [k.lower() for k in keywords]
+        return cls(keywords=search_keywords, pattern=_keyword_pattern(tuple(search_keywords)))
+
 
 @dataclass
 class SearchQuery:
@@ -43,6 +151,29 @@ class SearchQuery:
     # Pagination
     limit: int = 20
     offset: int = 0
+    
+    def cache_key(self) -> tuple:
+        """
+        Get a hashable key identifying the results of this query before pagination.
+        
+        Queries that differ only in keyword order or offset/limit share a key.
+        
+        Returns:
+            Tuple of the canonicalized query fields
+        """
+        return (
+            tuple(sorted(self.keywords)),
+            frozenset(self.search_in),
+            self.case_sensitive,
+            frozenset(self.categories),
+            frozenset(self.sources),
+            self.min_importance,
+            self.max_importance,
+            self.start_date,
+            self.end_date,
+            self.sort_by,
+            self.sort_order
+        )
 
 
 @dataclass
@@ -58,12 +189,120 @@ class SearchResult:
         return self.relevance_score < other.relevance_score
 
 
+@dataclass(slots=True)
+class _FilterColumns:
+    """Filterable item attributes stored column-wise, parallel to the content index."""
+    
+    importance: Any  # float64 array
+    category: Any  # int8 array of _CATEGORY_IDS codes
+    source: Any  # int8 array of _SOURCE_IDS codes
+    published: Any  # datetime64[us] array, NaT when unknown
+    
+    @classmethod
+    def from_items(cls, items: Sequence[ContentItem]) -> _FilterColumns:
+        """Build columns from content items."""
+        count = len(items)
+        return cls(
+            importance=np.fromiter((item.importance_score for item in items), dtype=np.float64, count=count),
+            category=np.fromiter((_CATEGORY_IDS[item.category] for item in items), dtype=np.int8, count=count),
+            source=np.fromiter((_SOURCE_IDS[item.source] for item in items), dtype=np.int8, count=count),
+            published=np.array([item.published for item in items], dtype="datetime64[us]")
+        )
+
+
 class ContentSearchEngine:
     """Search engine for content items with advanced filtering."""
     
     def __init__(self):
         """Initialize search engine."""
         self.content_index: list[ContentItem] = []
+        
+        # Lowercased search fields per item, parallel to content_index
+        self._lowered_fields: list[dict[str, str]] = []
+        # Inverted index: term -> positions in content_index of items containing it
+        self._postings: defaultdict[str, set[int]] = defaultdict(set)
+        # Column-wise filter attributes, rebuilt lazily after the index changes
+        self._columns: _FilterColumns | None = None
+        # Sorted, unpaginated results of recent queries (LRU order)
+        self._result_cache: OrderedDict[tuple, list[SearchResult]] = OrderedDict()
+        
+        # Rolling statistics, maintained as items are indexed
+        self._by_source: Counter[str] = Counter()
+        self._by_category: Counter[str] = Counter()
+        self._earliest: datetime | None = None
+        self._latest: datetime | None = None
+    
+    def _update_statistics(self, items: list[ContentItem]):
+        """Fold newly indexed items into the rolling statistics."""
+        self._by_source.update(item.source.value for item in items)
+        self._by_category.update(item.category.value for item in items)
+        
+        for item in items:
+            published = item.published
+            if published is None:
+                continue
+            if self._earliest is None or published < self._earliest:
+                self._earliest = published
+            if self._latest is None or published > self._latest:
+                self._latest = published
+    
+    def _reset_statistics(self):
+        """Reset the rolling statistics."""
+        self._by_source.clear()
+        self._by_category.clear()
+        self._earliest = None
+        self._latest = None
+    
+    def _index_items(self, start: int, items: Sequence[ContentItem]):
+        """
+        Lowercase the search fields of items and add them to the inverted index.
+        
+        Args:
+            start: Position in content_index of the first item
+            items: Items to index
+        """
+        postings = self._postings
+        for item_id, item in enumerate(items, start):
+            lowered = {
+                name: value.lower()
+                for name in SEARCH_FIELDS
+                if (value := getattr(item, name))
+            }
+            self._lowered_fields.append(lowered)
+            
+            # Index every searchable field; candidates are verified when scored
+            for term in _index_terms("\n".join(lowered.values())):
+                postings[term].add(item_id)
+    
+    def _candidate_ids(self, keywords: list[str]) -> set[int] | None:
+        """
+        Find items that may contain at least one of the keywords.
+        
+        Args:
+            keywords: Search keywords
+            
+        Returns:
+            Positions of candidate items, or None if every item is a candidate
+        """
+        candidates: set[int] = set()
+        for keyword in keywords:
+            keyword = keyword.lower()
+            if not keyword:
+                return None
+            
+            postings = [self._postings.get(term) for term in _keyword_terms(keyword)]
+            if not all(postings):
+                # Some term occurs nowhere, so no item contains this keyword
+                continue
+            
+            postings.sort(key=len)
+            candidates |= postings[0].intersection(*postings[1:])
+        return candidates
+    
+    def _invalidate(self):
+        """Drop data derived from the index after it changes."""
+        self._columns = None
+        self._result_cache.clear()
     
     def index_content(self, items: list[ContentItem]):
         """
@@ -72,12 +311,20 @@ class ContentSearchEngine:
         Args:
             items: Content items to index
         """
+        start = len(self.content_index)
         self.content_index.extend(items)
+        self._index_items(start, items)
+        self._invalidate()
+        self._update_statistics(items)
         logger.info(f"Indexed {len(items)} content items (total: {len(self.content_index)})")
     
     def clear_index(self):
         """Clear all indexed content."""
         self.content_index.clear()
+        self._lowered_fields.clear()
+        self._postings.clear()
+        self._invalidate()
+        self._reset_statistics()
         logger.info("Search index cleared")
     
     def remove_old_content(self, days: int = 30):
@@ -97,6 +344,14 @@ class ContentSearchEngine:
         
         removed = original_count - len(self.content_index)
         if removed > 0:
+            # Positions shifted and earliest/latest may have been removed,
+            # so rebuild the index and statistics from what is left
+            self._lowered_fields.clear()
+            self._postings.clear()
+            self._index_items(0, self.content_index)
+            self._invalidate()
+            self._reset_statistics()
+            self._update_statistics(self.content_index)
             logger.info(f"Removed {removed} old content items (older than {days} days)")
     
     def _calculate_relevance(
@@ -104,7 +359,9 @@ class ContentSearchEngine:
         item: ContentItem,
         keywords: list[str],
         search_in: Sequence[str],
-        case_sensitive: bool
+        case_sensitive: bool,
+        lowered: dict[str, str] | None = None,
+        prepared: _PreparedKeywords | None = None
     ) -> tuple[float, list[str]]:
         """
         Calculate relevance score for an item based on keyword matches.
@@ -114,6 +371,8 @@ class ContentSearchEngine:
             keywords: Search keywords
             search_in: Fields to search in
             case_sensitive: Whether search is case-sensitive
+            lowered: Precomputed lowercased search fields of the item
+            prepared: Keywords already normalized for this query
             
         Returns:
             Tuple of (relevance_score, matched_fields)
@@ -125,29 +384,40 @@ class ContentSearchEngine:
         matched_fields = []
         
         # Prepare search text
-        search_texts = {}
-        if "title" in search_in and item.title:
-            search_texts["title"] = item.title if case_sensitive else item.title.lower()
-        if "summary" in search_in and item.summary:
-            search_texts["summary"] = item.summary if case_sensitive else item.summary.lower()
-        if "author" in search_in and item.author:
-            search_texts["author"] = item.author if case_sensitive else item.author.lower()
+        if not case_sensitive and lowered is not None:
+            search_texts = {name: text for name, text in lowered.items() if name in search_in}
+        else:
+            search_texts = {}
+            if "title" in search_in and item.title:
+                search_texts["title"] = item.title if case_sensitive else item.title.lower()
+            if "summary" in search_in and item.summary:
+                search_texts["summary"] = item.summary if case_sensitive else item.summary.lower()
+            if "author" in search_in and item.author:
+                search_texts["author"] = item.author if case_sensitive else item.author.lower()
         
         # Prepare keywords
-        search_keywords = keywords if case_sensitive else [k.lower() for k in keywords]
+        if prepared is None:
+            prepared = _PreparedKeywords.from_query(keywords, case_sensitive)
+        search_keywords = prepared.keywords
+        pattern = prepared.pattern
         
         # Calculate score based on matches
         for field_name, text in search_texts.items():
             field_score = 0.0
             field_matched = False
             
-            for keyword in search_keywords:
-                # Count occurrences
-                count = text.count(keyword)
+            # Count occurrences of every keyword
+            if pattern is not None:
+                occurrences = Counter(pattern.findall(text))
+                counts = [occurrences[keyword] for keyword in search_keywords]
+            else:
+                counts = [text.count(keyword) for keyword in search_keywords]
+            
+            # Weight by field importance
+            field_weight = FIELD_WEIGHTS.get(field_name, 1.0)
+            for count in counts:
                 if count > 0:
                     field_matched = True
-                    # Weight by field importance
-                    field_weight = {"title": 3.0, "summary": 1.5, "author": 1.0}.get(field_name, 1.0)
                     # Add score (diminishing returns for multiple occurrences)
                     field_score += field_weight * (1.0 + 0.5 * min(count - 1, 3))
             
@@ -195,6 +465,47 @@ class ContentSearchEngine:
         
         return True
     
+    def _filter_mask(self, query: SearchQuery) -> Any:
+        """
+        Evaluate the filter criteria of a query over the whole index at once.
+        
+        Vectorized equivalent of _matches_filters.
+        
+        Args:
+            query: Search query with filters
+            
+        Returns:
+            Boolean array marking matching items, or None if the query has no filters
+        """
+        if self._columns is None:
+            self._columns = _FilterColumns.from_items(self.content_index)
+        columns = self._columns
+        mask = None
+        
+        def restrict(condition):
+            nonlocal mask
+            mask = condition if mask is None else mask & condition
+        
+        # Category and source filters
+        if query.categories:
+            restrict(np.isin(columns.category, [_CATEGORY_IDS[c] for c in query.categories]))
+        if query.sources:
+            restrict(np.isin(columns.source, [_SOURCE_IDS[s] for s in query.sources]))
+        
+        # Importance filter
+        if query.min_importance is not None:
+            restrict(columns.importance >= query.min_importance)
+        if query.max_importance is not None:
+            restrict(columns.importance <= query.max_importance)
+        
+        # Date range filter; NaT compares false, so undated items pass
+        if query.start_date:
+            restrict(~(columns.published < np.datetime64(query.start_date, "us")))
+        if query.end_date:
+            restrict(~(columns.published > np.datetime64(query.end_date, "us")))
+        
+        return mask
+    
     def search(self, query: SearchQuery) -> list[SearchResult]:
         """
         Search content with advanced filtering and ranking.
@@ -205,12 +516,73 @@ class ContentSearchEngine:
         Returns:
             List of search results sorted by relevance
         """
+        # Repeated queries and re-pagination reuse the sorted results
+        cache_key = query.cache_key()
+        results = self._result_cache.get(cache_key)
+        if results is not None:
+            self._result_cache.move_to_end(cache_key)
+        else:
+            results = self._execute(query)
+            self._result_cache[cache_key] = results
+            if len(self._result_cache) > SEARCH_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+        
+        # Apply pagination
+        start = query.offset
+        end = start + query.limit
+        paginated_results = results[start:end]
+        
+        logger.info(
+            f"Search completed: {len(results)} results found, "
+            f"returning {len(paginated_results)} (offset={query.offset}, limit={query.limit})"
+        )
+        
+        return paginated_results
+    
+    def _execute(self, query: SearchQuery) -> list[SearchResult]:
+        """
+        Filter, score and sort the index for a query.
+        
+        Args:
+            query: Search query parameters
+            
+        Returns:
+            All matching results, sorted but not paginated
+        """
         results: list[SearchResult] = []
         
+        # Only items that can contain a keyword need to be filtered and scored
+        item_ids: Sequence[int] = range(len(self.content_index))
+        if query.keywords:
+            candidate_ids = self._candidate_ids(query.keywords)
+            if candidate_ids is not None:
+                if not candidate_ids:
+                    # No item contains any keyword; skip filtering entirely
+                    return []
+                item_ids = sorted(candidate_ids)
+        
+        # Apply filters to all candidates at once when NumPy is available
+        filtered = False
+        if NUMPY_AVAILABLE:
+            mask = self._filter_mask(query)
+            if mask is not None:
+                if isinstance(item_ids, range):
+                    item_ids = np.flatnonzero(mask).tolist()
+                else:
+                    ids = np.fromiter(item_ids, dtype=np.intp, count=len(item_ids))
+                    item_ids = ids[mask[ids]].tolist()
+            filtered = True
+        
+        content_index = self.content_index
+        lowered_fields = self._lowered_fields
+        prepared = _PreparedKeywords.from_query(query.keywords, query.case_sensitive)
+        
         # Filter and score items
-        for item in self.content_index:
+        for item_id in item_ids:
+            item = content_index[item_id]
+            
             # Apply filters
-            if not self._matches_filters(item, query):
+            if not filtered and not self._matches_filters(item, query):
                 continue
             
             # Calculate relevance
@@ -218,7 +590,9 @@ class ContentSearchEngine:
                 item,
                 query.keywords,
                 query.search_in,
-                query.case_sensitive
+                query.case_sensitive,
+                lowered_fields[item_id],
+                prepared
             )
             
             # Skip items with no keyword matches (if keywords provided)
@@ -244,64 +618,28 @@ class ContentSearchEngine:
                 reverse=(query.sort_order == "desc")
             )
         
-        # Apply pagination
-        start = query.offset
-        end = start + query.limit
-        paginated_results = results[start:end]
-        
-        logger.info(
-            f"Search completed: {len(results)} results found, "
-            f"returning {len(paginated_results)} (offset={query.offset}, limit={query.limit})"
-        )
-        
-        return paginated_results
+        return results
     
     def get_statistics(self) -> dict[str, Any]:
         """
         Get statistics about indexed content.
         
+        Statistics are maintained incrementally as content is indexed,
+        so this does not scan the index.
+        
         Returns:
             Dictionary with statistics
         """
-        if not self.content_index:
-            return {
-                "total_items": 0,
-                "by_source": {},
-                "by_category": {},
-                "date_range": None
+        date_range: dict[str, str] | None = None
+        if self._earliest is not None and self._latest is not None:
+            date_range = {
+                "earliest": self._earliest.isoformat(),
+                "latest": self._latest.isoformat()
             }
         
-        # Count by source
-        by_source: dict[str, int] = {}
-        for item in self.content_index:
-            source = item.source.value
-            by_source[source] = by_source.get(source, 0) + 1
-
-        # Count by category
-        by_category: dict[str, int] = {}
-        for item in self.content_index:
-            category = item.category.value
-            by_category[category] = by_category.get(category, 0) + 1
-
-        # Date range
-        items_with_dates = [item for item in self.content_index if item.published]
-        date_range: dict[str, str] | None
-        if items_with_dates:
-            dates = [item.published for item in items_with_dates if item.published is not None]
-            if dates:
-                date_range = {
-                    "earliest": min(dates).isoformat(),
-                    "latest": max(dates).isoformat()
-                }
-            else:
-                date_range = None
-        else:
-            date_range = None
-        
         return {
             "total_items": len(self.content_index),
-            "by_source": by_source,
-            "by_category": by_category,
+            "by_source": dict(self._by_source),
+            "by_category": dict(self._by_category),
             "date_range": date_range
         }
-
@@ -6,24 +6,96 @@ visualizations, and multiple output formats.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
+import re
+from collections import Counter
+from collections.abc import Callable
 
-from models.report import DailyReport, DailyReportConfig, ContentCategory, CategorySection
+from models.report import DailyReport, DailyReportConfig, ContentCategory, ContentSource, CategorySection, ContentItem
 from utils.openrouter_client import summarize_batch, ORSummaryOptions
 from utils.chart_generator import ChartGenerator, ChartConfig, is_available as chart_available
 
 
 logger = logging.getLogger(__name__)
 
+# Markdown syntax removed by the plain text format; "---" rules become "=" lines
+_MD_STRIP_RE = re.compile(r"#|\*\*|`|---")
+_TEXT_RULE = "=" * 50
+
+
+def _strip_markdown_token(match: re.Match[str]) -> str:
+    """Replacement for a _MD_STRIP_RE match."""
+    return _TEXT_RULE if match.group() == "---" else ""
+
+
+# Trending topic tokens: runs of up to four CJK characters, Latin words and numbers
+_CJK_TOKEN_RE = re.compile(r"[\u4e00-\u9fff]{2,4}|[A-Za-z]{2,}|\d+")
+
+# Display order of category sections; unknown categories go last
+_CATEGORY_ORDER: dict[ContentCategory, int] = {
+    ContentCategory.TECHNOLOGY: 0,
+    ContentCategory.NEWS: 1,
+    ContentCategory.EDUCATION: 2,
+    ContentCategory.ENTERTAINMENT: 3,
+    ContentCategory.LIFESTYLE: 4,
+    ContentCategory.OTHER: 5
+}
+
+
+def _section_order(section: CategorySection) -> int:
+    """Sort key placing sections in _CATEGORY_ORDER."""
+    return _CATEGORY_ORDER.get(section.category, len(_CATEGORY_ORDER))
+
+
+
+def _bilibili_data_line(item: ContentItem) -> str:
+    """Format view and like counts of a Bilibili item."""
+    view_count = item.source_data.get('view_count')
+    like_count = item.source_data.get('like_count')
+    if not (view_count or like_count):
+        return ""
+    stats = []
+    if view_count:
+        stats.append(f"👁️ {view_count}")
+    if like_count:
+        stats.append(f"👍 {like_count}")
+    return f"📊 **数据**: {' · '.join(stats)}\n"
+
+
+def _zhihu_data_line(item: ContentItem) -> str:
+    """Format the number of Bilibili videos linked from a Zhihu item."""
+    bilibili_links = item.source_data.get('bilibili_links', [])
+    if not bilibili_links:
+        return ""
+    return f"📺 **包含B站视频**: {len(bilibili_links)} 个\n"
+
+
+# Source-specific Markdown data line of an item, ending in a newline
+_SOURCE_DATA_LINES: dict[ContentSource, Callable[[ContentItem], str]] = {
+    ContentSource.BILIBILI: _bilibili_data_line,
+    ContentSource.ZHIHU: _zhihu_data_line
+}
 
 class DailyReportGenerator:
     """Generates AI-powered daily reports from aggregated content with visualizations."""
 
+    # Section headings by category
+    _CATEGORY_NAMES: dict[ContentCategory, str] = {
+        ContentCategory.TECHNOLOGY: "💻 技术",
+        ContentCategory.ENTERTAINMENT: "🎮 娱乐",
+        ContentCategory.EDUCATION: "📚 教育",
+        ContentCategory.NEWS: "📰 新闻",
+        ContentCategory.LIFESTYLE: "🌟 生活",
+        ContentCategory.OTHER: "📌 其他"
+    }
+
     def __init__(
         self,
         openrouter_api_key: str | None = None,
         enable_ai: bool = True,
-        chart_config: ChartConfig | None = None
+        chart_config: ChartConfig | None = None,
+        max_concurrency: int = 8
     ):
         """
         Initialize daily report generator.
@@ -32,9 +104,17 @@ class DailyReportGenerator:
             openrouter_api_key: OpenRouter API key for AI summaries
             enable_ai: Whether to enable AI features
             chart_config: Configuration for chart generation
+            max_concurrency: Maximum number of OpenRouter requests in flight
+                across all reports
         """
         self.openrouter_api_key = openrouter_api_key
         self.enable_ai = enable_ai and openrouter_api_key is not None
+        
+        # Shared by every summary batch so concurrent reports respect one limit
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        # (report, config, markdown) of the last Markdown rendering
+        self._markdown_cache: tuple[DailyReport, DailyReportConfig, str] | None = None
 
         # Initialize chart generator if available and enabled
         self.chart_generator: ChartGenerator | None = None
@@ -50,19 +130,16 @@ class DailyReportGenerator:
         if not self.enable_ai:
             logger.warning("AI features disabled (no API key provided)")
     
-    async def generate_section_summary(self, section: CategorySection) -> str | None:
+    def _build_section_prompt(self, section: CategorySection) -> str | None:
         """
-        Generate AI summary for a category section.
+        Build the summarization prompt for a category section.
         
         Args:
             section: Category section to summarize
             
         Returns:
-            AI-generated summary or None if AI disabled
+            Prompt text, or None if the section is empty
         """
-        if not self.enable_ai or not self.openrouter_api_key:
-            return None
-        
         if not section.items:
             return None
         
@@ -75,38 +152,18 @@ class DailyReportGenerator:
             content_texts.append(text)
         
         combined_text = "\n\n".join(content_texts)
-        
-        # Generate summary
-        try:
-            options = ORSummaryOptions(
-                api_key=self.openrouter_api_key,
-                max_tokens=200,
-                temperature=0.7
-            )
-            
-            prompt = f"请为以下{section.category.value}类别的内容生成一个简洁的总结（100字以内）：\n\n{combined_text}"
-
-            results = await summarize_batch([(None, prompt)], options)
-            if results and results[0]:
-                return results[0].get("summary")
-        except Exception as e:
-            logger.error(f"Failed to generate section summary: {e}")
-        
-        return None
+        return f"请为以下{section.category.value}类别的内容生成一个简洁的总结（100字以内）：\n\n{combined_text}"
     
-    async def generate_executive_summary(self, report: DailyReport) -> str | None:
+    def _build_executive_prompt(self, report: DailyReport) -> str | None:
         """
-        Generate executive summary for the entire report.
+        Build the executive summary prompt for the entire report.
         
         Args:
             report: Daily report
             
         Returns:
-            AI-generated executive summary or None if AI disabled
+            Prompt text, or None if the report is empty
         """
-        if not self.enable_ai or not self.openrouter_api_key:
-            return None
-        
         if report.total_items == 0:
             return None
         
@@ -128,26 +185,100 @@ class DailyReportGenerator:
                 )
         
         combined_text = overview + "\n".join(category_summaries)
+        return f"请为以下每日内容汇总生成一个执行摘要（150字以内），突出重点和趋势：\n\n{combined_text}"
+    
+    async def close(self) -> None:
+        """Shut down chart worker processes."""
+        if self.chart_generator:
+            self.chart_generator.close()
+    
+    async def _summarize_prompts(self, prompts: list[str], max_tokens: int) -> list[str | None]:
+        """
+        Summarize several prompts with one concurrent batch request.
+        
+        Args:
+            prompts: Prompts to send
+            max_tokens: Token limit per answer
+            
+        Returns:
+            Summary per prompt, None where generation failed
+        """
+        options = ORSummaryOptions(
+            api_key=self.openrouter_api_key,
+            max_tokens=max_tokens,
+            temperature=0.7
+        )
         
-        # Generate summary
         try:
-            options = ORSummaryOptions(
-                api_key=self.openrouter_api_key,
-                max_tokens=300,
-                temperature=0.7
+            results = await summarize_batch(
+                [(None, prompt) for prompt in prompts],
+                options,
+                return_exceptions=True,
+                semaphore=self._semaphore
             )
-            
-            prompt = f"请为以下每日内容汇总生成一个执行摘要（150字以内），突出重点和趋势：\n\n{combined_text}"
-
-            results = await summarize_batch([(None, prompt)], options)
-            if results and results[0]:
-                return results[0].get("summary")
         except Exception as e:
-            logger.error(f"Failed to generate executive summary: {e}")
+            logger.error(f"Failed to generate summaries: {e}")
+            return [None] * len(prompts)
+        
+        summaries = []
+        for result in results:
+            if result.get("error"):
+                logger.error(f"Failed to generate summary: {result['error']}")
+            summaries.append(result.get("summary"))
+        return summaries
+    
+    async def generate_section_summary(self, section: CategorySection) -> str | None:
+        """
+        Generate AI summary for a category section.
+        
+        Args:
+            section: Category section to summarize
+            
+        Returns:
+            AI-generated summary or None if AI disabled
+        """
+        if not self.enable_ai or not self.openrouter_api_key:
+            return None
+        
+        prompt = self._build_section_prompt(section)
+        if prompt is None:
+            return None
+        
+        return (await self._summarize_prompts([prompt], max_tokens=200))[0]
+    
+    async def generate_executive_summary(self, report: DailyReport) -> str | None:
+        """
+        Generate executive summary for the entire report.
         
-        return None
+        Args:
+            report: Daily report
+            
+        Returns:
+            AI-generated executive summary or None if AI disabled
+        """
+        if not self.enable_ai or not self.openrouter_api_key:
+            return None
+        
+        prompt = self._build_executive_prompt(report)
+        if prompt is None:
+            return None
+        
+        return (await self._summarize_prompts([prompt], max_tokens=300))[0]
     
     async def extract_trending_topics(self, report: DailyReport) -> list[str]:
+        """
+        Extract trending topics from report content without blocking the event loop.
+        
+        Args:
+            report: Daily report
+            
+        Returns:
+            List of trending topics
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self._extract_trending_sync, report)
+    
+    def _extract_trending_sync(self, report: DailyReport) -> list[str]:
         """
         Extract trending topics from report content.
         
@@ -157,19 +288,71 @@ class DailyReportGenerator:
         Returns:
             List of trending topics
         """
-        # Simple keyword extraction (could be enhanced with AI)
-        word_freq: dict[str, int] = {}
+        # Reposts share titles, so split each distinct title only once
+        return self._trending_from_titles(Counter(item.title for item in report.iter_items()))
+    
+    def _trending_from_titles(self, title_freq: Counter[str]) -> list[str]:
+        """
+        Extract trending topics from counted item titles.
         
-        for item in report.get_all_items():
-            # Extract words from title
-            words = item.title.split()
-            for word in words:
-                if len(word) >= 2:  # Ignore single characters
-                    word_freq[word] = word_freq.get(word, 0) + 1
+        Args:
+            title_freq: Number of items per distinct title
+            
+        Returns:
+            List of trending topics
+        """
+        # Simple keyword extraction from titles (could be enhanced with AI);
+        # Chinese titles have no spaces, so tokenize with a regex rather than split(),
+        # ignoring single characters
+        word_freq: Counter[str] = Counter()
+        for title, count in title_freq.items():
+            for word in _CJK_TOKEN_RE.findall(title):
+                if len(word) >= 2:
+                    word_freq[word] += count
         
         # Get top trending words
-        trending = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-        return [word for word, _ in trending[:10]]
+        return [word for word, _ in word_freq.most_common(10)]
+    
+    async def _generate_summaries(
+        self,
+        report: DailyReport,
+        section_prompts: list[tuple[CategorySection, str]]
+    ):
+        """
+        Generate all section summaries and the executive summary of a report.
+        
+        Every prompt is sent in a single summarize_batch call so the requests
+        run concurrently instead of one after another.
+        
+        Args:
+            report: Daily report to fill in
+            section_prompts: (section, prompt) for every non-empty section
+        """
+        for section in report.sections:
+            section.ai_summary = None
+        report.executive_summary = None
+        
+        if not self.enable_ai or not self.openrouter_api_key:
+            return
+        
+        # Section each prompt belongs to; None marks the executive summary
+        targets: list[CategorySection | None] = [section for section, _ in section_prompts]
+        prompts: list[str] = [prompt for _, prompt in section_prompts]
+        
+        executive_prompt = self._build_executive_prompt(report)
+        if executive_prompt is not None:
+            targets.append(None)
+            prompts.append(executive_prompt)
+        
+        if not prompts:
+            return
+        
+        summaries = await self._summarize_prompts(prompts, max_tokens=300)
+        for target, summary in zip(targets, summaries):
+            if target is None:
+                report.executive_summary = summary
+            else:
+                target.ai_summary = summary
     
     async def enhance_report(
         self,
@@ -186,18 +369,41 @@ class DailyReportGenerator:
         Returns:
             Enhanced report
         """
-        # Generate section summaries
-        if config.generate_ai_summary:
-            for section in report.sections:
-                section.ai_summary = await self.generate_section_summary(section)
+        # The report is about to change
+        self._markdown_cache = None
         
-        # Generate executive summary
-        if config.generate_ai_summary:
-            report.executive_summary = await self.generate_executive_summary(report)
+        # Without AI only the trending topics need the items
+        if not self.enable_ai or not self.openrouter_api_key:
+            if config.generate_ai_summary:
+                await self._generate_summaries(report, [])
+            if config.include_trending:
+                report.trending_topics = await self.extract_trending_topics(report)
+            return report
+        
+        # One pass over the sections collects summary prompts and counts titles
+        # for trending topics
+        section_prompts: list[tuple[CategorySection, str]] = []
+        title_freq: Counter[str] = Counter()
+        for section in report.sections:
+            if config.include_trending:
+                title_freq.update(item.title for item in section.items)
+            if config.generate_ai_summary:
+                prompt = self._build_section_prompt(section)
+                if prompt is not None:
+                    section_prompts.append((section, prompt))
         
-        # Extract trending topics
+        # Tokenize titles in the thread pool while summaries are requested
+        trending_task = None
         if config.include_trending:
-            report.trending_topics = await self.extract_trending_topics(report)
+            loop = asyncio.get_event_loop()
+            trending_task = loop.run_in_executor(None, self._trending_from_titles, title_freq)
+        
+        # Generate section and executive summaries in one batch
+        if config.generate_ai_summary:
+            await self._generate_summaries(report, section_prompts)
+        
+        if trending_task is not None:
+            report.trending_topics = await trending_task
         
         return report
     
@@ -205,6 +411,9 @@ class DailyReportGenerator:
         """
         Format report as Markdown.
         
+        The last rendering is reused when the same report and config are
+        formatted again, until the report is enhanced or generated anew.
+        
         Args:
             report: Daily report
             config: Report configuration
@@ -212,6 +421,16 @@ class DailyReportGenerator:
         Returns:
             Markdown-formatted report
         """
+        cached = self._markdown_cache
+        if cached is not None and cached[0] is report and cached[1] is config:
+            return cached[2]
+        
+        markdown = self._render_markdown(report, config)
+        self._markdown_cache = (report, config, markdown)
+        return markdown
+    
+    def _render_markdown(self, report: DailyReport, config: DailyReportConfig) -> str:
+        """Render report as Markdown."""
         lines = [
             f"# {report.title}",
             "",
@@ -252,19 +471,12 @@ class DailyReportGenerator:
         
         lines.append("---\n")
         
-        # Category sections
-        for section in report.sections:
+        # Category sections, in a fixed display order
+        for section in sorted(report.sections, key=_section_order):
             if not section.items:
                 continue
             
-            category_name = {
-                ContentCategory.TECHNOLOGY: "💻 技术",
-                ContentCategory.ENTERTAINMENT: "🎮 娱乐",
-                ContentCategory.EDUCATION: "📚 教育",
-                ContentCategory.NEWS: "📰 新闻",
-                ContentCategory.LIFESTYLE: "🌟 生活",
-                ContentCategory.OTHER: "📌 其他"
-            }.get(section.category, section.category.value)
+            category_name = self._CATEGORY_NAMES.get(section.category, section.category.value)
             
             lines.extend([
                 f"## {category_name}",
@@ -278,45 +490,25 @@ class DailyReportGenerator:
                     ""
                 ])
             
-            # Items
+            # Items, one block of lines each
             for idx, item in enumerate(section.items, 1):
                 # Highlight important items
-                if config.highlight_important and item.importance_score >= 0.7:
-                    lines.append(f"### ⭐ {idx}. {item.title}")
-                else:
-                    lines.append(f"### {idx}. {item.title}")
-                
-                lines.append("")
-                
-                if item.author:
-                    lines.append(f"👤 **作者**: {item.author}")
+                marker = "⭐ " if config.highlight_important and item.importance_score >= 0.7 else ""
+                author_line = f"👤 **作者**: {item.author}\n" if item.author else ""
+                published_line = f"📅 **发布**: {item.published_minute()}\n" if item.published else ""
+                summary_line = f"📝 **摘要**: {item.summary}\n" if item.summary else ""
+                render_data = _SOURCE_DATA_LINES.get(item.source)
+                data_line = render_data(item) if render_data else ""
                 
-                lines.append(f"🔗 **链接**: {item.url}")
-                
-                if item.published:
-                    lines.append(f"📅 **发布**: {item.published.strftime('%Y-%m-%d %H:%M')}")
-                
-                if item.summary:
-                    lines.append(f"📝 **摘要**: {item.summary}")
-                
-                # Source-specific data
-                if item.source.value == "bilibili":
-                    view_count = item.source_data.get('view_count')
-                    like_count = item.source_data.get('like_count')
-                    if view_count or like_count:
-                        stats = []
-                        if view_count:
-                            stats.append(f"👁️ {view_count}")
-                        if like_count:
-                            stats.append(f"👍 {like_count}")
-                        lines.append(f"📊 **数据**: {' · '.join(stats)}")
-                
-                elif item.source.value == "zhihu":
-                    bilibili_links = item.source_data.get('bilibili_links', [])
-                    if bilibili_links:
-                        lines.append(f"📺 **包含B站视频**: {len(bilibili_links)} 个")
-                
-                lines.extend(["", "---", ""])
+                lines.append(
+                    f"### {marker}{idx}. {item.title}\n"
+                    f"\n"
+                    f"{author_line}"
+                    f"🔗 **链接**: {item.url}\n"
+                    f"{published_line}{summary_line}{data_line}"
+                    f"\n"
+                    f"---\n"
+                )
         
         return "\n".join(lines)
     
@@ -334,11 +526,8 @@ class DailyReportGenerator:
         # Simple text version (strip markdown formatting)
         markdown = self.format_markdown(report, config)
         
-        # Remove markdown syntax
-        text = markdown.replace('#', '').replace('**', '').replace('`', '')
-        text = text.replace('---', '=' * 50)
-        
-        return text
+        # Remove markdown syntax and widen rules in one pass
+        return _MD_STRIP_RE.sub(_strip_markdown_token, markdown)
     
     async def generate_charts(self, report: DailyReport) -> dict[str, str | bytes]:
         """
@@ -378,6 +567,9 @@ class DailyReportGenerator:
         Returns:
             Formatted report string, or tuple of (report, charts) if include_charts=True
         """
+        # Render afresh for every generation
+        self._markdown_cache = None
+        
         # Enhance with AI
         if config.generate_ai_summary:
             report = await self.enhance_report(report, config)
@@ -387,14 +579,14 @@ class DailyReportGenerator:
         if include_charts and self.chart_generator:
             charts = await self.generate_charts(report)
 
-        # Format based on output format
-        if config.output_format == "markdown":
-            formatted = self.format_markdown(report, config)
-        elif config.output_format == "text":
-            formatted = self.format_text(report, config)
+        # Format based on output format, in the thread pool
+        if config.output_format == "text":
+            format_report = self.format_text
         else:
-            # Default to markdown
-            formatted = self.format_markdown(report, config)
+            # Markdown is also the default
+            format_report = self.format_markdown
+        loop = asyncio.get_event_loop()
+        formatted = await loop.run_in_executor(None, format_report, report, config)
 
         # Return with or without charts
         if include_charts:
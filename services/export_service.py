@@ -6,18 +6,54 @@ and manage report archives for historical analysis.
 """
 from __future__ import annotations
 
-import json
+import base64
 import logging
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
 from datetime import datetime
 from pathlib import Path
+from collections.abc import Iterable, Iterator
 from typing import Any, Literal
 from dataclasses import dataclass, field
 
 from models.report import DailyReport
+from utils.json_utils import json_dumps
+from utils.process_pool import new_process_pool
 
 
 logger = logging.getLogger(__name__)
 
+# Escapes for text interpolated into exported HTML, applied in one translate pass
+_HTML_ESC = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#39;"
+})
+
+# Static <style> block of exported HTML reports
+_HTML_STYLE = """\
+    <style>
+        body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif; max-width: 900px; margin: 40px auto; padding: 0 20px; line-height: 1.6; }
+        h1 { color: #2c3e50; border-bottom: 3px solid #3498db; padding-bottom: 10px; }
+        h2 { color: #34495e; margin-top: 30px; border-bottom: 2px solid #ecf0f1; padding-bottom: 8px; }
+        h3 { color: #7f8c8d; }
+        .metadata { background: #ecf0f1; padding: 15px; border-radius: 5px; margin: 20px 0; }
+        .stats { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; margin: 20px 0; }
+        .stat-card { background: #fff; border: 1px solid #ddd; padding: 15px; border-radius: 5px; text-align: center; }
+        .stat-value { font-size: 2em; font-weight: bold; color: #3498db; }
+        .stat-label { color: #7f8c8d; margin-top: 5px; }
+        .content-item { background: #f8f9fa; padding: 15px; margin: 15px 0; border-left: 4px solid #3498db; border-radius: 3px; }
+        .content-item h3 { margin-top: 0; }
+        .meta-info { color: #7f8c8d; font-size: 0.9em; margin: 5px 0; }
+        .summary { margin-top: 10px; padding: 10px; background: #fff; border-radius: 3px; }
+        .topics { display: flex; flex-wrap: wrap; gap: 10px; margin: 15px 0; }
+        .topic-tag { background: #3498db; color: white; padding: 5px 15px; border-radius: 20px; font-size: 0.9em; }
+        a { color: #3498db; text-decoration: none; }
+        a:hover { text-decoration: underline; }
+    </style>"""
+
 
 @dataclass
 class ExportConfig:
@@ -116,15 +152,14 @@ class ReportExporter:
                     error=f"Unsupported format: {export_format}"
                 )
             
-            # Write to file
-            if isinstance(content, str):
-                file_path.write_text(content, encoding="utf-8")
-            else:
+            # Write bytes directly; text formats are streamed part by part
+            if isinstance(content, bytes):
                 file_path.write_bytes(content)
+                size_bytes = len(content)
+            else:
+                size_bytes = self._write_parts(file_path, content)
             
-            size_bytes = file_path.stat().st_size
-            
-            logger.info(f"Exported report to {file_path} ({size_bytes} bytes)")
+            logger.info("Exported report to %s (%d bytes)", file_path, size_bytes)
             
             return ExportResult(
                 success=True,
@@ -134,17 +169,79 @@ class ReportExporter:
             )
             
         except Exception as e:
-            logger.error(f"Export failed: {e}", exc_info=True)
+            # Tracebacks only when debugging; the message carries the cause
+            logger.error("Export failed: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return ExportResult(
                 success=False,
                 error=str(e)
             )
     
+    def export_many(
+        self,
+        reports: list[DailyReport],
+        format: Literal["json", "markdown", "html"] | None = None,
+        max_workers: int | None = None
+    ) -> list[ExportResult]:
+        """
+        Export several reports in parallel worker processes.
+        
+        Formatting is CPU-bound, so separate processes let exports use
+        multiple cores. Falls back to exporting serially if the process
+        pool cannot be used.
+        
+        Args:
+            reports: Daily reports to export
+            format: Export format (overrides config)
+            max_workers: Maximum number of worker processes (defaults to CPU count)
+            
+        Returns:
+            ExportResult per report, in input order
+        """
+        if len(reports) <= 1:
+            return [self.export_report(report, format) for report in reports]
+        
+        try:
+            with new_process_pool(max_workers) as executor:
+                return list(executor.map(self.export_report, reports, repeat(format)))
+        except (OSError, BrokenProcessPool) as e:
+            logger.warning("Parallel export unavailable, exporting serially: %s", e)
+            return [self.export_report(report, format) for report in reports]
+    
+    def _write_parts(self, file_path: Path, parts: Iterable[str]) -> int:
+        """
+        Write newline-separated parts to a file as they are produced.
+        
+        Args:
+            file_path: Output file
+            parts: Text parts in order
+            
+        Returns:
+            Number of bytes written
+        """
+        size_bytes = 0
+        separator = b""
+        
+        # Write to a temporary file so a failure mid-way leaves no partial export
+        temp_path = file_path.with_suffix(file_path.suffix + '.tmp')
+        try:
+            with temp_path.open("wb") as f:
+                for part in parts:
+                    data = separator + part.encode("utf-8")
+                    f.write(data)
+                    size_bytes += len(data)
+                    separator = b"\n"
+            temp_path.replace(file_path)
+        except Exception:
+            temp_path.unlink(missing_ok=True)
+            raise
+        
+        return size_bytes
+    
     def _export_json(
         self,
         report: DailyReport,
         charts: dict[str, str | bytes] | None = None
-    ) -> str:
+    ) -> bytes:
         """Export report as JSON."""
         data = report.to_dict()
         
@@ -158,222 +255,167 @@ class ReportExporter:
         
         # Add charts if provided and enabled
         if self.config.include_charts and charts:
-            data["charts"] = {}
-            for name, chart_data in charts.items():
-                if isinstance(chart_data, bytes):
-                    # Convert bytes to base64 for JSON
-                    import base64
-                    data["charts"][name] = base64.b64encode(chart_data).decode("utf-8")
-                else:
-                    data["charts"][name] = chart_data
+            # Convert bytes to base64 for JSON; base64 output is pure ASCII
+            data["charts"] = {
+                name: base64.b64encode(chart_data).decode("ascii") if isinstance(chart_data, bytes) else chart_data
+                for name, chart_data in charts.items()
+            }
         
-        # Pretty print if enabled
-        if self.config.pretty_print:
-            return json.dumps(data, ensure_ascii=False, indent=2)
-        else:
-            return json.dumps(data, ensure_ascii=False)
+        # Pretty print if enabled; the UTF-8 bytes are written to the file as-is
+        return json_dumps(data, indent=self.config.pretty_print)
     
     def _export_markdown(
         self,
         report: DailyReport,
         charts: dict[str, str | bytes] | None = None
-    ) -> str:
-        """Export report as Markdown."""
-        lines = [
-            f"# {report.title}",
-            "",
-            f"📅 **日期**: {report.report_date.strftime('%Y年%m月%d日')}",
-            ""
-        ]
+    ) -> Iterator[str]:
+        """Export report as Markdown, yielding it part by part."""
+        # Each part is a run of lines; parts are separated by newlines when written
+        yield (
+            f"# {report.title}\n"
+            f"\n"
+            f"📅 **日期**: {report.report_date.strftime('%Y年%m月%d日')}\n"
+        )
         
         # Add metadata if enabled
         if self.config.include_metadata:
-            lines.extend([
-                "## 📋 报告信息",
-                "",
-                f"- 生成时间: {report.generation_time.strftime('%Y-%m-%d %H:%M:%S') if report.generation_time else 'N/A'}",
-                f"- 导出时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-                ""
-            ])
+            generation_time = report.generation_time.strftime('%Y-%m-%d %H:%M:%S') if report.generation_time else 'N/A'
+            yield (
+                f"## 📋 报告信息\n"
+                f"\n"
+                f"- 生成时间: {generation_time}\n"
+                f"- 导出时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+            )
         
         # Statistics
-        lines.extend([
-            "## 📊 统计信息",
-            "",
-            f"- 📝 总内容数: {report.total_items}",
-            f"- 📺 B站视频: {report.bilibili_items}",
-            f"- 📰 知乎内容: {report.zhihu_items}",
-            f"- 📂 分类数: {len(report.sections)}",
-            ""
-        ])
+        yield (
+            f"## 📊 统计信息\n"
+            f"\n"
+            f"- 📝 总内容数: {report.total_items}\n"
+            f"- 📺 B站视频: {report.bilibili_items}\n"
+            f"- 📰 知乎内容: {report.zhihu_items}\n"
+            f"- 📂 分类数: {len(report.sections)}\n"
+        )
         
         # Executive summary
         if report.executive_summary:
-            lines.extend([
-                "## 📋 执行摘要",
-                "",
-                report.executive_summary,
-                ""
-            ])
+            yield f"## 📋 执行摘要\n\n{report.executive_summary}\n"
         
         # Trending topics
         if report.trending_topics:
             topics_str = " · ".join(f"`{topic}`" for topic in report.trending_topics)
-            lines.extend([
-                "## 🔥 热门话题",
-                "",
-                topics_str,
-                ""
-            ])
+            yield f"## 🔥 热门话题\n\n{topics_str}\n"
         
         # Content sections
         for section in report.sections:
-            lines.extend([
-                f"## {section.category.value}",
-                ""
-            ])
+            yield f"## {section.category.value}\n"
             
             if section.ai_summary:
-                lines.extend([
-                    f"**AI 总结**: {section.ai_summary}",
-                    ""
-                ])
+                yield f"**AI 总结**: {section.ai_summary}\n"
             
             for idx, item in enumerate(section.items, 1):
-                lines.append(f"### {idx}. {item.title}")
-                
-                if item.author:
-                    lines.append(f"👤 **作者**: {item.author}")
-                
-                if item.published:
-                    lines.append(f"📅 **发布**: {item.published.strftime('%Y-%m-%d %H:%M')}")
-                
-                lines.append(f"⭐ **重要度**: {item.importance_score:.2f}")
-                lines.append(f"🔗 **链接**: {item.url}")
-                
-                if item.summary:
-                    lines.extend(["", item.summary])
-                
-                lines.append("")
+                author_line = f"👤 **作者**: {item.author}\n" if item.author else ""
+                published_line = f"📅 **发布**: {item.published_minute()}\n" if item.published else ""
+                summary_part = f"\n\n{item.summary}" if item.summary else ""
+                yield (
+                    f"### {idx}. {item.title}\n"
+                    f"{author_line}{published_line}"
+                    f"⭐ **重要度**: {item.importance_score:.2f}\n"
+                    f"🔗 **链接**: {item.url}{summary_part}\n"
+                )
         
         # Charts note
         if self.config.include_charts and charts:
-            lines.extend([
-                "---",
-                "",
-                "## 📊 图表",
-                "",
-                f"本报告包含 {len(charts)} 个可视化图表。",
-                "图表已保存为单独的文件。",
-                ""
-            ])
-        
-        return "\n".join(lines)
+            yield (
+                f"---\n"
+                f"\n"
+                f"## 📊 图表\n"
+                f"\n"
+                f"本报告包含 {len(charts)} 个可视化图表。\n"
+                f"图表已保存为单独的文件。\n"
+            )
     
     def _export_html(
         self,
         report: DailyReport,
         charts: dict[str, str | bytes] | None = None
-    ) -> str:
-        """Export report as HTML."""
-        # HTML template
-        html_parts = [
-            "<!DOCTYPE html>",
-            "<html lang='zh-CN'>",
-            "<head>",
-            "    <meta charset='UTF-8'>",
-            "    <meta name='viewport' content='width=device-width, initial-scale=1.0'>",
-            f"    <title>{report.title}</title>",
-            "    <style>",
-            "        body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif; max-width: 900px; margin: 40px auto; padding: 0 20px; line-height: 1.6; }",
-            "        h1 { color: #2c3e50; border-bottom: 3px solid #3498db; padding-bottom: 10px; }",
-            "        h2 { color: #34495e; margin-top: 30px; border-bottom: 2px solid #ecf0f1; padding-bottom: 8px; }",
-            "        h3 { color: #7f8c8d; }",
-            "        .metadata { background: #ecf0f1; padding: 15px; border-radius: 5px; margin: 20px 0; }",
-            "        .stats { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; margin: 20px 0; }",
-            "        .stat-card { background: #fff; border: 1px solid #ddd; padding: 15px; border-radius: 5px; text-align: center; }",
-            "        .stat-value { font-size: 2em; font-weight: bold; color: #3498db; }",
-            "        .stat-label { color: #7f8c8d; margin-top: 5px; }",
-            "        .content-item { background: #f8f9fa; padding: 15px; margin: 15px 0; border-left: 4px solid #3498db; border-radius: 3px; }",
-            "        .content-item h3 { margin-top: 0; }",
-            "        .meta-info { color: #7f8c8d; font-size: 0.9em; margin: 5px 0; }",
-            "        .summary { margin-top: 10px; padding: 10px; background: #fff; border-radius: 3px; }",
-            "        .topics { display: flex; flex-wrap: wrap; gap: 10px; margin: 15px 0; }",
-            "        .topic-tag { background: #3498db; color: white; padding: 5px 15px; border-radius: 20px; font-size: 0.9em; }",
-            "        a { color: #3498db; text-decoration: none; }",
-            "        a:hover { text-decoration: underline; }",
-            "    </style>",
-            "</head>",
-            "<body>",
-            f"    <h1>{report.title}</h1>",
-        ]
+    ) -> Iterator[str]:
+        """Export report as HTML, yielding it part by part."""
+        title = report.title.translate(_HTML_ESC)
+        # Each part is a run of lines; parts are separated by newlines when written
+        yield (
+            f"<!DOCTYPE html>\n"
+            f"<html lang='zh-CN'>\n"
+            f"<head>\n"
+            f"    <meta charset='UTF-8'>\n"
+            f"    <meta name='viewport' content='width=device-width, initial-scale=1.0'>\n"
+            f"    <title>{title}</title>\n"
+            f"{_HTML_STYLE}\n"
+            f"</head>\n"
+            f"<body>\n"
+            f"    <h1>{title}</h1>"
+        )
         
         # Metadata
         if self.config.include_metadata:
-            html_parts.extend([
-                "    <div class='metadata'>",
-                f"        <p>📅 <strong>报告日期</strong>: {report.report_date.strftime('%Y年%m月%d日')}</p>",
-                f"        <p>🕐 <strong>生成时间</strong>: {report.generation_time.strftime('%Y-%m-%d %H:%M:%S') if report.generation_time else 'N/A'}</p>",
-                f"        <p>📤 <strong>导出时间</strong>: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>",
-                "    </div>",
-            ])
+            generation_time = report.generation_time.strftime('%Y-%m-%d %H:%M:%S') if report.generation_time else 'N/A'
+            yield (
+                f"    <div class='metadata'>\n"
+                f"        <p>📅 <strong>报告日期</strong>: {report.report_date.strftime('%Y年%m月%d日')}</p>\n"
+                f"        <p>🕐 <strong>生成时间</strong>: {generation_time}</p>\n"
+                f"        <p>📤 <strong>导出时间</strong>: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>\n"
+                f"    </div>"
+            )
         
         # Statistics
-        html_parts.extend([
-            "    <h2>📊 统计信息</h2>",
-            "    <div class='stats'>",
-            f"        <div class='stat-card'><div class='stat-value'>{report.total_items}</div><div class='stat-label'>总内容数</div></div>",
-            f"        <div class='stat-card'><div class='stat-value'>{report.bilibili_items}</div><div class='stat-label'>B站视频</div></div>",
-            f"        <div class='stat-card'><div class='stat-value'>{report.zhihu_items}</div><div class='stat-label'>知乎内容</div></div>",
-            f"        <div class='stat-card'><div class='stat-value'>{len(report.sections)}</div><div class='stat-label'>分类数</div></div>",
-            "    </div>",
-        ])
+        yield (
+            f"    <h2>📊 统计信息</h2>\n"
+            f"    <div class='stats'>\n"
+            f"        <div class='stat-card'><div class='stat-value'>{report.total_items}</div><div class='stat-label'>总内容数</div></div>\n"
+            f"        <div class='stat-card'><div class='stat-value'>{report.bilibili_items}</div><div class='stat-label'>B站视频</div></div>\n"
+            f"        <div class='stat-card'><div class='stat-value'>{report.zhihu_items}</div><div class='stat-label'>知乎内容</div></div>\n"
+            f"        <div class='stat-card'><div class='stat-value'>{len(report.sections)}</div><div class='stat-label'>分类数</div></div>\n"
+            f"    </div>"
+        )
         
         # Executive summary
         if report.executive_summary:
-            html_parts.extend([
-                "    <h2>📋 执行摘要</h2>",
-                f"    <div class='summary'>{report.executive_summary}</div>",
-            ])
+            yield (
+                f"    <h2>📋 执行摘要</h2>\n"
+                f"    <div class='summary'>{report.executive_summary.translate(_HTML_ESC)}</div>"
+            )
         
         # Trending topics
         if report.trending_topics:
-            html_parts.append("    <h2>🔥 热门话题</h2>")
-            html_parts.append("    <div class='topics'>")
-            for topic in report.trending_topics:
-                html_parts.append(f"        <span class='topic-tag'>{topic}</span>")
-            html_parts.append("    </div>")
+            topic_tags = "".join(
+                f"        <span class='topic-tag'>{topic.translate(_HTML_ESC)}</span>\n" for topic in report.trending_topics
+            )
+            yield f"    <h2>🔥 热门话题</h2>\n    <div class='topics'>\n{topic_tags}    </div>"
         
         # Content sections
         for section in report.sections:
-            html_parts.append(f"    <h2>{section.category.value}</h2>")
+            yield f"    <h2>{section.category.value.translate(_HTML_ESC)}</h2>"
             
             if section.ai_summary:
-                html_parts.append(f"    <p><strong>AI 总结</strong>: {section.ai_summary}</p>")
+                yield f"    <p><strong>AI 总结</strong>: {section.ai_summary.translate(_HTML_ESC)}</p>"
             
             for idx, item in enumerate(section.items, 1):
-                html_parts.append("    <div class='content-item'>")
-                html_parts.append(f"        <h3>{idx}. {item.title}</h3>")
-                
                 meta_parts = []
                 if item.author:
-                    meta_parts.append(f"👤 {item.author}")
+                    meta_parts.append(f"👤 {item.author.translate(_HTML_ESC)}")
                 if item.published:
-                    meta_parts.append(f"📅 {item.published.strftime('%Y-%m-%d %H:%M')}")
+                    meta_parts.append(f"📅 {item.published_minute()}")
                 meta_parts.append(f"⭐ {item.importance_score:.2f}")
                 
-                html_parts.append(f"        <p class='meta-info'>{' | '.join(meta_parts)}</p>")
-                html_parts.append(f"        <p class='meta-info'>🔗 <a href='{item.url}' target='_blank'>{item.url}</a></p>")
-                
-                if item.summary:
-                    html_parts.append(f"        <div class='summary'>{item.summary}</div>")
-                
-                html_parts.append("    </div>")
-        
-        html_parts.extend([
-            "</body>",
-            "</html>"
-        ])
+                url = item.url.translate(_HTML_ESC)
+                summary_line = f"        <div class='summary'>{item.summary.translate(_HTML_ESC)}</div>\n" if item.summary else ""
+                yield (
+                    f"    <div class='content-item'>\n"
+                    f"        <h3>{idx}. {item.title.translate(_HTML_ESC)}</h3>\n"
+                    f"        <p class='meta-info'>{' | '.join(meta_parts)}</p>\n"
+                    f"        <p class='meta-info'>🔗 <a href='{url}' target='_blank'>{url}</a></p>\n"
+                    f"{summary_line}"
+                    f"    </div>"
+                )
         
-        return "\n".join(html_parts)
-
+        yield "</body>\n</html>"
@@ -7,10 +7,88 @@ from __future__ import annotations
 
 from typing import Literal
 from datetime import datetime
+from functools import lru_cache
 
 from models.bilibili import MonitorReport, VideoInfo
 
 
+def _format_minute(dt: datetime) -> str:
+    """Format a datetime as YYYY-MM-DD HH:MM, without going through strftime."""
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}"
+
+
+@lru_cache(maxsize=4096)
+def _format_naive_datetime(dt: datetime) -> str:
+    """Format a naive datetime, memoized since reports repeat the same times."""
+    return _format_minute(dt)
+
+
+@lru_cache(maxsize=4096)
+def format_timestamp(ts: int) -> str:
+    """Format a Unix timestamp in local time.
+    
+    Args:
+        ts: Unix timestamp
+        
+    Returns:
+        Formatted string
+    """
+    return _format_minute(datetime.fromtimestamp(ts))
+
+
+def truncate_text(text: str, limit: int) -> str:
+    """Cut text to a length limit, marking the cut with "...".
+    
+    Args:
+        text: Text to shorten
+        limit: Maximum number of characters kept
+        
+    Returns:
+        The text itself if it fits, otherwise its first limit characters plus "..."
+    """
+    if len(text) <= limit:
+        return text
+    return f"{text[:limit]}..."
+
+
+@lru_cache(maxsize=8192)
+def _format_number(num: int | None) -> str:
+    """Format large numbers with units.
+    
+    Counts repeat across videos and checks, so results are memoized.
+    
+    Args:
+        num: Number to format
+        
+    Returns:
+        Formatted string
+    """
+    if num is None:
+        return "-"
+
+    if num >= 10000:
+        return f"{num / 10000:.1f}万"
+    elif num >= 1000:
+        return f"{num / 1000:.1f}千"
+    else:
+        return str(num)
+
+
+def format_datetime(dt: datetime) -> str:
+    """Format a datetime for display.
+    
+    Args:
+        dt: Datetime to format
+        
+    Returns:
+        Formatted string
+    """
+    if dt.tzinfo is None:
+        return _format_naive_datetime(dt)
+    # Equal aware datetimes may show different wall times, so they are not memoized
+    return _format_minute(dt)
+
+
 class MarkdownFormatter:
     """Format monitor reports as Markdown documents."""
 
@@ -28,24 +106,15 @@ class MarkdownFormatter:
         self.style = style
         self.include_stats = include_stats
 
-    def _format_number(self, num: int | None) -> str:
-        """Format large numbers with units.
-        
-        Args:
-            num: Number to format
-            
-        Returns:
-            Formatted string
-        """
-        if num is None:
-            return "-"
-
-        if num >= 10000:
-            return f"{num / 10000:.1f}万"
-        elif num >= 1000:
-            return f"{num / 1000:.1f}千"
+        # Style and stats are fixed, so the video list writer is chosen once
+        if style == "simple":
+            self._write_videos = self._write_videos_simple
+        elif style == "compact":
+            self._write_videos = self._write_videos_table
+        elif include_stats:
+            self._write_videos = self._write_videos_detailed_with_stats
         else:
-            return str(num)
+            self._write_videos = self._write_videos_detailed
 
     def _format_datetime(self, dt: datetime | None) -> str:
         """Format datetime for display.
@@ -58,115 +127,123 @@ class MarkdownFormatter:
         """
         if dt is None:
             return "未知"
-        return dt.strftime("%Y-%m-%d %H:%M")
+        return format_datetime(dt)
 
-    def _format_video_simple(self, video: VideoInfo, index: int) -> str:
-        """Format video in simple style.
+    def _write_video_simple(self, video: VideoInfo, index: int, out: list[str]) -> None:
+        """Write video lines in simple style.
         
         Args:
             video: Video information
             index: Video index (1-based)
-            
-        Returns:
-            Formatted Markdown string
+            out: Lines to append to
         """
-        parts = [
-            f"{index}. **{video.title}**",
-            f"   🔗 {video.get_url()}"
-        ]
-        return "\n".join(parts)
+        out.append(f"{index}. **{video.title}**")
+        out.append(f"   🔗 {video.get_url()}")
 
-    def _format_video_detailed(self, video: VideoInfo, index: int) -> str:
-        """Format video in detailed style.
+    def _write_video_detailed(self, video: VideoInfo, index: int, out: list[str]) -> None:
+        """Write video lines in detailed style, without statistics.
         
         Args:
             video: Video information
             index: Video index (1-based)
-            
-        Returns:
-            Formatted Markdown string
+            out: Lines to append to
         """
-        parts = [
+        out.extend([
             f"### {index}. {video.title}",
             "",
             f"🔗 **链接**: {video.get_url()}",
-        ]
+        ])
 
         if video.desc:
             # Limit description length
-            desc = video.desc[:200]
-            if len(video.desc) > 200:
-                desc += "..."
-            parts.append(f"📝 **简介**: {desc}")
-
-        pub_time = video.get_publish_datetime()
-        if pub_time:
-            parts.append(f"📅 **发布时间**: {self._format_datetime(pub_time)}")
+            out.append(f"📝 **简介**: {truncate_text(video.desc, 200)}")
 
-        if self.include_stats:
-            stats = []
-            if video.play_count is not None:
-                stats.append(f"▶️ 播放 {self._format_number(video.play_count)}")
-            if video.like_count is not None:
-                stats.append(f"👍 点赞 {self._format_number(video.like_count)}")
-            if video.coin_count is not None:
-                stats.append(f"🪙 投币 {self._format_number(video.coin_count)}")
-            if video.favorite_count is not None:
-                stats.append(f"⭐ 收藏 {self._format_number(video.favorite_count)}")
-
-            if stats:
-                parts.append(f"📊 **数据**: {' | '.join(stats)}")
-
-        parts.append("")
-        return "\n".join(parts)
+        if video.publish_time:
+            out.append(f"📅 **发布时间**: {format_timestamp(video.publish_time)}")
 
-    def _format_video_compact_row(self, video: VideoInfo) -> list[str]:
-        """Format video as table row for compact style.
+    def _write_video_stats(self, video: VideoInfo, out: list[str]) -> None:
+        """Write the statistics line of a video, if it has any.
         
         Args:
             video: Video information
-            
-        Returns:
-            List of cell values
+            out: Lines to append to
         """
-        pub_time = video.get_publish_datetime()
-        return [
-            f"[{video.title}]({video.get_url()})",
-            self._format_datetime(pub_time),
-            self._format_number(video.play_count) if self.include_stats else "-",
-            self._format_number(video.like_count) if self.include_stats else "-"
-        ]
-
-    def _format_videos_compact(self, videos: list[VideoInfo]) -> str:
-        """Format videos in compact table style.
+        counts = (
+            ("▶️ 播放", video.play_count),
+            ("👍 点赞", video.like_count),
+            ("🪙 投币", video.coin_count),
+            ("⭐ 收藏", video.favorite_count),
+        )
+        stats = [f"{label} {_format_number(count)}" for label, count in counts if count is not None]
+
+        if stats:
+            out.append(f"📊 **数据**: {' | '.join(stats)}")
+
+    def _write_videos_simple(self, videos: list[VideoInfo], out: list[str]) -> None:
+        """Write a video list in simple style."""
+        out.append("### 视频列表")
+        out.append("")
+        write_video = self._write_video_simple
+        for idx, video in enumerate(videos, 1):
+            write_video(video, idx, out)
+            out.append("")
+
+    def _write_videos_table(self, videos: list[VideoInfo], out: list[str]) -> None:
+        """Write a video list in compact style."""
+        out.append("### 视频列表")
+        out.append("")
+        self._write_videos_compact(videos, out)
+        out.append("")
+
+    def _write_videos_detailed(self, videos: list[VideoInfo], out: list[str]) -> None:
+        """Write a video list in detailed style without statistics."""
+        out.append("### 视频详情")
+        out.append("")
+        write_video = self._write_video_detailed
+        for idx, video in enumerate(videos, 1):
+            write_video(video, idx, out)
+            out.append("")
+
+    def _write_videos_detailed_with_stats(self, videos: list[VideoInfo], out: list[str]) -> None:
+        """Write a video list in detailed style with statistics."""
+        out.append("### 视频详情")
+        out.append("")
+        write_video = self._write_video_detailed
+        write_stats = self._write_video_stats
+        for idx, video in enumerate(videos, 1):
+            write_video(video, idx, out)
+            write_stats(video, out)
+            out.append("")
+
+    def _write_videos_compact(self, videos: list[VideoInfo], out: list[str]) -> None:
+        """Write videos as a compact Markdown table.
         
         Args:
             videos: List of videos
-            
-        Returns:
-            Formatted Markdown table
+            out: Lines to append to
         """
         if not videos:
-            return ""
+            out.append("")
+            return
 
-        # Table header
+        # Table header and rows, each row written as one f-string
         if self.include_stats:
-            lines = [
-                "| 标题 | 发布时间 | 播放 | 点赞 |",
-                "|------|----------|------|------|"
-            ]
+            out.append("| 标题 | 发布时间 | 播放 | 点赞 |")
+            out.append("|------|----------|------|------|")
+            out.extend([
+                f"| [{video.title}]({video.get_url()}) | "
+                f"{format_timestamp(video.publish_time) if video.publish_time else '未知'} | "
+                f"{_format_number(video.play_count)} | {_format_number(video.like_count)} |"
+                for video in videos
+            ])
         else:
-            lines = [
-                "| 标题 | 发布时间 |",
-                "|------|----------|"
-            ]
-
-        # Table rows
-        for video in videos:
-            row = self._format_video_compact_row(video)
-            lines.append("| " + " | ".join(row) + " |")
-
-        return "\n".join(lines)
+            out.append("| 标题 | 发布时间 |")
+            out.append("|------|----------|")
+            out.extend([
+                f"| [{video.title}]({video.get_url()}) | "
+                f"{format_timestamp(video.publish_time) if video.publish_time else '未知'} | - | - |"
+                for video in videos
+            ])
 
     def format_report(self, report: MonitorReport) -> str:
         """Format a single monitor report.
@@ -177,21 +254,32 @@ class MarkdownFormatter:
         Returns:
             Formatted Markdown string
         """
+        parts: list[str] = []
+        self._write_report(report, parts)
+        return "\n".join(parts)
+
+    def _write_report(self, report: MonitorReport, out: list[str]) -> None:
+        """Write the lines of a single monitor report.
+        
+        Args:
+            report: Monitor report to format
+            out: Lines to append to
+        """
         if not report.has_new_videos():
-            return ""
+            return
 
-        parts = [
+        out.extend([
             f"## 📺 {report.up_master_name}",
             "",
             f"🆔 **UP 主 ID**: {report.up_master_mid}",
             f"🆕 **新视频数**: {len(report.new_videos)}",
             f"🕐 **检查时间**: {self._format_datetime(report.check_time)}",
             ""
-        ]
+        ])
 
         # Add AI summary if available
         if report.ai_summary:
-            parts.extend([
+            out.extend([
                 "### 🤖 AI 总结",
                 "",
                 report.ai_summary,
@@ -200,27 +288,8 @@ class MarkdownFormatter:
                 ""
             ])
 
-        # Add videos based on style
-        if self.style == "simple":
-            parts.append("### 视频列表")
-            parts.append("")
-            for idx, video in enumerate(report.new_videos, 1):
-                parts.append(self._format_video_simple(video, idx))
-                parts.append("")
-
-        elif self.style == "compact":
-            parts.append("### 视频列表")
-            parts.append("")
-            parts.append(self._format_videos_compact(report.new_videos))
-            parts.append("")
-
-        else:  # detailed
-            parts.append("### 视频详情")
-            parts.append("")
-            for idx, video in enumerate(report.new_videos, 1):
-                parts.append(self._format_video_detailed(video, idx))
-
-        return "\n".join(parts)
+        # Add videos in the configured style
+        self._write_videos(report.new_videos, out)
 
     def format_multiple_reports(
         self,
@@ -257,18 +326,20 @@ class MarkdownFormatter:
             ])
 
         # Add summary
+        now = datetime.now()
         total_videos = sum(len(r.new_videos) for r in reports_with_videos)
         parts.extend([
             f"📊 **统计**: {len(reports_with_videos)} 位 UP 主更新了 {total_videos} 个视频",
-            f"🕐 **生成时间**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            f"🕐 **生成时间**: {now.year:04d}-{now.month:02d}-{now.day:02d} "
+            f"{now.hour:02d}:{now.minute:02d}:{now.second:02d}",
             "",
             "---",
             ""
         ])
 
-        # Add each report
+        # Add each report, joining everything once at the end
         for report in reports_with_videos:
-            parts.append(self.format_report(report))
+            self._write_report(report, parts)
             parts.append("")
             parts.append("---")
             parts.append("")
@@ -7,7 +7,10 @@ for AI-powered daily report generation.
 from __future__ import annotations
 
 import logging
+import re
+from collections import Counter
 from datetime import datetime
+from operator import attrgetter
 
 from models.report import ContentItem, ContentSource, ContentCategory, DailyReport
 from models.bilibili import MonitorReport as BilibiliMonitorReport
@@ -16,6 +19,16 @@ from models.zhihu import ZhihuMonitorReport
 
 logger = logging.getLogger(__name__)
 
+# Latin words and numbers, for whole-word keyword matching
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def _can_overlap(a: str, b: str) -> bool:
+    """Check whether occurrences of two different keywords can share characters."""
+    if a in b or b in a:
+        return True
+    return any(a.endswith(b[:i]) or b.endswith(a[:i]) for i in range(1, min(len(a), len(b))))
+
 
 class ReportAggregator:
     """Aggregates content from multiple sources for daily reports."""
@@ -43,6 +56,28 @@ class ReportAggregator:
                 '摄影', 'vlog', '日常'
             ]
         }
+        
+        # Categories each keyword counts towards. Latin keywords are matched as
+        # whole lowercase words, so "AI" does not match inside "email"
+        self._keyword_categories: dict[str, list[ContentCategory]] = {}
+        for category, keywords in self.category_keywords.items():
+            for keyword in keywords:
+                key = keyword.lower() if keyword.isascii() else keyword
+                self._keyword_categories.setdefault(key, []).append(category)
+        self._word_keywords = frozenset(k for k in self._keyword_categories if k.isascii())
+        
+        # One scan finds every other keyword except those overlapping a match,
+        # which are looked up directly among the matched keywords' overlap partners
+        keywords = sorted(
+            (k for k in self._keyword_categories if not k.isascii()),
+            key=len,
+            reverse=True
+        )
+        self._keyword_pattern = re.compile("|".join(map(re.escape, keywords))) if keywords else None
+        self._overlapping_keywords: dict[str, tuple[str, ...]] = {
+            keyword: tuple(other for other in keywords if other != keyword and _can_overlap(keyword, other))
+            for keyword in keywords
+        }
     
     def _categorize_content(self, title: str, summary: str | None = None) -> ContentCategory:
         """
@@ -55,28 +90,39 @@ class ReportAggregator:
         Returns:
             Detected category
         """
-        text = title.lower()
-        if summary:
-            text += " " + summary.lower()
+        # Lowercase once, after joining
+        text = f"{title} {summary}".lower() if summary else title.lower()
         
-        # Count keyword matches for each category
-        category_scores: dict[ContentCategory, int] = {}
-        for category, keywords in self.category_keywords.items():
-            score = sum(1 for keyword in keywords if keyword in text)
-            if score > 0:
-                category_scores[category] = score
+        found: set[str] = set()
+        if self._keyword_pattern is not None:
+            found.update(self._keyword_pattern.findall(text))
+            
+            # Keywords hidden inside or across a match are checked directly
+            for keyword in list(found):
+                for other in self._overlapping_keywords[keyword]:
+                    if other not in found and other in text:
+                        found.add(other)
+        
+        if self._word_keywords:
+            found.update(self._word_keywords.intersection(_WORD_RE.findall(text)))
         
-        # Return category with highest score
-        if category_scores:
-            return max(category_scores.items(), key=lambda x: x[1])[0]
+        if not found:
+            return ContentCategory.OTHER
         
-        return ContentCategory.OTHER
+        # Count distinct keyword matches for each category
+        category_scores: Counter[ContentCategory] = Counter()
+        for keyword in found:
+            category_scores.update(self._keyword_categories[keyword])
+        
+        # Return category with highest score, the first listed on ties
+        return max(self.category_keywords, key=category_scores.__getitem__)
     
     def _calculate_importance(
         self,
         published: datetime | None,
         has_summary: bool,
-        source: ContentSource
+        source: ContentSource,
+        now: datetime
     ) -> float:
         """
         Calculate importance score for content.
@@ -85,29 +131,21 @@ class ReportAggregator:
             published: Publication datetime
             has_summary: Whether content has a summary
             source: Content source
+            now: Current time, taken once per collection
             
         Returns:
             Importance score (0.0 to 1.0)
         """
-        score = 0.5  # Base score
-        
-        # Recency bonus (up to +0.3)
-        if published:
-            age_hours = (datetime.now() - published).total_seconds() / 3600
-            if age_hours < 24:
-                score += 0.3 * (1 - age_hours / 24)
-            elif age_hours < 72:
-                score += 0.1
+        # Recency bonus: up to +0.3 within a day, +0.1 within three days
+        age_hours = (now - published).total_seconds() / 3600 if published else float("inf")
+        recency = 0.3 * max(0.0, 1 - age_hours / 24) + (0.1 if 24 <= age_hours < 72 else 0.0)
         
-        # Summary bonus (+0.1)
-        if has_summary:
-            score += 0.1
+        # Base score, summary bonus, and a source bonus (Bilibili slightly
+        # higher as it's video content)
+        summary_bonus = 0.1 if has_summary else 0.0
+        source_bonus = 0.05 if source == ContentSource.BILIBILI else 0.0
         
-        # Source bonus (Bilibili slightly higher as it's video content)
-        if source == ContentSource.BILIBILI:
-            score += 0.05
-        
-        return min(1.0, score)
+        return min(1.0, 0.5 + recency + summary_bonus + source_bonus)
     
     def collect_bilibili_content(
         self,
@@ -125,6 +163,7 @@ class ReportAggregator:
             List of content items
         """
         items: list[ContentItem] = []
+        now = datetime.now()
         
         for report in reports:
             for video in report.new_videos:
@@ -140,12 +179,13 @@ class ReportAggregator:
                 importance = self._calculate_importance(
                     publish_datetime,
                     bool(video.desc),
-                    ContentSource.BILIBILI
+                    ContentSource.BILIBILI,
+                    now
                 )
 
                 item = ContentItem(
                     title=video.title,
-                    url=f"https://www.bilibili.com/video/{video.bvid}",
+                    url=video.get_url(),
                     source=ContentSource.BILIBILI,
                     published=publish_datetime,
                     author=report.up_master_name,
@@ -184,6 +224,7 @@ class ReportAggregator:
             List of content items
         """
         items: list[ContentItem] = []
+        now = datetime.now()
         
         for report in reports:
             for feed_item in report.new_items:
@@ -200,7 +241,8 @@ class ReportAggregator:
                 importance = self._calculate_importance(
                     feed_item.published,
                     bool(feed_item.summary),
-                    ContentSource.ZHIHU
+                    ContentSource.ZHIHU,
+                    now
                 )
                 
                 # Boost importance if it has Bilibili links
@@ -271,20 +313,13 @@ class ReportAggregator:
         all_items = [item for item in all_items if item.importance_score >= min_importance]
         
         # Sort by importance (descending)
-        all_items.sort(key=lambda x: x.importance_score, reverse=True)
-        
-        # Group by category and limit items per category
-        category_items: dict[ContentCategory, list[ContentItem]] = {}
-        for item in all_items:
-            if item.category not in category_items:
-                category_items[item.category] = []
-            
-            if len(category_items[item.category]) < max_items_per_category:
-                category_items[item.category].append(item)
+        all_items.sort(key=attrgetter("importance_score"), reverse=True)
         
-        # Add items to report
+        # Add items to the report, limiting items per category
+        category_counts: Counter[ContentCategory] = Counter()
         for item in all_items:
-            if item in category_items.get(item.category, []):
+            if category_counts[item.category] < max_items_per_category:
+                category_counts[item.category] += 1
                 report.add_item(item)
         
         logger.info(
@@ -9,6 +9,7 @@ from typing import Literal
 from datetime import datetime
 
 from models.zhihu import ZhihuMonitorReport, ZhihuFeedItem
+from services.formatter import format_datetime, truncate_text
 
 
 class ZhihuFormatter:
@@ -32,6 +33,14 @@ class ZhihuFormatter:
         self.include_bilibili_links = include_bilibili_links
         self.include_summary = include_summary
 
+        # The style is fixed, so the item list writer is chosen once
+        if style == "simple":
+            self._write_items = self._write_items_simple
+        elif style == "compact":
+            self._write_items = self._write_items_table
+        else:
+            self._write_items = self._write_items_detailed
+
     def _format_datetime(self, dt: datetime | None) -> str:
         """
         Format datetime for display.
@@ -44,121 +53,113 @@ class ZhihuFormatter:
         """
         if dt is None:
             return "未知"
-        return dt.strftime("%Y-%m-%d %H:%M")
+        return format_datetime(dt)
 
-    def _format_item_simple(self, item: ZhihuFeedItem, index: int) -> str:
+    def _write_item_simple(self, item: ZhihuFeedItem, index: int, out: list[str]) -> None:
         """
-        Format item in simple style.
+        Write item lines in simple style.
         
         Args:
             item: Feed item
             index: Item index (1-based)
-            
-        Returns:
-            Formatted Markdown string
+            out: Lines to append to
         """
-        parts = [f"{index}. **{item.title}**"]
+        out.append(f"{index}. **{item.title}**")
         
         if item.author:
-            parts.append(f"   作者: {item.author}")
+            out.append(f"   作者: {item.author}")
         
-        parts.append(f"   🔗 {item.link}")
+        out.append(f"   🔗 {item.link}")
         
         if self.include_bilibili_links and item.bilibili_links:
-            parts.append(f"   📺 B站视频: {len(item.bilibili_links)} 个")
-        
-        return "\n".join(parts)
+            out.append(f"   📺 B站视频: {len(item.bilibili_links)} 个")
 
-    def _format_item_detailed(self, item: ZhihuFeedItem, index: int) -> str:
+    def _write_item_detailed(self, item: ZhihuFeedItem, index: int, out: list[str]) -> None:
         """
-        Format item in detailed style.
+        Write item lines in detailed style.
         
         Args:
             item: Feed item
             index: Item index (1-based)
-            
-        Returns:
-            Formatted Markdown string
+            out: Lines to append to
         """
-        parts = [
+        out.extend([
             f"### {index}. {item.title}",
             ""
-        ]
+        ])
         
         if item.author:
-            parts.append(f"👤 **作者**: {item.author}")
+            out.append(f"👤 **作者**: {item.author}")
         
-        parts.append(f"🔗 **链接**: {item.link}")
+        out.append(f"🔗 **链接**: {item.link}")
         
         if item.published:
-            parts.append(f"📅 **发布时间**: {self._format_datetime(item.published)}")
+            out.append(f"📅 **发布时间**: {self._format_datetime(item.published)}")
         
         if self.include_summary and item.summary:
             # Limit summary length
-            summary = item.summary[:300]
-            if len(item.summary) > 300:
-                summary += "..."
-            parts.append(f"📝 **摘要**: {summary}")
+            out.append(f"📝 **摘要**: {truncate_text(item.summary, 300)}")
         
         if self.include_bilibili_links and item.bilibili_links:
-            parts.append("")
-            parts.append(f"📺 **B站视频链接** ({len(item.bilibili_links)} 个):")
+            out.append("")
+            out.append(f"📺 **B站视频链接** ({len(item.bilibili_links)} 个):")
             for link in item.bilibili_links:
-                parts.append(f"- {link}")
+                out.append(f"- {link}")
         
-        parts.append("")
-        return "\n".join(parts)
-
-    def _format_item_compact_row(self, item: ZhihuFeedItem) -> list[str]:
+        out.append("")
+
+    def _write_items_simple(self, items: list[ZhihuFeedItem], out: list[str]) -> None:
+        """Write an item list in simple style."""
+        out.append("### 内容列表")
+        out.append("")
+        write_item = self._write_item_simple
+        for idx, item in enumerate(items, 1):
+            write_item(item, idx, out)
+            out.append("")
+
+    def _write_items_table(self, items: list[ZhihuFeedItem], out: list[str]) -> None:
+        """Write an item list in compact style."""
+        out.append("### 内容列表")
+        out.append("")
+        self._write_items_compact(items, out)
+        out.append("")
+
+    def _write_items_detailed(self, items: list[ZhihuFeedItem], out: list[str]) -> None:
+        """Write an item list in detailed style."""
+        out.append("### 内容详情")
+        out.append("")
+        write_item = self._write_item_detailed
+        for idx, item in enumerate(items, 1):
+            write_item(item, idx, out)
+
+    def _write_items_compact(self, items: list[ZhihuFeedItem], out: list[str]) -> None:
         """
-        Format item as table row for compact style.
-        
-        Args:
-            item: Feed item
-            
-        Returns:
-            List of cell values
-        """
-        bilibili_count = len(item.bilibili_links) if item.bilibili_links else 0
-
-        return [
-            f"[{item.title}]({item.link})",
-            item.author or "-",
-            self._format_datetime(item.published),
-            f"{bilibili_count}" if bilibili_count > 0 else "-"
-        ]
-
-    def _format_items_compact(self, items: list[ZhihuFeedItem]) -> str:
-        """
-        Format items in compact table style.
+        Write items as a compact Markdown table.
         
         Args:
             items: List of feed items
-            
-        Returns:
-            Formatted Markdown table
+            out: Lines to append to
         """
         if not items:
-            return ""
+            out.append("")
+            return
 
         # Table header
         if self.include_bilibili_links:
-            lines = [
-                "| 标题 | 作者 | 发布时间 | B站视频 |",
-                "|------|------|----------|---------|"
-            ]
+            out.append("| 标题 | 作者 | 发布时间 | B站视频 |")
+            out.append("|------|------|----------|---------|")
         else:
-            lines = [
-                "| 标题 | 作者 | 发布时间 |",
-                "|------|------|----------|"
-            ]
-
-        # Table rows
-        for item in items:
-            row = self._format_item_compact_row(item)
-            lines.append("| " + " | ".join(row) + " |")
-
-        return "\n".join(lines)
+            out.append("| 标题 | 作者 | 发布时间 |")
+            out.append("|------|------|----------|")
+
+        # Table rows, each written as one f-string
+        format_published = self._format_datetime
+        out.extend([
+            f"| [{item.title}]({item.link}) | {item.author or '-'} | "
+            f"{format_published(item.published)} | "
+            f"{len(item.bilibili_links) if item.bilibili_links else '-'} |"
+            for item in items
+        ])
 
     def format_report(self, report: ZhihuMonitorReport) -> str:
         """
@@ -170,50 +171,49 @@ class ZhihuFormatter:
         Returns:
             Formatted Markdown string
         """
+        parts: list[str] = []
+        self._write_report(report, parts)
+        return "\n".join(parts)
+
+    def _write_report(self, report: ZhihuMonitorReport, out: list[str]) -> None:
+        """
+        Write the lines of a single Zhihu monitor report.
+        
+        Args:
+            report: Monitor report to format
+            out: Lines to append to
+        """
         if not report.has_new_items():
-            return ""
+            return
 
         feed_name = report.feed_name or "Zhihu RSS"
         
-        parts = [
+        out.extend([
             f"## 📰 {feed_name}",
             "",
             f"🔗 **订阅源**: {report.feed_url}",
             f"🆕 **新内容**: {len(report.new_items)} 条",
             f"🕐 **检查时间**: {self._format_datetime(report.check_time)}",
-        ]
+        ])
         
         # Add Bilibili link summary if applicable
-        if self.include_bilibili_links and report.has_bilibili_links():
-            bilibili_items = [item for item in report.new_items if item.bilibili_links]
-            total_links = sum(len(item.bilibili_links) for item in bilibili_items)
-            parts.append(f"📺 **包含B站视频**: {len(bilibili_items)} 条内容，共 {total_links} 个视频")
+        if self.include_bilibili_links:
+            # Count items and links in one pass
+            bilibili_items = 0
+            total_links = 0
+            for item in report.new_items:
+                if item.bilibili_links:
+                    bilibili_items += 1
+                    total_links += len(item.bilibili_links)
+            if bilibili_items:
+                out.append(f"📺 **包含B站视频**: {bilibili_items} 条内容，共 {total_links} 个视频")
         
-        parts.append("")
-        parts.append("---")
-        parts.append("")
-
-        # Add items based on style
-        if self.style == "simple":
-            parts.append("### 内容列表")
-            parts.append("")
-            for idx, item in enumerate(report.new_items, 1):
-                parts.append(self._format_item_simple(item, idx))
-                parts.append("")
+        out.append("")
+        out.append("---")
+        out.append("")
 
-        elif self.style == "compact":
-            parts.append("### 内容列表")
-            parts.append("")
-            parts.append(self._format_items_compact(report.new_items))
-            parts.append("")
-
-        else:  # detailed
-            parts.append("### 内容详情")
-            parts.append("")
-            for idx, item in enumerate(report.new_items, 1):
-                parts.append(self._format_item_detailed(item, idx))
-
-        return "\n".join(parts)
+        # Add items in the configured style
+        self._write_items(report.new_items, out)
 
     def format_multiple_reports(
         self,
@@ -251,10 +251,10 @@ class ZhihuFormatter:
             ])
 
         # Add summary
+        now = datetime.now()
         total_items = sum(len(r.new_items) for r in reports_with_items)
         total_bilibili = sum(
-            len([item for item in r.new_items if item.bilibili_links])
-            for r in reports_with_items
+            1 for r in reports_with_items for item in r.new_items if item.bilibili_links
         )
         
         parts.extend([
@@ -265,15 +265,16 @@ class ZhihuFormatter:
             parts.append(f"📺 **B站视频**: {total_bilibili} 条内容包含 B站视频链接")
         
         parts.extend([
-            f"🕐 **生成时间**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            f"🕐 **生成时间**: {now.year:04d}-{now.month:02d}-{now.day:02d} "
+            f"{now.hour:02d}:{now.minute:02d}:{now.second:02d}",
             "",
             "---",
             ""
         ])
 
-        # Add each report
+        # Add each report, joining everything once at the end
         for report in reports_with_items:
-            parts.append(self.format_report(report))
+            self._write_report(report, parts)
             parts.append("")
             parts.append("---")
             parts.append("")
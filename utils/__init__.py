@@ -7,11 +7,13 @@ API clients, link extraction, and shared helper functions.
 
 from .command_utils import (
     parse_command_flags,
+    split_keywords_and_flags,
     extract_and_summarize_urls,
 )
 from .tavily_client import (
     TavilyOptions,
     extract_urls,
+    iter_urls,
     tavily_extract,
 )
 from .openrouter_client import (
@@ -25,6 +27,11 @@ from .link_extractor import (
     is_bilibili_url,
     deduplicate_links,
 )
+from .json_utils import (
+    json_dumps,
+    json_loads,
+    parse_iso_datetime,
+)
 from .chart_generator import (
     ChartConfig,
     ChartGenerator,
@@ -33,9 +40,11 @@ from .chart_generator import (
 
 __all__ = [
     "parse_command_flags",
+    "split_keywords_and_flags",
     "extract_and_summarize_urls",
     "TavilyOptions",
     "extract_urls",
+    "iter_urls",
     "tavily_extract",
     "ORSummaryOptions",
     "summarize_batch",
@@ -44,6 +53,9 @@ __all__ = [
     "extract_video_id",
     "is_bilibili_url",
     "deduplicate_links",
+    "json_dumps",
+    "json_loads",
+    "parse_iso_datetime",
     "ChartConfig",
     "ChartGenerator",
     "chart_available",
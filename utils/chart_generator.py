@@ -7,14 +7,22 @@ Provides functions to generate various chart types using matplotlib:
 - Importance score distribution (histograms)
 - Top sources (bar charts)
 - Activity heatmaps (hour/day patterns)
+
+Charts are drawn and encoded in worker processes, since matplotlib's
+Agg backend serializes badly across threads.
 """
 import asyncio
 import io
 import base64
+import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime
 from typing import Any
-from collections import defaultdict, Counter
+from collections import Counter
 
 try:
     import matplotlib  # type: ignore
@@ -22,6 +30,8 @@ try:
     import matplotlib.pyplot as plt  # type: ignore
     import matplotlib.dates as mdates  # type: ignore
     import matplotlib.cm as cm  # type: ignore
+    from matplotlib.figure import Figure  # type: ignore
+    from matplotlib.backends.backend_agg import FigureCanvasAgg  # type: ignore
     import numpy as np
     MATPLOTLIB_AVAILABLE = True
 except ImportError:
@@ -29,9 +39,14 @@ except ImportError:
     plt = None  # type: ignore
     mdates = None  # type: ignore
     cm = None  # type: ignore
+    Figure = None  # type: ignore
+    FigureCanvasAgg = None  # type: ignore
     np = None  # type: ignore
 
 from models.report import DailyReport
+from utils.process_pool import kill_workers, new_process_pool
+
+logger = logging.getLogger(__name__)
 
 
 class ChartConfig:
@@ -46,7 +61,11 @@ class ChartConfig:
         style: str = "seaborn-v0_8-darkgrid",
         color_scheme: str = "default",  # default, pastel, vibrant
         save_to_file: bool = False,
-        output_dir: str = "data/charts"
+        output_dir: str = "data/charts",
+        use_processes: bool = True,
+        max_workers: int | None = None,
+        png_compress_level: int = 1,
+        render_timeout: float = 60.0
     ):
         self.enabled = enabled
         self.output_format = output_format
@@ -56,6 +75,13 @@ class ChartConfig:
         self.color_scheme = color_scheme
         self.save_to_file = save_to_file
         self.output_dir = output_dir
+        # Render in worker processes; False renders one chart at a time in threads
+        self.use_processes = use_processes
+        self.max_workers = max_workers
+        # zlib level for PNG output: 1 encodes fastest, 9 gives the smallest files
+        self.png_compress_level = png_compress_level
+        # Seconds to wait for a worker process before treating it as hung
+        self.render_timeout = render_timeout
     
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "ChartConfig":
@@ -68,7 +94,247 @@ class ChartConfig:
             style=data.get("style", "seaborn-v0_8-darkgrid"),
             color_scheme=data.get("color_scheme", "default"),
             save_to_file=data.get("save_to_file", False),
-            output_dir=data.get("output_dir", "data/charts")
+            output_dir=data.get("output_dir", "data/charts"),
+            use_processes=data.get("use_processes", True),
+            max_workers=data.get("max_workers"),
+            png_compress_level=data.get("png_compress_level", 1),
+            render_timeout=data.get("render_timeout", 60.0)
+        )
+
+
+def _draw_category_pie(fig: Any, ax: Any, categories: list[str], counts: list[int], colors: list) -> None:
+    """Draw content distribution by category as a pie chart."""
+    pie_result = ax.pie(
+        counts,
+        labels=categories,
+        autopct='%1.1f%%',
+        colors=colors,
+        startangle=90
+    )
+    
+    # Handle both 2-tuple and 3-tuple returns
+    if len(pie_result) == 3:
+        autotexts = pie_result[2]
+        # Styling
+        for autotext in autotexts:
+            autotext.set_color('white')
+            autotext.set_fontweight('bold')
+    
+    ax.set_title('Content Distribution by Category', fontsize=14, fontweight='bold')
+
+
+def _draw_category_bar(fig: Any, ax: Any, categories: list[str], counts: list[int], colors: list) -> None:
+    """Draw content distribution by category as a bar chart."""
+    bars = ax.bar(categories, counts, color=colors, edgecolor='black', linewidth=1.2)
+    
+    # Add value labels on bars
+    for bar in bars:
+        height = bar.get_height()
+        ax.text(bar.get_x() + bar.get_width()/2., height,
+               f'{int(height)}',
+               ha='center', va='bottom', fontweight='bold')
+    
+    ax.set_xlabel('Category', fontsize=12, fontweight='bold')
+    ax.set_ylabel('Number of Items', fontsize=12, fontweight='bold')
+    ax.set_title('Content Distribution by Category', fontsize=14, fontweight='bold')
+    ax.grid(axis='y', alpha=0.3)
+    
+    # Rotate x-axis labels if needed
+    for label in ax.get_xticklabels():
+        label.set(rotation=45, ha='right')
+
+
+def _draw_importance_distribution(fig: Any, ax: Any, scores: Any) -> None:
+    """Draw a histogram of importance scores."""
+    n, bins, patches = ax.hist(scores, bins=20, color='skyblue', edgecolor='black', alpha=0.7)
+    
+    # Color bars by importance level
+    # Handle both list and BarContainer types
+    if hasattr(patches, '__iter__'):
+        patch_list = list(patches) if not isinstance(patches, list) else patches
+        for i, patch in enumerate(patch_list):
+            if i < len(bins) - 1:
+                bin_center = (bins[i] + bins[i+1]) / 2
+                if bin_center >= 0.7:
+                    patch.set_facecolor('green')
+                elif bin_center >= 0.4:
+                    patch.set_facecolor('orange')
+                else:
+                    patch.set_facecolor('red')
+    
+    ax.set_xlabel('Importance Score', fontsize=12, fontweight='bold')
+    ax.set_ylabel('Number of Items', fontsize=12, fontweight='bold')
+    ax.set_title('Content Importance Distribution', fontsize=14, fontweight='bold')
+    ax.grid(axis='y', alpha=0.3)
+    
+    # Add average line
+    avg_score = float(scores.mean())
+    ax.axvline(avg_score, color='red', linestyle='--', linewidth=2, label=f'Average: {avg_score:.2f}')
+    ax.legend()
+
+
+def _draw_top_sources(fig: Any, ax: Any, sources: list[str], counts: list[int], colors: list) -> None:
+    """Draw the sources with the most items as a horizontal bar chart."""
+    bars = ax.barh(sources, counts, color=colors, edgecolor='black', linewidth=1.2)
+    
+    # Add value labels
+    for bar in bars:
+        width = bar.get_width()
+        ax.text(width, bar.get_y() + bar.get_height()/2.,
+               f'{int(width)}',
+               ha='left', va='center', fontweight='bold', fontsize=10)
+    
+    ax.set_xlabel('Number of Items', fontsize=12, fontweight='bold')
+    ax.set_ylabel('Source', fontsize=12, fontweight='bold')
+    ax.set_title(f'Top {len(sources)} Content Sources', fontsize=14, fontweight='bold')
+    ax.grid(axis='x', alpha=0.3)
+
+
+def _draw_activity_heatmap(fig: Any, ax: Any, heatmap_data: Any) -> None:
+    """Draw a 7x24 (day of week x hour) matrix of post counts as a heatmap."""
+    im = ax.imshow(heatmap_data, cmap='YlOrRd', aspect='auto')
+
+    # Set ticks and labels
+    ax.set_xticks(np.arange(24))
+    ax.set_yticks(np.arange(7))
+    ax.set_xticklabels([f'{h:02d}:00' for h in range(24)])
+    ax.set_yticklabels(['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'])
+
+    # Rotate x-axis labels
+    for label in ax.get_xticklabels():
+        label.set(rotation=45, ha="right", rotation_mode="anchor")
+
+    # Add colorbar
+    cbar = fig.colorbar(im, ax=ax)
+    cbar.set_label('Number of Posts', rotation=270, labelpad=20, fontweight='bold')
+
+    # Add text annotations to the slots that have posts
+    threshold = heatmap_data.max() / 2
+    days, hours = np.nonzero(heatmap_data)
+    for i, j, count in zip(days.tolist(), hours.tolist(), heatmap_data[days, hours].astype(int).tolist()):
+        ax.text(j, i, str(count), ha="center", va="center",
+               color="white" if count > threshold else "black",
+               fontsize=8, fontweight='bold')
+
+    ax.set_title('Content Posting Activity Heatmap', fontsize=14, fontweight='bold')
+    ax.set_xlabel('Hour of Day', fontsize=12, fontweight='bold')
+    ax.set_ylabel('Day of Week', fontsize=12, fontweight='bold')
+
+
+def _draw_content_timeline(fig: Any, ax: Any, hours: list[datetime], counts: list[int]) -> None:
+    """Draw hourly content volume as a line chart."""
+    ax.plot(hours, counts, marker='o', linewidth=2, markersize=6, color='steelblue')
+    ax.fill_between(hours, counts, alpha=0.3, color='steelblue')
+
+    # Format x-axis
+    ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
+    ax.xaxis.set_major_locator(mdates.HourLocator(interval=2))
+    for label in ax.get_xticklabels():
+        label.set(rotation=45, ha='right')
+
+    ax.set_xlabel('Time', fontsize=12, fontweight='bold')
+    ax.set_ylabel('Number of Posts', fontsize=12, fontweight='bold')
+    ax.set_title('Content Volume Timeline', fontsize=14, fontweight='bold')
+    ax.grid(True, alpha=0.3)
+
+
+# Chart kind -> drawing function, called as drawer(fig, ax, **data)
+_DRAWERS = {
+    "category_pie": _draw_category_pie,
+    "category_bar": _draw_category_bar,
+    "importance_distribution": _draw_importance_distribution,
+    "top_sources": _draw_top_sources,
+    "activity_heatmap": _draw_activity_heatmap,
+    "content_timeline": _draw_content_timeline,
+}
+
+# Chart kinds drawn at a fixed size instead of the configured one
+_FIXED_FIGSIZES = {
+    "activity_heatmap": (12, 6),
+}
+
+# Figures share matplotlib's style settings and font caches, so charts
+# rendered in threads of one process take turns; worker processes each
+# hold their own uncontended lock
+_render_lock = threading.Lock()
+_applied_style: str | None = None
+
+
+def _encode_figure(fig: Any, config: ChartConfig, filename: str) -> str | bytes:
+    """Save figure to file or encode as base64."""
+    # base64 output wraps PNG data; matplotlib has no "base64" format
+    image_format = "png" if config.output_format == "base64" else config.output_format
+    # Charts are short-lived, so PNGs favour encoding speed over size
+    pil_kwargs = {"compress_level": config.png_compress_level} if image_format == "png" else None
+    buf = io.BytesIO()
+    fig.savefig(buf, format=image_format, dpi=config.dpi, bbox_inches='tight', pil_kwargs=pil_kwargs)
+    data = buf.getvalue()
+    
+    # Save to file if configured
+    if config.save_to_file:
+        output_path = Path(config.output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+        filepath = output_path / f"{filename}.{image_format}"
+        filepath.write_bytes(data)
+    
+    # Return base64 or bytes
+    if config.output_format == "base64":
+        return base64.b64encode(data).decode('utf-8')
+    return data
+
+
+def _render_chart(kind: str, data: dict[str, Any], config: ChartConfig, filename: str) -> str | bytes:
+    """
+    Draw one chart and encode it.
+    
+    Runs in a worker process (or a thread as fallback), so it only takes
+    picklable arguments and builds the figure from scratch.
+    
+    Args:
+        kind: Chart kind, a key of _DRAWERS
+        data: Keyword arguments for the drawing function
+        config: Chart configuration
+        filename: File name (without extension) used when saving to file
+        
+    Returns:
+        Encoded chart (bytes, or base64 string)
+    """
+    global _applied_style
+
+    with _render_lock:
+        # Spawned workers start with matplotlib's default style
+        if _applied_style != config.style:
+            if config.style in plt.style.available:
+                plt.style.use(config.style)
+            _applied_style = config.style
+
+        # A standalone figure, never registered with pyplot, needs no closing
+        fig = Figure(figsize=_FIXED_FIGSIZES.get(kind, config.figsize))
+        FigureCanvasAgg(fig)
+        ax = fig.subplots()
+        _DRAWERS[kind](fig, ax, **data)
+        return _encode_figure(fig, config, filename)
+
+
+@dataclass(slots=True)
+class _ReportStats:
+    """Chart inputs gathered from a report's items, shared between charts."""
+    categories: list[str]
+    category_counts: list[int]
+    scores: Any  # float array of importance scores
+    source_counts: Counter[str]
+    published: Any  # datetime64[us] array of the items that have a publish time
+
+    @classmethod
+    def from_report(cls, report: DailyReport) -> "_ReportStats":
+        """Collect chart inputs from a report."""
+        items = [item for section in report.sections for item in section.items]
+        return cls(
+            categories=[section.category.value for section in report.sections],
+            category_counts=[len(section.items) for section in report.sections],
+            scores=np.fromiter((item.importance_score for item in items), dtype=float, count=len(items)),
+            source_counts=Counter(item.source.value for item in items),
+            published=np.array([item.published for item in items if item.published], dtype="datetime64[us]")
         )
 
 
@@ -92,6 +358,10 @@ class ChartGenerator:
             "pastel": cm.get_cmap('Pastel1').colors if cm is not None else None,
             "vibrant": cm.get_cmap('Set1').colors if cm is not None else None,
         }
+        
+        # Worker processes are started on the first chart
+        self._use_processes = self.config.use_processes
+        self._pool: ProcessPoolExecutor | None = None
     
     def _get_colors(self, n: int) -> list:
         """Get n colors from the configured color scheme."""
@@ -101,348 +371,179 @@ class ChartGenerator:
             return ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b', '#e377c2', '#7f7f7f', '#bcbd22', '#17becf'][:n]
         return [scheme[i % len(scheme)] for i in range(n)]
     
-    async def _save_or_encode_figure(self, fig: Any, filename: str) -> str | bytes:
-        """Save figure to file or encode as base64."""
-        def _save():
-            buf = io.BytesIO()
-            fig.savefig(buf, format=self.config.output_format, dpi=self.config.dpi, bbox_inches='tight')
-            buf.seek(0)
-            
-            # Save to file if configured
-            if self.config.save_to_file:
-                output_path = Path(self.config.output_dir)
-                output_path.mkdir(parents=True, exist_ok=True)
-                filepath = output_path / f"{filename}.{self.config.output_format}"
-                with open(filepath, 'wb') as f:
-                    f.write(buf.getvalue())
-                buf.seek(0)
-            
-            # Return base64 or bytes
-            if self.config.output_format == "base64":
-                return base64.b64encode(buf.getvalue()).decode('utf-8')
-            else:
-                return buf.getvalue()
+    async def _render(self, kind: str, data: dict[str, Any], filename: str) -> str | bytes:
+        """
+        Render a chart off the event loop.
         
-        # Run in thread pool to avoid blocking
+        Uses the worker process pool when enabled, falling back to the
+        default thread pool if worker processes cannot be started or a
+        chart takes longer than config.render_timeout.
+        
+        Args:
+            kind: Chart kind, a key of _DRAWERS
+            data: Keyword arguments for the drawing function
+            filename: Base file name; the current date is appended
+            
+        Returns:
+            Encoded chart (bytes, or base64 string)
+        """
+        filename = f"{filename}_{datetime.now().strftime('%Y%m%d')}"
         loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(None, _save)
-        if plt is not None:
-            plt.close(fig)
-        return result
+        
+        if self._use_processes:
+            try:
+                if self._pool is None:
+                    self._pool = new_process_pool(self.config.max_workers)
+                return await asyncio.wait_for(
+                    loop.run_in_executor(self._pool, _render_chart, kind, data, self.config, filename),
+                    timeout=self.config.render_timeout
+                )
+            except (OSError, BrokenProcessPool, TimeoutError) as e:
+                logger.warning("Chart worker processes unavailable, rendering in threads: %r", e)
+                self._use_processes = False
+                if self._pool is not None:
+                    # Hung workers would otherwise outlive the pool
+                    kill_workers(self._pool)
+                    self._pool = None
+        
+        return await loop.run_in_executor(None, _render_chart, kind, data, self.config, filename)
     
-    async def generate_category_distribution_pie(self, report: DailyReport) -> str | bytes | None:
+    def close(self) -> None:
+        """Shut down the chart worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+    
+    async def generate_category_distribution_pie(
+        self,
+        report: DailyReport,
+        stats: "_ReportStats | None" = None
+    ) -> str | bytes | None:
         """Generate pie chart showing content distribution by category."""
         if not report.sections or plt is None:
             return None
         
-        def _generate():
-            fig, ax = plt.subplots(figsize=self.config.figsize)
-            
-            # Prepare data
-            categories = [section.category.value for section in report.sections]
-            counts = [len(section.items) for section in report.sections]
-            
-            # Create pie chart
-            colors = self._get_colors(len(categories))
-            pie_result = ax.pie(
-                counts,
-                labels=categories,
-                autopct='%1.1f%%',
-                colors=colors,
-                startangle=90
-            )
-            
-            # Handle both 2-tuple and 3-tuple returns
-            if len(pie_result) == 3:
-                autotexts = pie_result[2]
-                # Styling
-                for autotext in autotexts:
-                    autotext.set_color('white')
-                    autotext.set_fontweight('bold')
-            
-            ax.set_title('Content Distribution by Category', fontsize=14, fontweight='bold')
-            
-            return fig
-        
-        loop = asyncio.get_event_loop()
-        fig = await loop.run_in_executor(None, _generate)
-        return await self._save_or_encode_figure(fig, f"category_distribution_{datetime.now().strftime('%Y%m%d')}")
+        stats = stats or _ReportStats.from_report(report)
+        data = {
+            "categories": stats.categories,
+            "counts": stats.category_counts,
+            "colors": self._get_colors(len(stats.categories))
+        }
+        return await self._render("category_pie", data, "category_distribution")
     
-    async def generate_category_distribution_bar(self, report: DailyReport) -> str | bytes | None:
+    async def generate_category_distribution_bar(
+        self,
+        report: DailyReport,
+        stats: "_ReportStats | None" = None
+    ) -> str | bytes | None:
         """Generate bar chart showing content distribution by category."""
         if not report.sections or plt is None:
             return None
         
-        def _generate():
-            fig, ax = plt.subplots(figsize=self.config.figsize)
-            
-            # Prepare data
-            categories = [section.category.value for section in report.sections]
-            counts = [len(section.items) for section in report.sections]
-            
-            # Create bar chart
-            colors = self._get_colors(len(categories))
-            bars = ax.bar(categories, counts, color=colors, edgecolor='black', linewidth=1.2)
-            
-            # Add value labels on bars
-            for bar in bars:
-                height = bar.get_height()
-                ax.text(bar.get_x() + bar.get_width()/2., height,
-                       f'{int(height)}',
-                       ha='center', va='bottom', fontweight='bold')
-            
-            ax.set_xlabel('Category', fontsize=12, fontweight='bold')
-            ax.set_ylabel('Number of Items', fontsize=12, fontweight='bold')
-            ax.set_title('Content Distribution by Category', fontsize=14, fontweight='bold')
-            ax.grid(axis='y', alpha=0.3)
-            
-            # Rotate x-axis labels if needed
-            plt.xticks(rotation=45, ha='right')
-            
-            return fig
-        
-        loop = asyncio.get_event_loop()
-        fig = await loop.run_in_executor(None, _generate)
-        return await self._save_or_encode_figure(fig, f"category_bar_{datetime.now().strftime('%Y%m%d')}")
+        stats = stats or _ReportStats.from_report(report)
+        data = {
+            "categories": stats.categories,
+            "counts": stats.category_counts,
+            "colors": self._get_colors(len(stats.categories))
+        }
+        return await self._render("category_bar", data, "category_bar")
     
-    async def generate_importance_distribution(self, report: DailyReport) -> str | bytes | None:
+    async def generate_importance_distribution(
+        self,
+        report: DailyReport,
+        stats: "_ReportStats | None" = None
+    ) -> str | bytes | None:
         """Generate histogram showing importance score distribution."""
-        # Collect all importance scores
-        scores = []
-        for section in report.sections:
-            scores.extend([item.importance_score for item in section.items])
-        
-        if not scores or plt is None or np is None:
+        if plt is None or np is None:
             return None
         
-        def _generate():
-            fig, ax = plt.subplots(figsize=self.config.figsize)
-            
-            # Create histogram
-            n, bins, patches = ax.hist(scores, bins=20, color='skyblue', edgecolor='black', alpha=0.7)
-            
-            # Color bars by importance level
-            # Handle both list and BarContainer types
-            if hasattr(patches, '__iter__'):
-                patch_list = list(patches) if not isinstance(patches, list) else patches
-                for i, patch in enumerate(patch_list):
-                    if i < len(bins) - 1:
-                        bin_center = (bins[i] + bins[i+1]) / 2
-                        if bin_center >= 0.7:
-                            patch.set_facecolor('green')
-                        elif bin_center >= 0.4:
-                            patch.set_facecolor('orange')
-                        else:
-                            patch.set_facecolor('red')
-            
-            ax.set_xlabel('Importance Score', fontsize=12, fontweight='bold')
-            ax.set_ylabel('Number of Items', fontsize=12, fontweight='bold')
-            ax.set_title('Content Importance Distribution', fontsize=14, fontweight='bold')
-            ax.grid(axis='y', alpha=0.3)
-            
-            # Add average line
-            avg_score = sum(scores) / len(scores)
-            ax.axvline(avg_score, color='red', linestyle='--', linewidth=2, label=f'Average: {avg_score:.2f}')
-            ax.legend()
-            
-            return fig
+        stats = stats or _ReportStats.from_report(report)
+        if not stats.scores.size:
+            return None
         
-        loop = asyncio.get_event_loop()
-        fig = await loop.run_in_executor(None, _generate)
-        return await self._save_or_encode_figure(fig, f"importance_dist_{datetime.now().strftime('%Y%m%d')}")
+        return await self._render("importance_distribution", {"scores": stats.scores}, "importance_dist")
     
-    async def generate_top_sources(self, report: DailyReport, top_n: int = 10) -> str | bytes | None:
+    async def generate_top_sources(
+        self,
+        report: DailyReport,
+        top_n: int = 10,
+        stats: "_ReportStats | None" = None
+    ) -> str | bytes | None:
         """Generate bar chart showing top sources by content count."""
-        # Count items by source
-        source_counts: Counter[str] = Counter()
-        for section in report.sections:
-            for item in section.items:
-                source_counts[item.source.value] += 1
-        
-        if not source_counts or plt is None:
+        stats = stats or _ReportStats.from_report(report)
+        if not stats.source_counts or plt is None:
             return None
         
-        def _generate():
-            fig, ax = plt.subplots(figsize=self.config.figsize)
-            
-            # Get top N sources
-            top_sources = source_counts.most_common(top_n)
-            sources = [s[0] for s in top_sources]
-            counts = [s[1] for s in top_sources]
-            
-            # Create horizontal bar chart
-            colors = self._get_colors(len(sources))
-            bars = ax.barh(sources, counts, color=colors, edgecolor='black', linewidth=1.2)
-            
-            # Add value labels
-            for bar in bars:
-                width = bar.get_width()
-                ax.text(width, bar.get_y() + bar.get_height()/2.,
-                       f'{int(width)}',
-                       ha='left', va='center', fontweight='bold', fontsize=10)
-            
-            ax.set_xlabel('Number of Items', fontsize=12, fontweight='bold')
-            ax.set_ylabel('Source', fontsize=12, fontweight='bold')
-            ax.set_title(f'Top {len(sources)} Content Sources', fontsize=14, fontweight='bold')
-            ax.grid(axis='x', alpha=0.3)
-            
-            return fig
-        
-        loop = asyncio.get_event_loop()
-        fig = await loop.run_in_executor(None, _generate)
-        return await self._save_or_encode_figure(fig, f"top_sources_{datetime.now().strftime('%Y%m%d')}")
-
-
-    async def generate_activity_heatmap(self, report: DailyReport) -> str | bytes | None:
+        # Get top N sources
+        top_sources = stats.source_counts.most_common(top_n)
+        sources = [s[0] for s in top_sources]
+        counts = [s[1] for s in top_sources]
+        data = {"sources": sources, "counts": counts, "colors": self._get_colors(len(sources))}
+        return await self._render("top_sources", data, "top_sources")
+
+    async def generate_activity_heatmap(
+        self,
+        report: DailyReport,
+        stats: "_ReportStats | None" = None
+    ) -> str | bytes | None:
         """Generate heatmap showing posting patterns by hour and day of week."""
-        # Collect posting times
-        posting_times = []
-        for section in report.sections:
-            for item in section.items:
-                if item.published:
-                    posting_times.append(item.published)
-
-        if not posting_times or plt is None or np is None:
+        if plt is None or np is None:
             return None
 
-        def _generate():
-            fig, ax = plt.subplots(figsize=(12, 6))
-
-            # Create 7x24 matrix (days x hours)
-            heatmap_data = np.zeros((7, 24))
-
-            # Fill matrix with posting counts
-            for dt in posting_times:
-                day_of_week = dt.weekday()  # 0=Monday, 6=Sunday
-                hour = dt.hour
-                heatmap_data[day_of_week][hour] += 1
-
-            # Create heatmap
-            im = ax.imshow(heatmap_data, cmap='YlOrRd', aspect='auto')
-
-            # Set ticks and labels
-            ax.set_xticks(np.arange(24))
-            ax.set_yticks(np.arange(7))
-            ax.set_xticklabels([f'{h:02d}:00' for h in range(24)])
-            ax.set_yticklabels(['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'])
-
-            # Rotate x-axis labels
-            plt.setp(ax.get_xticklabels(), rotation=45, ha="right", rotation_mode="anchor")
-
-            # Add colorbar
-            cbar = plt.colorbar(im, ax=ax)
-            cbar.set_label('Number of Posts', rotation=270, labelpad=20, fontweight='bold')
-
-            # Add text annotations
-            for i in range(7):
-                for j in range(24):
-                    count = int(heatmap_data[i, j])
-                    if count > 0:
-                        ax.text(j, i, str(count), ha="center", va="center",
-                               color="white" if count > heatmap_data.max()/2 else "black",
-                               fontsize=8, fontweight='bold')
-
-            ax.set_title('Content Posting Activity Heatmap', fontsize=14, fontweight='bold')
-            ax.set_xlabel('Hour of Day', fontsize=12, fontweight='bold')
-            ax.set_ylabel('Day of Week', fontsize=12, fontweight='bold')
-
-            return fig
+        stats = stats or _ReportStats.from_report(report)
+        if not stats.published.size:
+            return None
 
-        loop = asyncio.get_event_loop()
-        fig = await loop.run_in_executor(None, _generate)
-        return await self._save_or_encode_figure(fig, f"activity_heatmap_{datetime.now().strftime('%Y%m%d')}")
+        # Hours since the epoch give both the weekday (1970-01-01 was a
+        # Thursday) and the hour of day; count posts per slot and shape into
+        # a 7x24 matrix (days x hours, 0=Monday)
+        epoch_hours = stats.published.astype("datetime64[h]").astype(np.int64)
+        slots = (epoch_hours // 24 + 3) % 7 * 24 + epoch_hours % 24
+        heatmap_data = np.bincount(slots, minlength=7 * 24).reshape(7, 24).astype(float)
+        return await self._render("activity_heatmap", {"heatmap_data": heatmap_data}, "activity_heatmap")
 
-    async def generate_content_timeline(self, report: DailyReport) -> str | bytes | None:
+    async def generate_content_timeline(
+        self,
+        report: DailyReport,
+        stats: "_ReportStats | None" = None
+    ) -> str | bytes | None:
         """Generate line chart showing content volume over time."""
-        # Collect posting times
-        posting_times = []
-        for section in report.sections:
-            for item in section.items:
-                if item.published:
-                    posting_times.append(item.published)
-
-        if not posting_times or plt is None or mdates is None:
+        if plt is None or np is None or mdates is None:
             return None
 
-        def _generate():
-            fig, ax = plt.subplots(figsize=self.config.figsize)
-
-            # Sort times
-            posting_times.sort()
-
-            # Group by hour
-            hourly_counts = defaultdict(int)
-            for dt in posting_times:
-                hour_key = dt.replace(minute=0, second=0, microsecond=0)
-                hourly_counts[hour_key] += 1
-
-            # Prepare data for plotting
-            hours = sorted(hourly_counts.keys())
-            counts = [hourly_counts[h] for h in hours]
-
-            # Create line chart
-            ax.plot(hours, counts, marker='o', linewidth=2, markersize=6, color='steelblue')
-            ax.fill_between(hours, counts, alpha=0.3, color='steelblue')
-
-            # Format x-axis
-            ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
-            ax.xaxis.set_major_locator(mdates.HourLocator(interval=2))
-            plt.xticks(rotation=45, ha='right')
-
-            ax.set_xlabel('Time', fontsize=12, fontweight='bold')
-            ax.set_ylabel('Number of Posts', fontsize=12, fontweight='bold')
-            ax.set_title('Content Volume Timeline', fontsize=14, fontweight='bold')
-            ax.grid(True, alpha=0.3)
-
-            return fig
+        stats = stats or _ReportStats.from_report(report)
+        if not stats.published.size:
+            return None
 
-        loop = asyncio.get_event_loop()
-        fig = await loop.run_in_executor(None, _generate)
-        return await self._save_or_encode_figure(fig, f"content_timeline_{datetime.now().strftime('%Y%m%d')}")
+        # Floor posting times to the hour and count each hour
+        hour_slots, counts = np.unique(stats.published.astype("datetime64[h]"), return_counts=True)
+        hours = hour_slots.astype("datetime64[us]").tolist()
+        data = {"hours": hours, "counts": counts.tolist()}
+        return await self._render("content_timeline", data, "content_timeline")
 
     async def generate_all_charts(self, report: DailyReport) -> dict[str, str | bytes]:
-        """Generate all available charts for the report."""
-        charts = {}
-
-        try:
+        """Generate all available charts for the report, rendering them concurrently."""
+        jobs = (
             # Category distribution (bar chart preferred over pie for readability)
-            chart = await self.generate_category_distribution_bar(report)
-            if chart:
-                charts['category_distribution'] = chart
-        except Exception as e:
-            print(f"Failed to generate category distribution chart: {e}")
-
-        try:
-            # Importance distribution
-            chart = await self.generate_importance_distribution(report)
-            if chart:
-                charts['importance_distribution'] = chart
-        except Exception as e:
-            print(f"Failed to generate importance distribution chart: {e}")
-
-        try:
-            # Top sources
-            chart = await self.generate_top_sources(report)
-            if chart:
-                charts['top_sources'] = chart
-        except Exception as e:
-            print(f"Failed to generate top sources chart: {e}")
-
-        try:
-            # Activity heatmap
-            chart = await self.generate_activity_heatmap(report)
-            if chart:
-                charts['activity_heatmap'] = chart
-        except Exception as e:
-            print(f"Failed to generate activity heatmap: {e}")
-
-        try:
-            # Content timeline
-            chart = await self.generate_content_timeline(report)
-            if chart:
-                charts['content_timeline'] = chart
-        except Exception as e:
-            print(f"Failed to generate content timeline: {e}")
+            ('category_distribution', self.generate_category_distribution_bar, "category distribution chart"),
+            ('importance_distribution', self.generate_importance_distribution, "importance distribution chart"),
+            ('top_sources', self.generate_top_sources, "top sources chart"),
+            ('activity_heatmap', self.generate_activity_heatmap, "activity heatmap"),
+            ('content_timeline', self.generate_content_timeline, "content timeline"),
+        )
+        # Walk the report's items once for all charts
+        stats = _ReportStats.from_report(report)
+        results = await asyncio.gather(
+            *(generate(report, stats=stats) for _, generate, _ in jobs),
+            return_exceptions=True
+        )
+
+        charts = {}
+        for (name, _, description), chart in zip(jobs, results):
+            if isinstance(chart, Exception):
+                logger.warning("Failed to generate %s: %s", description, chart)
+            elif chart:
+                charts[name] = chart
 
         return charts
 
@@ -450,4 +551,3 @@ class ChartGenerator:
 def is_available() -> bool:
     """Check if matplotlib is available."""
     return MATPLOTLIB_AVAILABLE
-
@@ -6,12 +6,71 @@ Contains common logic for flag parsing, URL extraction, and AI summarization.
 from __future__ import annotations
 
 import os
+import re
+import time
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
 from typing import Any
 
-from utils.tavily_client import extract_urls, tavily_extract, TavilyOptions
+from utils.tavily_client import iter_urls, tavily_extract, TavilyOptions
 from utils.openrouter_client import summarize_batch, ORSummaryOptions
 
 
+# Seconds extracted pages are reused, e.g. when /bili_desc and
+# /bili_latest are run on the same video
+_RESULT_CACHE_TTL = 300
+
+# Characters of each page passed on for summarization
+_MAX_PAGE_CHARS = 8000
+
+# Cache key -> (expiry on the monotonic clock, result)
+_result_cache: dict[tuple[Any, ...], tuple[float, Any]] = {}
+
+
+def _cache_get(key: tuple[Any, ...]) -> Any | None:
+    """Get a cached Tavily result, or None if missing or expired."""
+    entry = _result_cache.get(key)
+    if entry is None or entry[0] < time.monotonic():
+        return None
+    return entry[1]
+
+
+def _cache_set(key: tuple[Any, ...], value: Any) -> None:
+    """Cache a Tavily result, dropping expired entries."""
+    now = time.monotonic()
+    for expired in [k for k, (expires_at, _) in _result_cache.items() if expires_at < now]:
+        del _result_cache[expired]
+    _result_cache[key] = (now + _RESULT_CACHE_TTL, value)
+
+
+# Matches "--name [value]" (value must not itself be a flag) or a bare word
+_FLAG_TOKEN_RE = re.compile(r"--(\w[\w-]*)(?:\s+(?!--)(\S+))?|(\S+)")
+
+
+def split_keywords_and_flags(text: str) -> tuple[list[str], dict[str, str]]:
+    """
+    Split free-form command text into keywords and --name value flags.
+    
+    A flag takes the following token as its value unless that token is
+    itself a flag, in which case the flag's value is an empty string.
+    
+    Args:
+        text: Command arguments as a single string
+        
+    Returns:
+        Tuple of (keywords, flags)
+    """
+    keywords: list[str] = []
+    flags: dict[str, str] = {}
+    for name, value, word in _FLAG_TOKEN_RE.findall(text):
+        if name:
+            flags[name] = value
+        else:
+            keywords.append(word)
+    return keywords, flags
+
+
 def parse_command_flags(argv: list[str]) -> dict[str, Any]:
     """
     Parse simple flags used by commands.
@@ -29,6 +88,13 @@ def parse_command_flags(argv: list[str]) -> dict[str, Any]:
     Returns:
         Dictionary with parsed flags and '_consumed' key indicating how many args were consumed
     """
+    # Callers get their own copy of the cached result
+    return dict(_parse_command_flags(tuple(argv)))
+
+
+@lru_cache(maxsize=256)
+def _parse_command_flags(argv: tuple[str, ...]) -> MappingProxyType[str, Any]:
+    """Parse command flags, memoized per argument tuple (see parse_command_flags)."""
     flags: dict[str, Any] = {
         "extract": False,
         "max": 3,
@@ -61,7 +127,7 @@ def parse_command_flags(argv: list[str]) -> dict[str, Any]:
             # stop at first non-flag
             break
     flags["_consumed"] = i
-    return flags
+    return MappingProxyType(flags)
 
 
 async def extract_and_summarize_urls(
@@ -99,14 +165,13 @@ async def extract_and_summarize_urls(
         "error": None,
     }
     
-    # Extract URLs
-    urls = extract_urls(description)
+    # Extract URLs, stopping once enough are found
+    urls = list(islice(iter_urls(description), max(0, int(flags.get("max", 3)))))
     if not urls:
         result["message"] = "简介中未发现链接。"
         result["success"] = True
         return result
     
-    urls = urls[: int(flags.get("max", 3))]
     result["urls"] = urls
     
     # Get API keys
@@ -117,12 +182,18 @@ async def extract_and_summarize_urls(
         return result
     
     # Extract content from URLs
+    depth = str(flags.get("depth", "basic"))
+    fmt = str(flags.get("format", "markdown"))
+    extract_key = ("extract", tuple(urls), depth, fmt)
     try:
-        tdata = await tavily_extract(urls, TavilyOptions(
-            api_key=tkey,
-            extract_depth=str(flags.get("depth", "basic")),
-            format=str(flags.get("format", "markdown")),
-        ))
+        tdata = _cache_get(extract_key)
+        if tdata is None:
+            tdata = await tavily_extract(urls, TavilyOptions(
+                api_key=tkey,
+                extract_depth=depth,
+                format=fmt,
+            ))
+            _cache_set(extract_key, tdata)
         result["extracted_content"] = tdata
     except Exception as e:
         result["error"] = f"链接内容提取失败：{e}"
@@ -142,27 +213,14 @@ async def extract_and_summarize_urls(
         return result
     
     # Extract content pairs for summarization
-    items = tdata.get("results") if isinstance(tdata, dict) else None
-    pairs: list[tuple[str | None, str]] = []
-    if isinstance(items, list):
-        for it in items[: int(flags.get("max", 3))]:
-            if isinstance(it, dict):
-                url = it.get("url") if isinstance(it.get("url"), str) else None
-                content = (
-                    it.get("markdown")
-                    or it.get("content")
-                    or it.get("text")
-                    or it.get("raw_content")
-                )
-                if isinstance(content, str) and content.strip():
-                    pairs.append((url, content[:8000]))
+    pairs = _summary_pairs(tdata, int(flags.get("max", 3)))
     
     if not pairs:
         result["message"] += "\n未找到可供总结的正文内容。"
         result["success"] = True
         return result
     
-    # Summarize
+    # Summarize (summarize_batch reuses recent summaries of the same content)
     try:
         sres = await summarize_batch(
             pairs,
@@ -190,6 +248,25 @@ async def extract_and_summarize_urls(
     return result
 
 
+def _summary_pairs(tdata: Any, limit: int | None = None) -> list[tuple[str | None, str]]:
+    """Collect (url, content) pairs worth summarizing from a Tavily response."""
+    items = tdata.get("results") if isinstance(tdata, dict) else None
+    pairs: list[tuple[str | None, str]] = []
+    if isinstance(items, list):
+        for it in items[:limit]:
+            if isinstance(it, dict):
+                url = it.get("url") if isinstance(it.get("url"), str) else None
+                content = (
+                    it.get("markdown")
+                    or it.get("content")
+                    or it.get("text")
+                    or it.get("raw_content")
+                )
+                if isinstance(content, str) and content.strip():
+                    pairs.append((url, content[:_MAX_PAGE_CHARS]))
+    return pairs
+
+
 def format_summary_message(summaries: list[dict[str, Any]]) -> str:
     """
     Format AI summaries into a user-friendly message.
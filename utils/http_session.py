@@ -0,0 +1,100 @@
+"""
+Shared HTTP session for the plugin's API clients.
+
+OpenRouter and Tavily requests reuse one connection pool, so repeated
+calls to the same host skip the TCP and TLS handshakes. Their JSON
+responses are decoded with json_loads.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+import aiohttp
+
+from utils.json_utils import json_loads
+
+try:
+    import aiodns  # noqa: F401  # used by aiohttp.AsyncResolver
+    AIODNS_AVAILABLE = True
+except ImportError:
+    AIODNS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Total timeout for requests that do not set their own, in seconds
+DEFAULT_TIMEOUT = 60
+
+# Response bodies larger than this many bytes are decoded off the event loop
+LARGE_BODY_SIZE = 1 << 20
+
+_session: aiohttp.ClientSession | None = None
+_session_loop: asyncio.AbstractEventLoop | None = None
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """
+    Get the shared session, creating it on first use.
+
+    Pass per-request headers and timeouts to the request methods; the
+    session is shared by clients of different APIs. Host names are
+    resolved with aiodns when it is installed, instead of in threads.
+
+    Returns:
+        Open client session bound to the running event loop
+    """
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    # A session cannot be used from another event loop, e.g. after a restart
+    if _session is None or _session.closed or _session_loop is not loop:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=10,
+                ttl_dns_cache=300,
+                resolver=aiohttp.AsyncResolver() if AIODNS_AVAILABLE else None,
+            ),
+            timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT),
+        )
+        _session_loop = loop
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared session and its pooled connections."""
+    global _session, _session_loop
+    if _session is not None and not _session.closed and _session_loop is asyncio.get_running_loop():
+        await _session.close()
+    _session = None
+    _session_loop = None
+
+
+async def read_json(resp: aiohttp.ClientResponse) -> Any:
+    """
+    Read and decode a JSON response body with json_loads (orjson when installed).
+
+    Large bodies, such as advanced-depth Tavily extractions, are decoded in
+    a worker thread so other requests keep being served meanwhile.
+    
+    aiohttp already asks for compressed responses (Accept-Encoding) and
+    decompresses them, so the body read here is the decoded one.
+
+    Args:
+        resp: Response to read
+
+    Returns:
+        Decoded JSON document
+
+    Raises:
+        ValueError: If the body is not valid JSON
+    """
+    body = await resp.read()
+    logger.debug(
+        "%s: %d bytes, Content-Encoding %s",
+        resp.url.host, len(body), resp.headers.get("Content-Encoding", "identity"),
+    )
+    if len(body) > LARGE_BODY_SIZE:
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, json_loads, body)
+    return json_loads(body)
@@ -4,7 +4,7 @@ Link extraction utilities for finding Bilibili video links in content.
 Extracts and validates Bilibili video URLs from text content.
 """
 import re
-from typing import Pattern
+from typing import Match, Pattern
 
 
 # Bilibili URL patterns
@@ -19,13 +19,40 @@ BILIBILI_PATTERNS: list[Pattern] = [
     re.compile(r'https?://m\.bilibili\.com/video/(BV[a-zA-Z0-9]+)', re.IGNORECASE),
 ]
 
+# All of the above in one pattern, so text is scanned once.
+# Group 1 is a BV/AV ID, group 2 a short link code.
+_BILIBILI_URL = re.compile(
+    r'https?://(?:(?:www\.|m\.)?bilibili\.com/video/(BV[a-zA-Z0-9]+|av\d+)|b23\.tv/([a-zA-Z0-9]+))',
+    re.IGNORECASE
+)
 
-def extract_bilibili_links(text: str) -> list[str]:
+
+def _normalize_from_match(match: Match[str]) -> str | None:
+    """Normalize a link matched by _BILIBILI_URL, or None if its ID is invalid."""
+    video_id = match.group(1)
+    if video_id is None:
+        # Short links (b23.tv) need to be resolved, keep them as found
+        return match.group(0)
+    if video_id.startswith(('BV', 'av')):
+        return f"https://www.bilibili.com/video/{video_id}"
+    return None
+
+
+def _video_id_from_match(match: Match[str]) -> str | None:
+    """Get the BV/AV ID of a link matched by _BILIBILI_URL, if it has one."""
+    # Short link codes count too when they are BV IDs (b23.tv/BV...)
+    video_id = match.group(1) or match.group(2)
+    return video_id if video_id.startswith(('BV', 'av')) else None
+
+
+def extract_bilibili_links(text: str, dedup_ids: bool = False) -> list[str]:
     """
     Extract Bilibili video links from text.
     
     Args:
         text: Text content to search for Bilibili links
+        dedup_ids: Also drop links to a video already found under another
+            URL, like deduplicate_links does
         
     Returns:
         List of unique Bilibili video URLs found in the text
@@ -36,15 +63,15 @@ def extract_bilibili_links(text: str) -> list[str]:
     links = []
     seen = set()
     
-    for pattern in BILIBILI_PATTERNS:
-        matches = pattern.finditer(text)
-        for match in matches:
-            url = match.group(0)
-            # Normalize URL
-            normalized = normalize_bilibili_url(url)
-            if normalized and normalized not in seen:
-                links.append(normalized)
-                seen.add(normalized)
+    for match in _BILIBILI_URL.finditer(text):
+        normalized = _normalize_from_match(match)
+        if normalized is None:
+            continue
+        
+        key = (_video_id_from_match(match) or normalized) if dedup_ids else normalized
+        if key not in seen:
+            links.append(normalized)
+            seen.add(key)
     
     return links
 
@@ -62,20 +89,15 @@ def normalize_bilibili_url(url: str) -> str | None:
     if not url:
         return None
     
-    # Extract video ID
-    for pattern in BILIBILI_PATTERNS:
-        match = pattern.search(url)
-        if match:
-            video_id = match.group(1)
-            
-            # Handle short links (b23.tv) - these need to be resolved
-            # For now, just return the original URL
-            if 'b23.tv' in url:
-                return url
-            
-            # Normalize to standard format
-            if video_id.startswith('BV') or video_id.startswith('av'):
-                return f"https://www.bilibili.com/video/{video_id}"
+    for match in _BILIBILI_URL.finditer(url):
+        # Handle short links (b23.tv) - these need to be resolved
+        # For now, just return the original URL
+        if 'b23.tv' in url:
+            return url
+        
+        normalized = _normalize_from_match(match)
+        if normalized:
+            return normalized
     
     return None
 
@@ -93,12 +115,10 @@ def extract_video_id(url: str) -> str | None:
     if not url:
         return None
     
-    for pattern in BILIBILI_PATTERNS:
-        match = pattern.search(url)
-        if match:
-            video_id = match.group(1)
-            if video_id.startswith('BV') or video_id.startswith('av'):
-                return video_id
+    for match in _BILIBILI_URL.finditer(url):
+        video_id = _video_id_from_match(match)
+        if video_id:
+            return video_id
     
     return None
 
@@ -116,11 +136,7 @@ def is_bilibili_url(url: str) -> bool:
     if not url:
         return False
     
-    for pattern in BILIBILI_PATTERNS:
-        if pattern.search(url):
-            return True
-    
-    return False
+    return _BILIBILI_URL.search(url) is not None
 
 
 def deduplicate_links(links: list[str]) -> list[str]:
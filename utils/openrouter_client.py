@@ -7,17 +7,63 @@ Docs:
 """
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import random
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, TypeVar
 
 import aiohttp
 
+from utils.http_session import get_session, read_json
+from utils.json_utils import json_dumps, json_loads
+
 OPENROUTER_BASE = "https://openrouter.ai/api/v1"
 OPENROUTER_CHAT = f"{OPENROUTER_BASE}/chat/completions"
 DEFAULT_MODEL = "minimax/minimax-m2:free"
 
+# Exponential backoff between retries of transient failures, in seconds
+RETRY_INITIAL_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+
+# Retries per item in summarize_batch after rate limiting or server errors
+DEFAULT_RETRIES = 3
+
+# Content longer than this many characters (~6k tokens) is cut before sending
+DEFAULT_MAX_INPUT_CHARS = 24_000
+TRUNCATION_MARKER = "\n...[truncated]...\n"
+
+SYSTEM_PROMPT_ZH = (
+    "你是一个专业的信息整理助手。请用简洁的要点总结输入网页的核心信息，"
+    "包含：主题、关键信息点（使用项目符号）、重要数据/结论、作者或发布日期（若有），"
+    "并给出3-5条高价值要点。保持客观、准确、可读，避免冗长。"
+)
+SYSTEM_PROMPT_EN = (
+    "You are a helpful summarizer. Provide a concise, objective summary of the provided web page, "
+    "including topic, key bullet points, notable data/findings, author/date (if available), "
+    "and 3-5 high-value takeaways. Keep it accurate and scannable."
+)
+
+# Shared system messages, never modified. Keep them free of per-call data:
+# providers cache the prompt prefix only while it stays byte-identical.
+_SYSTEM_MESSAGES: dict[str, dict[str, str]] = {
+    "zh": {"role": "system", "content": SYSTEM_PROMPT_ZH},
+    "en": {"role": "system", "content": SYSTEM_PROMPT_EN},
+}
 
-@dataclass(slots=True)
+# Most summaries kept in memory by summarize_batch
+SUMMARY_CACHE_SIZE = 512
+
+# Prompt hash -> (expiry on the monotonic clock, summary), least recently used first
+_summary_cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True, frozen=True)
 class ORSummaryOptions:
     """Options for OpenRouter summarization."""
     api_key: str
@@ -25,9 +71,40 @@ class ORSummaryOptions:
     temperature: float = 0.2
     max_tokens: int | None = None
     language: str = "zh"  # output language: zh/en
+    max_concurrency: int = 8  # requests in flight at once in summarize_batch
+    cache_ttl: float = 3600  # seconds summarize_batch reuses a summary; 0 disables
+    max_input_chars: int = DEFAULT_MAX_INPUT_CHARS  # longer content is truncated; 0 disables
+    return_raw: bool = False  # keep each full response as "raw" in summarize_batch results
 
 
-def build_summary_prompt(content: str, url: str | None = None, *, language: str = "zh") -> list[dict[str, str]]:
+def truncate_content(content: str, max_chars: int) -> str:
+    """
+    Cut content to about max_chars, keeping its head and tail.
+    
+    The opening 80% and closing 20% of the budget are kept around a
+    truncation marker, since conclusions often sit at the end of a page.
+    
+    Args:
+        content: Content to truncate
+        max_chars: Character budget; 0 or less keeps the content whole
+        
+    Returns:
+        Content unchanged if within budget, otherwise its head and tail
+    """
+    if max_chars <= 0 or len(content) <= max_chars:
+        return content
+    head = int(max_chars * 0.8)
+    tail = max_chars - head
+    return content[:head] + TRUNCATION_MARKER + content[-tail:]
+
+
+def build_summary_prompt(
+    content: str,
+    url: str | None = None,
+    *,
+    language: str = "zh",
+    max_input_chars: int = DEFAULT_MAX_INPUT_CHARS,
+) -> list[dict[str, str]]:
     """
     Build prompt messages for summarization.
     
@@ -35,39 +112,37 @@ def build_summary_prompt(content: str, url: str | None = None, *, language: str
         content: Content to summarize
         url: Optional source URL
         language: Output language (zh/en)
+        max_input_chars: Content longer than this is truncated; 0 disables
         
     Returns:
         List of message dictionaries for chat completion
     """
-    system_cn = (
-        "你是一个专业的信息整理助手。请用简洁的要点总结输入网页的核心信息，"
-        "包含：主题、关键信息点（使用项目符号）、重要数据/结论、作者或发布日期（若有），"
-        "并给出3-5条高价值要点。保持客观、准确、可读，避免冗长。"
-    )
-    system_en = (
-        "You are a helpful summarizer. Provide a concise, objective summary of the provided web page, "
-        "including topic, key bullet points, notable data/findings, author/date (if available), "
-        "and 3-5 high-value takeaways. Keep it accurate and scannable."
-    )
-    system = system_cn if language.lower().startswith("zh") else system_en
+    system = _SYSTEM_MESSAGES["zh" if language.lower().startswith("zh") else "en"]
 
     user_prefix = f"Source: {url}\n\n" if url else ""
     user = (
-        f"{user_prefix}Content to summarize (may be truncated):\n\n" + content
+        f"{user_prefix}Content to summarize (may be truncated):\n\n"
+        + truncate_content(content, max_input_chars)
     )
     return [
-        {"role": "system", "content": system},
+        system,
         {"role": "user", "content": user},
     ]
 
 
-async def openrouter_chat(messages: list[dict[str, str]], opts: ORSummaryOptions) -> dict[str, Any]:
+async def openrouter_chat(
+    messages: list[dict[str, str]],
+    opts: ORSummaryOptions,
+    session: aiohttp.ClientSession | None = None,
+) -> dict[str, Any]:
     """
     Call OpenRouter chat completion API.
     
     Args:
         messages: List of message dictionaries
         opts: OpenRouter options
+        session: Existing session to send the request on; the shared
+            session is used when omitted
         
     Returns:
         API response dictionary
@@ -75,13 +150,88 @@ async def openrouter_chat(messages: list[dict[str, str]], opts: ORSummaryOptions
     Raises:
         RuntimeError: If response format is unexpected
     """
-    headers = {
+    headers = _build_headers(opts)
+    payload = _build_payload(messages, opts)
+
+    if session is None:
+        session = await get_session()
+    return await _post_chat(session, headers, payload)
+
+
+def is_retryable_error(exc: BaseException) -> bool:
+    """
+    Check whether a failed request is worth retrying.
+    
+    Rate limiting, server errors, connection problems and timeouts are
+    transient; other HTTP errors (bad request, auth) are not.
+    
+    Args:
+        exc: Exception raised by the request
+        
+    Returns:
+        True if the request may succeed when retried
+    """
+    if isinstance(exc, aiohttp.ClientResponseError):
+        return exc.status == 429 or exc.status >= 500
+    return isinstance(exc, (aiohttp.ClientConnectionError, asyncio.TimeoutError))
+
+
+def _retry_after(exc: BaseException) -> float | None:
+    """Get the delay in seconds a rate-limited response asked for, if any."""
+    if not isinstance(exc, aiohttp.ClientResponseError) or not exc.headers:
+        return None
+    try:
+        return max(0.0, float(exc.headers.get("Retry-After", "")))
+    except ValueError:
+        # Missing, or an HTTP date; fall back to backoff
+        return None
+
+
+async def with_retries(call: Callable[[], Awaitable[T]], retries: int) -> T:
+    """
+    Await a request, retrying transient failures with exponential backoff and jitter.
+    
+    A Retry-After header (in seconds) on the failed response takes the
+    place of the backoff delay, capped at RETRY_MAX_DELAY.
+    
+    Args:
+        call: Function starting a fresh attempt of the request
+        retries: Maximum number of retries after the first attempt
+        
+    Returns:
+        Result of the first successful attempt
+        
+    Raises:
+        Exception: The last error if it is not retryable or retries run out
+    """
+    attempt = 0
+    while True:
+        try:
+            return await call()
+        except Exception as e:
+            if attempt >= retries or not is_retryable_error(e):
+                raise
+            delay = _retry_after(e)
+            if delay is None:
+                delay = RETRY_INITIAL_DELAY * 2 ** attempt + random.uniform(0, 1)
+            delay = min(RETRY_MAX_DELAY, delay)
+            attempt += 1
+            await asyncio.sleep(delay)
+
+
+def _build_headers(opts: ORSummaryOptions) -> dict[str, str]:
+    """Build OpenRouter request headers."""
+    return {
         "Authorization": f"Bearer {opts.api_key}",
         "Content-Type": "application/json",
         "HTTP-Referer": "https://github.com/AstroAir/astrbot_sast_plugin",
         "X-Title": "astrbot_sast_plugin summarizer",
         "User-Agent": "astrbot-sast-plugin/2.0",
     }
+
+
+def _build_payload(messages: list[dict[str, str]], opts: ORSummaryOptions) -> dict[str, Any]:
+    """Build a chat completion request body."""
     payload: dict[str, Any] = {
         "model": opts.model,
         "messages": messages,
@@ -89,14 +239,113 @@ async def openrouter_chat(messages: list[dict[str, str]], opts: ORSummaryOptions
     }
     if opts.max_tokens is not None:
         payload["max_tokens"] = opts.max_tokens
+    return payload
+
+
+async def openrouter_chat_stream(
+    messages: list[dict[str, str]],
+    opts: ORSummaryOptions,
+    session: aiohttp.ClientSession | None = None,
+) -> AsyncIterator[str]:
+    """
+    Call OpenRouter chat completion API with streaming.
+    
+    Args:
+        messages: List of message dictionaries
+        opts: OpenRouter options
+        session: Existing session to send the request on; the shared
+            session is used when omitted
+        
+    Yields:
+        Pieces of the completion text as they are generated
+        
+    Raises:
+        RuntimeError: If the stream reports an error
+    """
+    headers = _build_headers(opts)
+    payload = _build_payload(messages, opts)
+    payload["stream"] = True
+
+    if session is None:
+        session = await get_session()
+    async for chunk in _post_chat_stream(session, headers, payload):
+        yield chunk
+
+
+async def _post_chat_stream(
+    session: aiohttp.ClientSession,
+    headers: dict[str, str],
+    payload: dict[str, Any],
+) -> AsyncIterator[str]:
+    """Send a streaming chat completion request and yield content deltas."""
+    async with session.post(OPENROUTER_CHAT, data=json_dumps(payload), headers=headers) as resp:
+        resp.raise_for_status()
+        # Server-sent events: "data: {...}" lines, ":" comment keep-alives
+        async for raw_line in resp.content:
+            line = raw_line.strip()
+            if not line.startswith(b"data:"):
+                continue
+            data = line[5:].strip()
+            if data == b"[DONE]":
+                break
+
+            event = json_loads(data)
+            if not isinstance(event, dict):
+                raise RuntimeError("Unexpected OpenRouter stream format")
+            if "error" in event:
+                raise RuntimeError(f"OpenRouter stream error: {event['error']}")
+
+            choices = event.get("choices")
+            if isinstance(choices, list) and choices and isinstance(choices[0], dict):
+                delta = choices[0].get("delta")
+                if isinstance(delta, dict):
+                    content = delta.get("content")
+                    if isinstance(content, str) and content:
+                        yield content
+
+
+async def _post_chat(
+    session: aiohttp.ClientSession,
+    headers: dict[str, str],
+    payload: dict[str, Any],
+) -> dict[str, Any]:
+    """Send a chat completion request and validate the response shape."""
+    async with session.post(OPENROUTER_CHAT, data=json_dumps(payload), headers=headers) as resp:
+        resp.raise_for_status()
+        data = await read_json(resp)
+        if not isinstance(data, dict):
+            raise RuntimeError("Unexpected OpenRouter response format")
+        return data
+
+
+def _summary_cache_key(messages: list[dict[str, str]], opts: ORSummaryOptions) -> str:
+    """Hash everything that determines a summary: model, sampling and prompt."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{opts.model}|{opts.temperature}|{opts.max_tokens}".encode("utf-8"))
+    for message in messages:
+        h.update(b"\x00")
+        h.update(message["content"].encode("utf-8"))
+    return h.hexdigest()
 
-    async with aiohttp.ClientSession(headers=headers, timeout=aiohttp.ClientTimeout(total=60)) as session:
-        async with session.post(OPENROUTER_CHAT, json=payload) as resp:
-            resp.raise_for_status()
-            data = await resp.json(content_type=None)
-            if not isinstance(data, dict):
-                raise RuntimeError("Unexpected OpenRouter response format")
-            return data
+
+def _get_cached_summary(key: str) -> str | None:
+    """Get a cached summary, or None if missing or expired."""
+    entry = _summary_cache.get(key)
+    if entry is None:
+        return None
+    if entry[0] < time.monotonic():
+        del _summary_cache[key]
+        return None
+    _summary_cache.move_to_end(key)
+    return entry[1]
+
+
+def _cache_summary(key: str, summary: str, ttl: float) -> None:
+    """Cache a summary, evicting the least recently used beyond SUMMARY_CACHE_SIZE."""
+    _summary_cache[key] = (time.monotonic() + ttl, summary)
+    _summary_cache.move_to_end(key)
+    while len(_summary_cache) > SUMMARY_CACHE_SIZE:
+        _summary_cache.popitem(last=False)
 
 
 def extract_choice_text(data: dict[str, Any]) -> str | None:
@@ -109,36 +358,96 @@ def extract_choice_text(data: dict[str, Any]) -> str | None:
     Returns:
         Extracted text or None if not found
     """
-    choices = data.get("choices")
-    if isinstance(choices, list) and choices:
-        msg = choices[0].get("message") if isinstance(choices[0], dict) else None
-        if isinstance(msg, dict):
-            content = msg.get("content")
-            if isinstance(content, str):
-                return content
-    return None
+    try:
+        content = data["choices"][0]["message"]["content"]
+    except (KeyError, IndexError, TypeError):
+        return None
+    # Content is null for tool calls
+    return content if isinstance(content, str) else None
 
 
-async def summarize_batch(texts: list[tuple[str | None, str]], opts: ORSummaryOptions) -> list[dict[str, Any]]:
+async def summarize_batch(
+    texts: list[tuple[str | None, str]],
+    opts: ORSummaryOptions,
+    *,
+    max_concurrency: int | None = None,
+    return_exceptions: bool = False,
+    retries: int = DEFAULT_RETRIES,
+    session: aiohttp.ClientSession | None = None,
+    semaphore: asyncio.Semaphore | None = None,
+) -> list[dict[str, Any]]:
     """
     Summarize a batch of (url, content) pairs.
     
+    All requests in the batch share one HTTP session. Summaries are kept
+    in memory for opts.cache_ttl seconds, so repeating a prompt returns the
+    earlier summary without a request (marked "cached": True).
+    
     Args:
         texts: List of (url, content) tuples
         opts: OpenRouter options
+        max_concurrency: Maximum number of requests in flight at once
+            (defaults to opts.max_concurrency)
+        return_exceptions: If True, a failed item yields summary None and an
+            "error" message instead of aborting the whole batch
+        retries: Number of times to retry an item after a transient failure
+        session: Existing session to send the requests on; the shared
+            session is used if omitted
+        semaphore: Semaphore shared with other batches; overrides
+            max_concurrency so several batches respect one limit
         
     Returns:
-        List of dictionaries with url, summary, and raw_response
+        List of dictionaries with url, summary, and token usage, in input
+        order; full responses are included as "raw" only if opts.return_raw
     """
-    results: list[dict[str, Any]] = []
-    for url, content in texts:
-        messages = build_summary_prompt(content, url, language=opts.language)
-        data = await openrouter_chat(messages, opts)
+    if not texts:
+        return []
+
+    if semaphore is None:
+        if max_concurrency is None:
+            max_concurrency = opts.max_concurrency
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def summarize_one(
+        session: aiohttp.ClientSession,
+        url: str | None,
+        content: str
+    ) -> dict[str, Any]:
+        messages = build_summary_prompt(
+            content, url, language=opts.language, max_input_chars=opts.max_input_chars
+        )
+        key = _summary_cache_key(messages, opts) if opts.cache_ttl > 0 else None
+        if key is not None:
+            cached = _get_cached_summary(key)
+            if cached is not None:
+                return {"url": url, "summary": cached, "usage": None, "cached": True}
+
+        async def attempt() -> dict[str, Any]:
+            async with semaphore:
+                return await openrouter_chat(messages, opts, session=session)
+
+        # Backoff sleeps happen outside the semaphore so other items proceed
+        try:
+            data = await with_retries(attempt, retries)
+        except Exception as e:
+            if not return_exceptions:
+                raise
+            return {"url": url, "summary": None, "usage": None, "error": str(e)}
+
         summary = extract_choice_text(data)
-        results.append({
+        if key is not None and summary:
+            _cache_summary(key, summary, opts.cache_ttl)
+        result: dict[str, Any] = {
             "url": url,
             "summary": summary,
-            "raw": data,
-        })
-    return results
+            "usage": data.get("usage") if isinstance(data, dict) else None,
+        }
+        # Full responses are large and rarely needed; drop them unless asked
+        if opts.return_raw:
+            result["raw"] = data
+        return result
 
+    session = session or await get_session()
+    return list(await asyncio.gather(
+        *(summarize_one(session, url, content) for url, content in texts)
+    ))
@@ -0,0 +1,49 @@
+"""
+Worker process pools for CPU-bound work.
+
+The plugin runs inside AstrBot's multi-threaded asyncio process. Forking
+it copies locks that other threads may hold at that moment, which can
+deadlock a child, so workers are started with forkserver where the
+platform supports it and spawn otherwise.
+"""
+from __future__ import annotations
+
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+
+def new_process_pool(max_workers: int | None = None) -> ProcessPoolExecutor:
+    """
+    Create a process pool whose workers do not fork the running process.
+
+    Functions and arguments sent to the pool must be picklable and
+    importable by module name, since workers start from a fresh interpreter.
+
+    Args:
+        max_workers: Maximum number of worker processes (defaults to CPU count)
+
+    Returns:
+        New process pool
+    """
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context(method))
+
+
+def kill_workers(pool: ProcessPoolExecutor) -> None:
+    """
+    Shut down a pool and kill its worker processes, including hung ones.
+
+    Args:
+        pool: Process pool to stop
+    """
+    # ProcessPoolExecutor has no public way to stop a worker stuck in a task
+    workers = list((getattr(pool, "_processes", None) or {}).values())
+    pool.shutdown(wait=False, cancel_futures=True)
+    for process in workers:
+        try:
+            process.kill()
+        except Exception as e:
+            logger.debug("Failed to kill worker process %s: %s", process.pid, e)
@@ -5,16 +5,21 @@ Docs: https://docs.tavily.com/documentation/api-reference/endpoint/extract
 """
 from __future__ import annotations
 
+import asyncio
 import re
+from collections.abc import Iterator
 from dataclasses import dataclass
 from typing import Any
 
 import aiohttp
 
+from utils.http_session import get_session, read_json
+from utils.json_utils import json_dumps
+
 TAVILY_EXTRACT_URL = "https://api.tavily.com/extract"
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class TavilyOptions:
     """Options for Tavily Extract API."""
     api_key: str
@@ -23,6 +28,32 @@ class TavilyOptions:
     include_images: bool = False
     include_favicon: bool = False
     timeout: float | None = None  # seconds (1-60) or None
+    chunk_size: int = 20  # URLs per request; larger lists are split
+    max_concurrency: int = 5  # chunk requests in flight at once
+
+
+# Basic URL regex
+_URL_RE = re.compile(r"https?://[\w\-._~:/?#\[\]@!$&'()*+,;=%]+", re.IGNORECASE)
+
+
+def iter_urls(text: str) -> Iterator[str]:
+    """
+    Find http(s) URLs in free text, lazily.
+    
+    Args:
+        text: Text to search for URLs
+        
+    Yields:
+        Unique URLs in the order they appear
+    """
+    if not text:
+        return
+    seen: set[str] = set()
+    for match in _URL_RE.finditer(text):
+        u = match.group(0)
+        if u not in seen:
+            seen.add(u)
+            yield u
 
 
 def extract_urls(text: str) -> list[str]:
@@ -37,23 +68,18 @@ def extract_urls(text: str) -> list[str]:
     """
     if not text:
         return []
-    # Basic URL regex
-    pattern = re.compile(r"https?://[\w\-._~:/?#\[\]@!$&'()*+,;=%]+", re.IGNORECASE)
-    urls = pattern.findall(text)
-    # Dedup while preserving order
-    seen: set[str] = set()
-    result: list[str] = []
-    for u in urls:
-        if u not in seen:
-            seen.add(u)
-            result.append(u)
-    return result
+    # Scanning in C and deduplicating with an insertion-ordered dict beats
+    # the lazy iter_urls when every URL is wanted
+    return list(dict.fromkeys(_URL_RE.findall(text)))
 
 
 async def tavily_extract(urls: list[str], opts: TavilyOptions) -> dict[str, Any]:
     """
     Extract content from URLs using Tavily API.
     
+    Lists longer than opts.chunk_size are split into several requests that
+    run concurrently; their results are merged in URL order.
+    
     Args:
         urls: List of URLs to extract content from
         opts: Tavily API options
@@ -67,6 +93,28 @@ async def tavily_extract(urls: list[str], opts: TavilyOptions) -> dict[str, Any]
     if not urls:
         return {"results": [], "failed_results": []}
 
+    chunk_size = max(1, opts.chunk_size)
+    if len(urls) <= chunk_size:
+        return await _post_extract(urls, opts)
+
+    semaphore = asyncio.Semaphore(max(1, opts.max_concurrency))
+
+    async def extract_chunk(chunk: list[str]) -> dict[str, Any]:
+        async with semaphore:
+            return await _post_extract(chunk, opts)
+
+    # gather keeps chunk order, so merged results follow the URL order
+    responses = await asyncio.gather(
+        *(extract_chunk(urls[i:i + chunk_size]) for i in range(0, len(urls), chunk_size))
+    )
+    merged = dict(responses[0])
+    merged["results"] = [r for data in responses for r in data.get("results") or []]
+    merged["failed_results"] = [r for data in responses for r in data.get("failed_results") or []]
+    return merged
+
+
+async def _post_extract(urls: list[str], opts: TavilyOptions) -> dict[str, Any]:
+    """Send one extract request for a list of URLs."""
     headers = {
         "Authorization": f"Bearer {opts.api_key}",
         "Content-Type": "application/json",
@@ -83,15 +131,16 @@ async def tavily_extract(urls: list[str], opts: TavilyOptions) -> dict[str, Any]
     if opts.timeout is not None:
         payload["timeout"] = float(opts.timeout)
 
-    async with aiohttp.ClientSession(
-        timeout=aiohttp.ClientTimeout(total=(opts.timeout or 30.0)),
+    session = await get_session()
+    async with session.post(
+        TAVILY_EXTRACT_URL,
+        data=json_dumps(payload),
         headers=headers,
-    ) as session:
-        async with session.post(TAVILY_EXTRACT_URL, json=payload) as resp:
-            # Treat 4xx/5xx as errors
-            resp.raise_for_status()
-            data = await resp.json(content_type=None)
-            if not isinstance(data, dict):
-                raise RuntimeError("Unexpected Tavily extract response format")
-            return data
-
+        timeout=aiohttp.ClientTimeout(total=(opts.timeout or 30.0)),
+    ) as resp:
+        # Treat 4xx/5xx as errors
+        resp.raise_for_status()
+        data = await read_json(resp)
+        if not isinstance(data, dict):
+            raise RuntimeError("Unexpected Tavily extract response format")
+        return data